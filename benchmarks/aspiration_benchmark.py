@@ -0,0 +1,66 @@
+"""
+Benchmark das janelas de aspiração: nós por get_move ao longo de uma partida, com aprofundamento
+iterativo até uma profundidade fixa, com e sem janelas de aspiração.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.aspiration_benchmark
+"""
+import random
+import time
+
+from packs.ComputerPlayer import *
+from packs.Game import *
+
+# Tamanhos medidos: (rótulo, (linhas, colunas, k), profundidade máxima do aprofundamento iterativo)
+SIZES = [
+    ('4x4', (4, 4, 4), 5),
+    ('5x5 k=4', (5, 5, 4), 4),
+]
+
+# Configurações comparadas: (rótulo, motor de busca, larguras das janelas de aspiração)
+CONFIGS = [
+    ('minimax', 'minimax', None),
+    ('minimax + asp.', 'minimax', (5, 20)),
+    ('pvs', 'pvs', None),
+    ('pvs + asp.', 'pvs', (5, 20)),
+]
+
+
+def play(size, depth, engine, aspiration, plies=8, seed=0):
+    """
+    Joga uma partida em que X faz jogadas aleatórias (sempre as mesmas para a semente) e O busca
+    com aprofundamento iterativo até `depth`, acumulando os contadores de cada get_move de O.
+
+    Returns:
+        tuple: (jogadas de O, nós, falhas altas, falhas baixas, segundos).
+    """
+    rows, cols, k = size
+    rng = random.Random(seed)
+    game = Game('0', rows, cols, k)
+    computer = ComputerPlayer('O', difficulty='hard', engine=engine, aspiration=aspiration, perfect_play=False)
+    moves = nodes = fail_highs = fail_lows = 0
+    elapsed = 0.0
+    for ply in range(plies):
+        if game.current_winner or not game.empty_squares():
+            break
+        if ply % 2 == 0:
+            game.make_move(rng.choice(game.available_moves()), 'X')
+            continue
+        start = time.perf_counter()
+        computer.new_search(game)
+        move = computer.iterative_deepening(game, max_depth=depth)['position']
+        elapsed += time.perf_counter() - start
+        game.make_move(move, 'O')
+        moves += 1
+        nodes += computer.nodes
+        fail_highs += computer.fail_highs
+        fail_lows += computer.fail_lows
+    return moves, nodes, fail_highs, fail_lows, elapsed
+
+
+if __name__ == "__main__":
+    print(f"{'tabuleiro':<10} {'configuração':<16} {'nós/jogada':>11} {'falha alta':>11} {'falha baixa':>12} {'tempo (s)':>10}")
+    for label, size, depth in SIZES:
+        for name, engine, aspiration in CONFIGS:
+            moves, nodes, fail_highs, fail_lows, elapsed = play(size, depth, engine, aspiration)
+            print(f"{label:<10} {name:<16} {nodes / moves:>11.0f} {fail_highs:>11} {fail_lows:>12} {elapsed:>10.3f}")
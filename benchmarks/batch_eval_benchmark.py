@@ -0,0 +1,108 @@
+"""
+Benchmark da avaliação em lote com NumPy (BatchEvaluator) contra a avaliação escalar
+(ComputerPlayer.heuristic_state): tabuleiros avaliados por segundo num lote grande, nas folhas de um
+nó com pelo menos BATCH_MIN_MOVES jogadas (os que o minimax avalia em lote no último nível) e o tempo da
+busca 'medium' (profundidade 2) com e sem `batch_eval`. Abaixo de BATCH_MIN_MOVES o minimax não usa o lote,
+então nos tabuleiros pequenos as duas buscas são a mesma.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.batch_eval_benchmark
+"""
+import math
+import time
+
+from benchmarks.common import *
+from packs.BatchEvaluator import *
+from packs.ComputerPlayer import *
+
+SIZES = [('3x3', (3, 3, 3)), ('5x5 k=4', (5, 5, 4)), ('7x7 k=5', (7, 7, 5)), ('9x9 k=5', (9, 9, 5))]
+POSITIONS = 60  # Posições aleatórias por tamanho
+BATCH = 100000  # Tabuleiros do lote grande
+REPEATS = 5  # Repetições das buscas, alternando escalar e lote; vale o menor tempo de cada
+
+
+def scalar_children(positions):
+    """
+    Avalia as folhas de cada posição como o minimax escalar: faz a jogada, avalia e desfaz.
+
+    Returns:
+        tuple: (tabuleiros avaliados, segundos).
+    """
+    count = 0
+    start = time.perf_counter()
+    for game, letter in positions:
+        player = ComputerPlayer(letter, perfect_play=False)
+        for move in game.available_moves():
+            with game.push(move, letter):
+                player.heuristic_state(game)
+            count += 1
+    return count, time.perf_counter() - start
+
+
+def batch_children(positions):
+    """
+    Avalia as folhas de cada posição com uma chamada ao avaliador em lote por posição.
+
+    Returns:
+        tuple: (tabuleiros avaliados, segundos).
+    """
+    count = 0
+    start = time.perf_counter()
+    for game, letter in positions:
+        evaluator = batch_evaluator(game.rows, game.cols, game.k)
+        moves = game.available_moves()
+        evaluator.evaluate_children(evaluator.encode(game), moves, letter, letter)
+        count += len(moves)
+    return count, time.perf_counter() - start
+
+
+def big_batch(size):
+    """
+    Avalia um único lote grande de tabuleiros aleatórios (não necessariamente alcançáveis).
+
+    Returns:
+        tuple: (tabuleiros avaliados, segundos).
+    """
+    rows, cols, k = size
+    boards = np.random.default_rng(0).integers(-1, 2, size=(BATCH, rows * cols), dtype=np.int8)
+    evaluator = batch_evaluator(rows, cols, k)
+    start = time.perf_counter()
+    evaluator.evaluate(boards, 'X')
+    return BATCH, time.perf_counter() - start
+
+
+def medium_search(positions, batch_eval):
+    """
+    Busca todas as posições com profundidade 2.
+
+    Returns:
+        tuple: (nós, segundos).
+    """
+    nodes = 0
+    start = time.perf_counter()
+    for game, letter in positions:
+        player = ComputerPlayer(letter, difficulty='medium', perfect_play=False, batch_eval=batch_eval)
+        player.new_search(game)
+        player.search(game, depth=2)
+        nodes += player.nodes
+    return nodes, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'tabuleiro':<10} {'medida':<24} {'escalar':>12} {'lote':>12} {'ganho':>7}")
+    for label, size in SIZES:
+        # Posições até um terço do tabuleiro preenchido, a fase da partida em que os nós têm mais jogadas
+        positions = random_positions(size, range(size[0] * size[1] // 3 + 1), POSITIONS)
+        wide = [(game, letter) for game, letter in positions if len(game.available_moves()) >= BATCH_MIN_MOVES]
+        if wide:
+            count, scalar = scalar_children(wide)
+            _, batch = batch_children(wide)
+            print(f"{label:<10} {'folhas por nó (tab./s)':<24} {count / scalar:>12.0f} {count / batch:>12.0f} "
+                  f"{scalar / batch:>7.2f}")
+        count, elapsed = big_batch(size)
+        print(f"{label:<10} {'lote de 100 mil (tab./s)':<24} {'-':>12} {count / elapsed:>12.0f} {'':>7}")
+        scalar = batch = math.inf
+        for _ in range(REPEATS):
+            scalar = min(scalar, medium_search(positions, False)[1])
+            batch = min(batch, medium_search(positions, True)[1])
+        print(f"{label:<10} {'busca medium (s)':<24} {scalar:>12.3f} {batch:>12.3f} {scalar / batch:>7.2f}")
@@ -0,0 +1,82 @@
+"""
+Benchmark de nós por segundo do minimax usando o tabuleiro em lista (Game)
+e o tabuleiro em bitboards (BitboardGame).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bitboard_benchmark
+"""
+import time
+
+from benchmarks.common import *
+from packs.BitboardGame import *
+from packs.ComputerPlayer import *
+from packs.Game import *
+
+# Posições de teste: sequências de jogadas alternadas a partir de X.
+POSITIONS = [
+    [4],
+    [0],
+    [1],
+    [0, 4],
+    [4, 0, 8],
+    [0, 8, 4, 2],
+]
+
+
+def bench_search(game_class, repeat=3):
+    """
+    Executa o minimax completo em todas as posições de teste. A tabela de transposição e a simetria
+    ficam desativadas para medir apenas a representação do tabuleiro.
+
+    Args:
+        game_class (type): Game ou BitboardGame.
+        repeat (int): Quantas vezes repetir o conjunto de posições.
+
+    Returns:
+        tuple: (nós visitados, segundos gastos).
+    """
+    nodes = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for moves in POSITIONS:
+            game, letter = build_game((3, 3, 3), moves, game_class)
+            player = ComputerPlayer(letter, tt_size=0, symmetry=False)
+            player.minimax(game, player.letter)
+            nodes += player.nodes
+    return nodes, time.perf_counter() - start
+
+
+def bench_primitives(game_class, repeat=20000):
+    """
+    Mede as operações básicas (make_move, winner, available_moves) jogando partidas fixas.
+
+    Args:
+        game_class (type): Game ou BitboardGame.
+        repeat (int): Número de partidas jogadas.
+
+    Returns:
+        tuple: (operações, segundos gastos).
+    """
+    moves = [4, 0, 8, 2, 1, 7, 6, 3, 5]
+    ops = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        game = game_class('0')
+        for i, move in enumerate(moves):
+            game.available_moves()
+            game.make_move(move, 'X' if i % 2 == 0 else 'O')
+            ops += 2
+            if game.current_winner:
+                break
+    return ops, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    for name, bench in [('minimax', bench_search), ('primitivas', bench_primitives)]:
+        print(f"== {name} ==")
+        baseline = None
+        for game_class in (Game, BitboardGame):
+            count, elapsed = bench(game_class)
+            rate = count / elapsed
+            baseline = baseline or rate
+            print(f"{game_class.__name__:<14} {count:>10} ops  {elapsed:8.3f} s  {rate:12.0f} ops/s  {rate / baseline:5.2f}x")
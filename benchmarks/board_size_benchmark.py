@@ -0,0 +1,68 @@
+"""
+Benchmark da latência por jogada à medida que o tabuleiro cresce (m x n com k em linha).
+
+Mede o custo de make_move/undo_move (detecção de vitória só pelas linhas da casa jogada)
+e o tempo de get_move do ComputerPlayer nas dificuldades 'easy' e 'medium'.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.board_size_benchmark
+"""
+import random
+import time
+
+from benchmarks.common import *
+from packs.ComputerPlayer import *
+from packs.Game import *
+
+# Tamanhos medidos: (linhas, colunas, peças em linha para vencer)
+SIZES = [(3, 3, 3), (4, 4, 4), (5, 5, 4), (7, 7, 5), (10, 10, 5)]
+
+
+
+def bench_make_move(rows, cols, k, games=300, seed=0):
+    """
+    Mede a latência média de make_move seguido de undo_move em partidas aleatórias.
+
+    Returns:
+        float: Microssegundos por par make_move/undo_move.
+    """
+    rng = random.Random(seed)
+    count = 0
+    elapsed = 0.0
+    for _ in range(games):
+        game = Game('0', rows, cols, k)
+        player = 'X'
+        while game.empty_squares() and not game.current_winner:
+            move = rng.choice(game.available_moves())
+            start = time.perf_counter()
+            game.make_move(move, player)
+            game.undo_move()
+            elapsed += time.perf_counter() - start
+            count += 1
+            game.make_move(move, player)
+            player = 'O' if player == 'X' else 'X'
+    return elapsed / count * 1e6
+
+
+def bench_get_move(rows, cols, k, difficulty, positions=5, seed=0):
+    """
+    Mede a latência média de get_move em posições aleatórias do meio da partida.
+
+    Returns:
+        float: Milissegundos por jogada.
+    """
+    elapsed = 0.0
+    for game, player in random_positions((rows, cols, k), rows * cols // 3, positions, seed):
+        computer = ComputerPlayer(player, difficulty=difficulty)
+        start = time.perf_counter()
+        computer.get_move(game)
+        elapsed += time.perf_counter() - start
+    return elapsed / positions * 1e3
+
+
+if __name__ == "__main__":
+    print(f"{'tabuleiro':<12} {'make+undo (us)':>15} {'easy (ms)':>10} {'medium (ms)':>12}")
+    for rows, cols, k in SIZES:
+        label = f"{rows}x{cols} k={k}"
+        print(f"{label:<12} {bench_make_move(rows, cols, k):15.2f} "
+              f"{bench_get_move(rows, cols, k, 'easy'):10.3f} {bench_get_move(rows, cols, k, 'medium'):12.2f}")
@@ -0,0 +1,106 @@
+"""
+Benchmark dos orçamentos rígidos de busca: para cada orçamento de tempo ou de nós, a latência média e
+máxima por jogada, o maior número de nós visitados, a fração de jogadas parciais (busca interrompida)
+e a profundidade média concluída, em posições aleatórias de 4x4 e 5x5. Antes, verifica que a busca
+paralela na raiz e o Lazy SMP respeitam o orçamento de nós somando os nós de todos os processos ou threads,
+e que uma iteração interrompida com janelas de aspiração só troca a jogada por outra de valor comprovado.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.budget_benchmark
+"""
+import time
+
+from benchmarks.common import *
+from packs.ComputerPlayer import *
+
+SIZES = [('4x4', (4, 4, 4)), ('5x5 k=4', (5, 5, 4))]
+BUDGETS = [
+    ('tempo 0.02 s', {'time_budget': 0.02}),
+    ('tempo 0.1 s', {'time_budget': 0.1}),
+    ('nós 1000', {'node_budget': 1000}),
+    ('nós 20000', {'node_budget': 20000}),
+]
+POSITIONS = 20  # Posições por tamanho
+SHARED_BUDGETS = [1, 300, 1000]  # Orçamentos de nós verificados com a busca dividida entre processos ou threads
+SHARED_OPTIONS = [{'workers': 2}, {'threads': 3}]
+ASPIRATION_BUDGETS = range(50, 2000, 50)  # Orçamentos de nós verificados com janelas de aspiração
+
+
+def run(positions, budget):
+    """
+    Escolhe a jogada de cada posição com o orçamento dado.
+
+    Returns:
+        tuple: (latências em segundos, nós por jogada, jogadas parciais, profundidades concluídas).
+    """
+    latencies, nodes, depths = [], [], []
+    partial = 0
+    for game in positions:
+        player = ComputerPlayer('X', perfect_play=False, tactics=False, **budget)
+        start = time.perf_counter()
+        player.get_move(game)
+        latencies.append(time.perf_counter() - start)
+        nodes.append(player.nodes)
+        depths.append(player.completed_depth)
+        partial += player.partial
+    return latencies, nodes, partial, depths
+
+
+def check_shared_budgets(positions):
+    """
+    Verifica que a soma dos nós de todos os processos ou threads da busca não passa do orçamento.
+
+    Raises:
+        AssertionError: Se alguma jogada visitou mais nós que o orçamento.
+    """
+    for options in SHARED_OPTIONS:
+        for node_budget in SHARED_BUDGETS:
+            for game in positions:
+                player = ComputerPlayer('X', perfect_play=False, tactics=False, node_budget=node_budget, **options)
+                try:
+                    player.get_move(game)
+                finally:
+                    player.close()
+                assert player.nodes <= node_budget, f"{player.nodes} nós com {options} e orçamento {node_budget}"
+
+
+def check_aspiration_partial(positions):
+    """
+    Verifica que, com janelas de aspiração, a jogada de uma iteração interrompida só substitui a da
+    última iteração concluída se o seu valor exato nessa profundidade for pelo menos o da jogada
+    substituída. A ordenação fica desativada para que a jogada anterior não seja sempre a primeira.
+
+    Raises:
+        AssertionError: Se a jogada escolhida for pior que a da iteração anterior.
+    """
+    options = {'perfect_play': False, 'tactics': False, 'move_ordering': False, 'aspiration': (1, 3)}
+    for game in positions:
+        for node_budget in ASPIRATION_BUDGETS:
+            player = ComputerPlayer('X', node_budget=node_budget, **options)
+            player.new_search(game)
+            result = player.iterative_deepening(game)
+            depth = player.completed_depth
+            if not result['partial'] or not depth:
+                continue
+            # Sem orçamento, as iterações até `depth` são as mesmas, e dão a jogada da iteração anterior
+            previous = ComputerPlayer('X', **options)
+            previous.new_search(game)
+            move = previous.iterative_deepening(game, max_depth=depth)['position']
+            if move != result['position']:
+                judge = ComputerPlayer('X', perfect_play=False)
+                assert (judge.search_move(game, result['position'], depth + 1)
+                        >= judge.search_move(game, move, depth + 1)), f"orçamento {node_budget}: {result}"
+
+
+if __name__ == "__main__":
+    print(f"{'tabuleiro':<10} {'orçamento':<14} {'ms médio':>9} {'ms máx.':>8} {'nós máx.':>9} "
+          f"{'parciais':>9} {'prof.':>6}")
+    for label, size in SIZES:
+        positions = [game for game, _ in random_positions(size, (2, 4), POSITIONS)]
+        check_shared_budgets(positions[:4])
+        check_aspiration_partial(positions[:4])
+        for name, budget in BUDGETS:
+            latencies, nodes, partial, depths = run(positions, budget)
+            print(f"{label:<10} {name:<14} {1000 * sum(latencies) / len(latencies):>9.1f} "
+                  f"{1000 * max(latencies):>8.1f} {max(nodes):>9} {partial:>4}/{len(positions):<4} "
+                  f"{sum(depths) / len(depths):>6.1f}")
@@ -0,0 +1,55 @@
+"""
+Posições de teste compartilhadas pelos benchmarks: jogos montados a partir de uma sequência de jogadas e
+posições aleatórias reproduzíveis.
+"""
+import random
+
+from packs.Game import *
+
+
+def build_game(size, moves, game_class=Game):
+    """
+    Cria o jogo do tamanho informado e aplica as jogadas alternadas a partir de X.
+
+    Args:
+        size (tuple): (linhas, colunas, k).
+        moves (list): Jogadas alternadas começando por X.
+        game_class (type, opcional): Game ou BitboardGame. Default é Game.
+
+    Returns:
+        tuple: (o jogo, o jogador da vez).
+    """
+    rows, cols, k = size
+    game = game_class('0', rows, cols, k)
+    for i, move in enumerate(moves):
+        game.make_move(move, 'X' if i % 2 == 0 else 'O')
+    return game, 'X' if len(moves) % 2 == 0 else 'O'
+
+
+def random_positions(size, pieces, count, seed=0, accept=None):
+    """
+    Gera posições aleatórias reproduzíveis, sem vencedor e com casas vazias, com jogadas alternadas a
+    partir de X.
+
+    Args:
+        size (tuple): (linhas, colunas, k).
+        pieces (int ou sequence): Número de peças de cada posição, ou os números entre os quais ele é sorteado.
+        count (int): Número de posições.
+        seed (int, opcional): Semente do sorteio. Default é 0.
+        accept (callable, opcional): Filtro adicional das posições, chamado com o jogo. Default é None.
+
+    Returns:
+        list: Pares (jogo, jogador da vez).
+    """
+    rows, cols, k = size
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        game = Game('0', rows, cols, k)
+        letter = 'X'
+        for _ in range(pieces if isinstance(pieces, int) else rng.choice(pieces)):
+            game.make_move(rng.choice(game.available_moves()), letter)
+            letter = 'O' if letter == 'X' else 'X'
+        if not game.current_winner and game.empty_squares() and (accept is None or accept(game)):
+            positions.append((game, letter))
+    return positions
@@ -0,0 +1,60 @@
+"""
+Benchmark da detecção de empate certo (linhas mortas): nós visitados e tempo da busca completa ('hard')
+em posições aleatórias de meio de jogo, com e sem `draw_detection`, e quantos nós foram pontuados como
+empate sem busca.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.dead_draw_benchmark
+"""
+import time
+
+from benchmarks.common import *
+from packs.ComputerPlayer import *
+
+# Configurações: (rótulo, (linhas, colunas, k), peças já jogadas em cada posição)
+CONFIGS = [
+    ('3x3', (3, 3, 3), 2),
+    ('4x4', (4, 4, 4), 6),
+    ('5x5 k=4', (5, 5, 4), 14),
+]
+POSITIONS = 20  # Posições por configuração
+
+
+def no_threats(game):
+    """
+    Indica se nenhum dos jogadores tem vitória imediata, para que a busca não termine logo na primeira jogada.
+
+    Returns:
+        bool: True se nenhuma casa dá a vitória a X ou a O.
+    """
+    return not game.winning_squares('X') and not game.winning_squares('O')
+
+
+def run(positions, draw_detection):
+    """
+    Busca todas as posições até o fim da partida.
+
+    Returns:
+        tuple: (scores, nós, nós pontuados como empate certo, segundos).
+    """
+    scores = []
+    nodes = dead_draws = 0
+    start = time.perf_counter()
+    for game in positions:
+        player = ComputerPlayer('X', perfect_play=False, draw_detection=draw_detection)
+        player.new_search(game)
+        scores.append(player.search(game)['score'])
+        nodes += player.nodes
+        dead_draws += player.dead_draws
+    return scores, nodes, dead_draws, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'tabuleiro':<10} {'nós sem':>10} {'nós com':>10} {'empates':>9} {'s sem':>8} {'s com':>8} {'ganho':>6}")
+    for label, size, pieces in CONFIGS:
+        positions = [game for game, _ in random_positions(size, pieces, POSITIONS, accept=no_threats)]
+        off_scores, off_nodes, _, off_time = run(positions, False)
+        on_scores, on_nodes, dead_draws, on_time = run(positions, True)
+        assert on_scores == off_scores, "a detecção de empate mudou o valor de alguma posição"
+        print(f"{label:<10} {off_nodes:>10} {on_nodes:>10} {dead_draws:>9} {off_time:>8.2f} {on_time:>8.2f} "
+              f"{off_time / on_time:>6.2f}")
@@ -0,0 +1,127 @@
+"""
+Benchmark do núcleo de busca sem alocações (SearchKernel, engine='kernel') contra o minimax com a mesma
+árvore (sem tabela de transposição, ordenação nem simetria): nós, tempo, nós por segundo e os blocos de
+memória alocados por nó.
+
+As alocações são contadas com o tracemalloc numa janela fixa de nós no meio da busca: o jogador tira um
+snapshot na entrada de cada nó da janela, e a diferença entre dois snapshots seguidos, linha a linha do
+código em packs/, dá os blocos criados entre um nó e o seguinte que ainda estão vivos (somando só as
+linhas que cresceram, para que os blocos liberados de outro nó não os compensem). O minimax aloca a cada
+nó a lista de jogadas, os dicionários de resultado e os inteiros do contador; o núcleo só escreve em
+buffers pré-alocados.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.kernel_benchmark
+"""
+import math
+import time
+import tracemalloc
+
+from benchmarks.common import *
+from packs.ComputerPlayer import *
+
+# Configurações: (rótulo, (linhas, colunas, k), peças já jogadas, profundidade)
+CONFIGS = [
+    ('3x3', (3, 3, 3), 0, math.inf),
+    ('4x4 prof. 5', (4, 4, 4), 2, 5),
+    ('5x5 k=4 prof. 4', (5, 5, 4), 2, 4),
+]
+POSITIONS = 5  # Posições por configuração
+SAMPLE_START = 1000  # Nó da busca em que começa a janela de contagem das alocações
+SAMPLE_NODES = 200  # Nós contados por busca
+SEARCH_FILES = [tracemalloc.Filter(True, '*/packs/*')]  # Só os blocos alocados pelo código da busca
+
+
+class AllocationCounter(ComputerPlayer):
+    """
+    Jogador sem orçamento que usa a verificação do orçamento (check_budget) para tirar um snapshot do
+    tracemalloc na entrada de cada nó da janela de contagem.
+
+    Atributos:
+        blocks (int): Blocos alocados e ainda vivos somados sobre os passos de um nó ao seguinte.
+        steps (int): Passos de um nó ao seguinte contados.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Inicializa o jogador com os argumentos do ComputerPlayer e os contadores zerados.
+        """
+        super().__init__(*args, **kwargs)
+        self.snapshot = None
+        self.blocks = 0
+        self.steps = 0
+
+    def check_budget(self):
+        """
+        Tira o snapshot do nó atual, se ele estiver na janela de contagem, e soma os blocos alocados desde
+        o nó anterior.
+        """
+        if self.nodes < SAMPLE_START:
+            self.next_check = SAMPLE_START
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces(SEARCH_FILES)
+        if self.snapshot is not None:
+            self.blocks += sum(max(diff.count_diff, 0) for diff in snapshot.compare_to(self.snapshot, 'lineno'))
+            self.steps += 1
+        self.snapshot = snapshot
+        # O núcleo soma os seus nós a player.nodes ao alcançar next_check, então também para a cada nó
+        self.next_check = self.nodes + 1 if self.steps < SAMPLE_NODES else math.inf
+
+
+def run(positions, depth, engine):
+    """
+    Busca todas as posições com o algoritmo dado.
+
+    Returns:
+        tuple: (resultados, nós, segundos).
+    """
+    results, nodes = [], 0
+    elapsed = 0.0
+    for game in positions:
+        player = ComputerPlayer('X', perfect_play=False, tt_size=0, symmetry=False, move_ordering=False,
+                                engine=engine)
+        player.new_search(game)
+        start = time.perf_counter()
+        result = player.search_window(game, depth)
+        elapsed += time.perf_counter() - start
+        results.append((result['score'], result['position']))
+        nodes += player.nodes
+    return results, nodes, elapsed
+
+
+def count_allocations(positions, depth, engine):
+    """
+    Conta os blocos alocados por nó na janela de contagem de cada busca.
+
+    Returns:
+        float: Média de blocos alocados por nó.
+    """
+    blocks = steps = 0
+    for game in positions:
+        player = AllocationCounter('X', perfect_play=False, tt_size=0, symmetry=False, move_ordering=False,
+                                   engine=engine)
+        player.new_search(game)
+        if engine == 'kernel':
+            player.search_kernel(game)  # Os buffers são criados uma vez, fora da contagem
+        tracemalloc.start()
+        try:
+            player.search_window(game, depth)
+        finally:
+            tracemalloc.stop()
+        blocks += player.blocks
+        steps += player.steps
+    return blocks / steps if steps else 0.0
+
+
+if __name__ == "__main__":
+    print(f"{'configuração':<17} {'algoritmo':<9} {'nós':>9} {'s':>7} {'nós/s':>9} {'blocos/nó':>10}")
+    for label, size, pieces, depth in CONFIGS:
+        positions = [game for game, _ in random_positions(size, pieces, POSITIONS)]
+        reference = None
+        for engine in ('minimax', 'kernel'):
+            results, nodes, elapsed = run(positions, depth, engine)
+            if reference is None:
+                reference = (results, nodes)
+            assert (results, nodes) == reference, "o núcleo deu um resultado ou número de nós diferente"
+            blocks = count_allocations(positions, depth, engine)
+            print(f"{label:<17} {engine:<9} {nodes:>9} {elapsed:>7.2f} {nodes / elapsed:>9.0f} {blocks:>10.2f}")
@@ -0,0 +1,60 @@
+"""
+Benchmark do Lazy SMP (LazySMPSearch): tempo até concluir o aprofundamento iterativo numa profundidade
+fixa com 1 a N threads, e o speedup efetivo em relação ao minimax em uma única thread. A coluna
+"principal" mostra os nós da thread principal, que diminuem quando as auxiliares adiantam o trabalho
+pela tabela de transposição compartilhada.
+
+Em builds do Python com GIL as threads não executam o minimax ao mesmo tempo, então o speedup
+esperado só aparece em builds sem GIL (free-threaded).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.lazy_smp_benchmark [N]
+
+N é o número máximo de threads (padrão: 4).
+"""
+import sys
+import time
+
+from benchmarks.common import *
+from packs.ComputerPlayer import *
+
+# Conjuntos de posições: (rótulo, (linhas, colunas, k), profundidade, jogadas alternadas a partir de X)
+SUITES = [
+    ('4x4 prof. 7', (4, 4, 4), 7, [[5], [0], [5, 10], [0, 5, 15]]),
+    ('5x5 k=4 prof. 5', (5, 5, 4), 5, [[12], [0], [12, 6], [12, 6, 18]]),
+]
+
+
+def run_suite(size, depth, positions, threads):
+    """
+    Busca todas as posições do conjunto com um jogador novo por posição.
+
+    Returns:
+        tuple: (scores encontrados, nós de todas as threads, nós da thread principal, segundos).
+    """
+    scores = []
+    nodes = main_nodes = 0
+    start = time.perf_counter()
+    for moves in positions:
+        game, letter = build_game(size, moves)
+        player = ComputerPlayer(letter, perfect_play=False, threads=threads)
+        player.new_search(game)
+        scores.append(player.iterative_deepening(game, max_depth=depth)['score'])
+        nodes += player.nodes
+        main_nodes += player.smp.thread_nodes[0] if player.smp is not None else player.nodes
+    return scores, nodes, main_nodes, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    gil = sys._is_gil_enabled() if hasattr(sys, '_is_gil_enabled') else True
+    print(f"GIL {'ativo' if gil else 'desativado'}")
+    print(f"{'conjunto':<16} {'threads':>7} {'nós':>9} {'principal':>10} {'tempo (s)':>10} {'speedup':>8}")
+    for label, size, depth, positions in SUITES:
+        reference = None
+        for threads in range(1, max_threads + 1):
+            scores, nodes, main_nodes, elapsed = run_suite(size, depth, positions, threads)
+            if reference is None:
+                reference = (scores, elapsed)
+            assert scores == reference[0], f"{threads} threads divergiram do minimax em {label}"
+            print(f"{label:<16} {threads:>7} {nodes:>9} {main_nodes:>10} {elapsed:>10.3f} {reference[1] / elapsed:>8.2f}")
@@ -0,0 +1,60 @@
+"""
+Benchmark do MCTS paralelo (MCTSPlayer com `workers`): simulações por segundo com 1 a N processos
+nos modos 'root' (árvores independentes) e 'tree' (uma árvore com perda virtual e simulações em lote),
+numa posição 5x5 com 4 em linha. Com a mesma semente, cada configuração é executada duas vezes e
+deve escolher a mesma jogada.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.mcts_parallel_benchmark [N]
+
+N é o número máximo de processos (padrão: o número de CPUs, no mínimo 2).
+"""
+import os
+import sys
+import time
+
+from benchmarks.common import *
+from packs.MCTSPlayer import *
+
+ITERATIONS = 4000  # Simulações por jogada
+SEED = 2024
+POSITION = ((5, 5, 4), [12, 6, 18])  # (tamanho, jogadas alternadas a partir de X)
+
+
+def run(workers, parallel):
+    """
+    Faz uma jogada com um jogador novo; o pool de processos é iniciado antes de medir o tempo.
+
+    Returns:
+        tuple: (jogada escolhida, simulações feitas, segundos).
+    """
+    game, letter = build_game(*POSITION)
+    player = MCTSPlayer(letter, iterations=ITERATIONS, seed=SEED, workers=workers, parallel=parallel)
+    try:
+        player.start()
+        if player.executor is not None:
+            player.executor.submit(int).result()
+        start = time.perf_counter()
+        move = player.get_move(game)
+        return move, player.iterations_done, time.perf_counter() - start
+    finally:
+        player.close()
+
+
+if __name__ == "__main__":
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else max(os.cpu_count() or 1, 2)
+    print(f"CPUs disponíveis: {os.cpu_count()}")
+    print(f"{'modo':<6} {'processos':>9} {'jogada':>7} {'simulações':>11} {'tempo (s)':>10} {'simul./s':>10} {'speedup':>8}")
+    serial = None
+    for parallel in PARALLEL_MODES:
+        for workers in range(1, max_workers + 1):
+            if workers == 1 and serial is not None:
+                move, done, elapsed = serial
+            else:
+                move, done, elapsed = run(workers, parallel)
+                again = run(workers, parallel)[0]
+                assert move == again, f"modo {parallel} com {workers} processos não é reproduzível: {move} != {again}"
+                if workers == 1:
+                    serial = (move, done, elapsed)
+            rate = done / elapsed
+            print(f"{parallel:<6} {workers:>9} {move:>7} {done:>11} {elapsed:>10.3f} {rate:>10.0f} {rate / (serial[1] / serial[2]):>8.2f}")
@@ -0,0 +1,48 @@
+"""
+Benchmark do efeito da ordenação de jogadas no minimax: nós visitados, tempo e taxa de cortes
+na primeira jogada, com a ordenação ativada e desativada.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.move_ordering_benchmark
+"""
+import math
+import time
+
+from benchmarks.common import *
+from packs.ComputerPlayer import *
+
+# Conjuntos de posições: (rótulo, (linhas, colunas, k), profundidade, jogadas alternadas a partir de X)
+SUITES = [
+    ('3x3 completo', (3, 3, 3), math.inf, [[4], [0], [1], [0, 4], [4, 0, 8], [0, 8, 4, 2]]),
+    ('4x4 prof. 5', (4, 4, 4), 5, [[5], [0], [5, 10], [0, 5, 15]]),
+    ('5x5 k=4 prof. 3', (5, 5, 4), 3, [[12], [0], [12, 6], [12, 6, 18]]),
+]
+
+
+def run_suite(size, depth, positions, move_ordering):
+    """
+    Busca todas as posições do conjunto com um jogador novo por posição.
+
+    Returns:
+        tuple: (nós, cortes, cortes na primeira jogada, segundos).
+    """
+    nodes = cutoffs = first = 0
+    start = time.perf_counter()
+    for moves in positions:
+        game, letter = build_game(size, moves)
+        player = ComputerPlayer(letter, perfect_play=False, move_ordering=move_ordering)
+        player.new_search(game)
+        player.minimax(game, player.letter, depth=depth)
+        nodes += player.nodes
+        cutoffs += player.cutoffs
+        first += player.first_move_cutoffs
+    return nodes, cutoffs, first, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'conjunto':<16} {'ordenação':<10} {'nós':>9} {'cortes':>8} {'1ª jogada':>10} {'tempo (s)':>10}")
+    for label, size, depth, positions in SUITES:
+        for move_ordering in (False, True):
+            nodes, cutoffs, first, elapsed = run_suite(size, depth, positions, move_ordering)
+            rate = first / cutoffs if cutoffs else 0.0
+            print(f"{label:<16} {'sim' if move_ordering else 'não':<10} {nodes:>9} {cutoffs:>8} {rate:>10.1%} {elapsed:>10.3f}")
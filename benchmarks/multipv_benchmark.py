@@ -0,0 +1,118 @@
+"""
+Benchmark da análise multi-PV (ComputerPlayer.analyze): nós e tempo para obter o score exato de todas
+as jogadas legais de uma posição numa única chamada, com a tabela de transposição compartilhada, contra
+uma busca independente (jogador e tabela novos) por jogada, e o das dicas, que só pedem as LINES melhores
+jogadas. Mostra também o custo de anotar partidas inteiras, com um único jogador analisando todas as
+posições em sequência.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.multipv_benchmark
+"""
+import random
+import time
+
+from benchmarks.common import *
+from packs.ComputerPlayer import *
+from packs.Game import *
+
+# Configurações: (rótulo, (linhas, colunas, k), peças já jogadas em cada posição)
+CONFIGS = [
+    ('3x3', (3, 3, 3), 1),
+    ('4x4', (4, 4, 4), 5),
+    ('5x5 k=4', (5, 5, 4), 12),
+]
+POSITIONS = 10  # Posições por configuração
+LINES = 3  # Jogadas pedidas nas dicas
+GAMES = 5  # Partidas anotadas em 3x3
+
+
+def independent(positions):
+    """
+    Busca cada jogada de cada posição com um jogador novo, sem tabela compartilhada.
+
+    Returns:
+        tuple: (scores por posição, nós, segundos).
+    """
+    scores, nodes = [], 0
+    start = time.perf_counter()
+    for game, letter in positions:
+        position_scores = {}
+        for move in game.available_moves():
+            player = ComputerPlayer(letter, perfect_play=False)
+            player.new_search(game)
+            position_scores[move] = player.search_move(game, move)
+            nodes += player.nodes
+        scores.append(position_scores)
+    return scores, nodes, time.perf_counter() - start
+
+
+def multipv(positions, lines=None):
+    """
+    Analisa cada posição com uma única chamada a analyze, incluindo a reconstrução das variações.
+
+    Args:
+        positions (list): Pares (jogo, jogador da vez).
+        lines (int, opcional): Número de jogadas pedidas. Default é None (todas).
+
+    Returns:
+        tuple: (scores por posição, nós, segundos).
+    """
+    scores, nodes = [], 0
+    start = time.perf_counter()
+    for game, letter in positions:
+        player = ComputerPlayer(letter, perfect_play=False)
+        analysis = player.analyze(game, letter, lines=lines)
+        scores.append({line['position']: line['score'] for line in analysis})
+        nodes += player.nodes
+    return scores, nodes, time.perf_counter() - start
+
+
+def best_lines(scores, lines):
+    """
+    As `lines` melhores jogadas de cada posição, com o desempate de analyze (a casa de menor índice).
+
+    Returns:
+        list: Um dicionário {jogada: score} por posição.
+    """
+    return [dict(sorted(position.items(), key=lambda item: (-item[1], item[0]))[:lines]) for position in scores]
+
+
+def annotate_games(count, seed=0):
+    """
+    Anota partidas aleatórias de 3x3: em cada posição, a perda da jogada feita em relação à melhor.
+
+    Returns:
+        tuple: (posições analisadas, erros (jogadas com score abaixo do da melhor), segundos).
+    """
+    rng = random.Random(seed)
+    analyst = ComputerPlayer('X', perfect_play=False)
+    positions = blunders = 0
+    start = time.perf_counter()
+    for _ in range(count):
+        game = Game('0')
+        letter = 'X'
+        while not game.current_winner and game.empty_squares():
+            analysis = analyst.analyze(game, letter)
+            move = rng.choice(game.available_moves())
+            played = next(line['score'] for line in analysis if line['position'] == move)
+            blunders += played < analysis[0]['score']
+            positions += 1
+            game.make_move(move, letter)
+            letter = 'O' if letter == 'X' else 'X'
+    return positions, blunders, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'tabuleiro':<10} {'jogadas':>8} {'nós indep.':>11} {'nós multi-PV':>13} {'s indep.':>9} "
+          f"{'s multi-PV':>11} {'ganho':>6}")
+    for label, size, pieces in CONFIGS:
+        positions = random_positions(size, pieces, POSITIONS)
+        ref_scores, ref_nodes, ref_time = independent(positions)
+        for lines in (None, LINES):
+            scores, nodes, elapsed = multipv(positions, lines)
+            expected = ref_scores if lines is None else best_lines(ref_scores, lines)
+            assert scores == expected, "a análise multi-PV deu um score diferente da busca independente"
+            print(f"{label:<10} {lines or 'todas':>8} {ref_nodes:>11} {nodes:>13} {ref_time:>9.2f} "
+                  f"{elapsed:>11.2f} {ref_time / elapsed:>6.2f}")
+    positions, blunders, elapsed = annotate_games(GAMES)
+    print(f"\nAnotação de {GAMES} partidas 3x3: {positions} posições, {blunders} erros, {elapsed:.2f} s")
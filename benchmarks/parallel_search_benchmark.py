@@ -0,0 +1,63 @@
+"""
+Benchmark da busca paralela na raiz (RootParallelSearch): nós, tempo e speedup de 2 a N processos em
+relação à busca serial (workers=1) nas mesmas posições, em tabuleiros 4x4 e 5x5. Todas as configurações
+devem dar o mesmo score em cada posição; a jogada pode ser outra de mesmo score.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.parallel_search_benchmark [N]
+
+N é o número máximo de processos (padrão: o número de CPUs, no mínimo 2).
+"""
+import os
+import sys
+import time
+
+from benchmarks.common import *
+from packs.ComputerPlayer import *
+
+# Conjuntos de posições: (rótulo, (linhas, colunas, k), profundidade, jogadas alternadas a partir de X)
+SUITES = [
+    ('4x4 prof. 7', (4, 4, 4), 7, [[5], [0], [5, 10], [0, 5, 15]]),
+    ('5x5 k=4 prof. 5', (5, 5, 4), 5, [[12], [0], [12, 6], [12, 6, 18]]),
+]
+
+
+def run_suite(size, depth, positions, workers):
+    """
+    Busca todas as posições do conjunto com um jogador novo por posição. O pool de processos é
+    iniciado antes de medir o tempo, para que só a busca seja medida.
+
+    Returns:
+        tuple: (scores das posições, nós, segundos).
+    """
+    scores = []
+    nodes = 0
+    elapsed = 0.0
+    for position in positions:
+        game, letter = build_game(size, position)
+        player = ComputerPlayer(letter, perfect_play=False, workers=workers)
+        try:
+            if player.parallel is not None:
+                player.parallel.start()
+                player.parallel.executor.submit(int).result()
+            player.new_search(game)
+            start = time.perf_counter()
+            scores.append(player.search(game, depth=depth)['score'])
+            elapsed += time.perf_counter() - start
+            nodes += player.nodes
+        finally:
+            player.close()
+    return scores, nodes, elapsed
+
+
+if __name__ == "__main__":
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else max(os.cpu_count() or 1, 2)
+    print(f"CPUs disponíveis: {os.cpu_count()}")
+    print(f"{'conjunto':<16} {'processos':>9} {'nós':>9} {'tempo (s)':>10} {'speedup vs. serial':>19}")
+    for label, size, depth, positions in SUITES:
+        serial_scores, serial_nodes, serial_elapsed = run_suite(size, depth, positions, 1)
+        print(f"{label:<16} {'serial':>9} {serial_nodes:>9} {serial_elapsed:>10.3f} {1:>19.2f}")
+        for workers in range(2, max_workers + 1):
+            scores, nodes, elapsed = run_suite(size, depth, positions, workers)
+            assert scores == serial_scores, f"{workers} processos deram scores diferentes da busca serial em {label}"
+            print(f"{label:<16} {workers:>9} {nodes:>9} {elapsed:>10.3f} {serial_elapsed / elapsed:>19.2f}")
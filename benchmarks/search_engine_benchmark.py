@@ -0,0 +1,52 @@
+"""
+Benchmark dos algoritmos de busca do ComputerPlayer (ENGINES) em um conjunto fixo de posições:
+nós visitados, buscas repetidas (PVS), passagens de janela zero (MTD(f)) e tempo. Todos os algoritmos devem chegar ao mesmo score.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.search_engine_benchmark
+"""
+import math
+import time
+
+from benchmarks.common import *
+from packs.ComputerPlayer import *
+
+# Conjuntos de posições: (rótulo, (linhas, colunas, k), profundidade, jogadas alternadas a partir de X)
+SUITES = [
+    ('3x3 completo', (3, 3, 3), math.inf, [[4], [0], [1], [0, 4], [4, 0, 8], [0, 8, 4, 2]]),
+    ('4x4 prof. 5', (4, 4, 4), 5, [[5], [0], [5, 10], [0, 5, 15]]),
+    ('5x5 k=4 prof. 3', (5, 5, 4), 3, [[12], [0], [12, 6], [12, 6, 18]]),
+]
+
+
+def run_suite(engine, size, depth, positions):
+    """
+    Busca todas as posições do conjunto com um jogador novo por posição.
+
+    Returns:
+        tuple: (scores encontrados, nós, buscas repetidas, passagens do MTD(f), segundos).
+    """
+    scores = []
+    nodes = re_searches = passes = 0
+    start = time.perf_counter()
+    for moves in positions:
+        game, letter = build_game(size, moves)
+        player = ComputerPlayer(letter, perfect_play=False, engine=engine)
+        player.new_search(game)
+        scores.append(player.search(game, depth=depth)['score'])
+        nodes += player.nodes
+        re_searches += player.re_searches
+        passes += player.mtdf_passes
+    return scores, nodes, re_searches, passes, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'conjunto':<16} {'algoritmo':<10} {'nós':>9} {'repetidas':>10} {'passagens':>10} {'tempo (s)':>10}  {'vs minimax':>10}")
+    for label, size, depth, positions in SUITES:
+        reference = None
+        for engine in ENGINES:
+            scores, nodes, re_searches, passes, elapsed = run_suite(engine, size, depth, positions)
+            if reference is None:
+                reference = (scores, nodes)
+            assert scores == reference[0], f"{engine} divergiu do minimax em {label}: {scores} != {reference[0]}"
+            print(f"{label:<16} {engine:<10} {nodes:>9} {re_searches:>10} {passes:>10} {elapsed:>10.3f}  {nodes / reference[1]:>10.2f}")
@@ -0,0 +1,65 @@
+"""
+Benchmark do simulador de partidas aleatórias em lote (BatchSimulator) contra partidas jogadas uma a uma
+com Game.make_move: partidas por segundo e as frequências de vitória de X, de O e de empate.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.simulator_benchmark
+"""
+import random
+import time
+
+from packs.BatchSimulator import *
+from packs.Game import *
+
+# Tamanhos medidos: (rótulo, (linhas, colunas, k), partidas no lote, partidas uma a uma)
+SIZES = [
+    ('3x3', (3, 3, 3), 1000000, 20000),
+    ('4x4', (4, 4, 4), 500000, 10000),
+    ('5x5 k=4', (5, 5, 4), 200000, 5000),
+    ('7x7 k=5', (7, 7, 5), 50000, 1000),
+]
+
+
+def scalar_games(size, games, seed=0):
+    """
+    Joga partidas aleatórias uma a uma com Game.make_move.
+
+    Returns:
+        tuple: (resultados como em BatchSimulator.simulate, segundos).
+    """
+    rows, cols, k = size
+    rng = random.Random(seed)
+    results = {'X': 0, 'O': 0, 'draw': 0}
+    start = time.perf_counter()
+    for _ in range(games):
+        game = Game('0', rows, cols, k)
+        letter = 'X'
+        while not game.current_winner and game.empty_squares():
+            game.make_move(rng.choice(game.available_moves()), letter)
+            letter = 'O' if letter == 'X' else 'X'
+        results[game.current_winner or 'draw'] += 1
+    return results, time.perf_counter() - start
+
+
+def rates(results):
+    """
+    Formata as frequências de vitória de X, de O e de empate.
+
+    Returns:
+        str: As três frequências em porcentagem.
+    """
+    games = results['X'] + results['O'] + results['draw']
+    return ' '.join(f"{results[key] / games:>6.1%}" for key in ('X', 'O', 'draw'))
+
+
+if __name__ == "__main__":
+    print(f"{'tabuleiro':<10} {'modo':<8} {'partidas':>9} {'partidas/s':>11} {'X':>6} {'O':>6} {'empate':>6} {'ganho':>7}")
+    for label, size, batch_games, scalar_count in SIZES:
+        results, elapsed = scalar_games(size, scalar_count)
+        scalar_rate = scalar_count / elapsed
+        print(f"{label:<10} {'escalar':<8} {scalar_count:>9} {scalar_rate:>11.0f} {rates(results)} {1:>7.2f}")
+        simulator = BatchSimulator(*size, seed=0)
+        start = time.perf_counter()
+        results = simulator.simulate(batch_games)
+        rate = batch_games / (time.perf_counter() - start)
+        print(f"{label:<10} {'lote':<8} {batch_games:>9} {rate:>11.0f} {rates(results)} {rate / scalar_rate:>7.2f}")
@@ -0,0 +1,92 @@
+"""
+Benchmark do minimax com pilha explícita (engine='stack') contra o minimax recursivo: nós por segundo
+e pico de memória (tracemalloc) em posições de 4x4 e 5x5, com a verificação de que os resultados e o
+número de nós são idênticos, e uma busca numa linha de 1100 casas, mais funda que o limite de recursão.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.stack_search_benchmark
+"""
+import time
+import tracemalloc
+
+from benchmarks.common import *
+from packs.ComputerPlayer import *
+from packs.Game import *
+
+# Configurações: (rótulo, (linhas, colunas, k), peças já jogadas, profundidade)
+CONFIGS = [
+    ('4x4 prof. 6', (4, 4, 4), 2, 6),
+    ('4x4 completo', (4, 4, 4), 8, math.inf),
+    ('5x5 k=4 prof. 4', (5, 5, 4), 2, 4),
+]
+POSITIONS = 5  # Posições por configuração
+DEEP_LINE = 1100  # Casas da linha da busca profunda (o limite de recursão padrão é 1000)
+
+
+def run(positions, depth, engine, trace):
+    """
+    Busca todas as posições com o algoritmo dado, com um jogador novo por posição.
+
+    Args:
+        trace (bool): Se True, mede a memória com o tracemalloc (que deixa a busca mais lenta).
+
+    Returns:
+        tuple: (resultados, nós, segundos, maior pico de memória em bytes acima do início da busca).
+    """
+    results, nodes, peak = [], 0, 0
+    elapsed = 0.0
+    for game in positions:
+        player = ComputerPlayer('X', perfect_play=False, engine=engine)
+        player.new_search(game)
+        if trace:
+            tracemalloc.start()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        result = player.search_window(game, depth)
+        elapsed += time.perf_counter() - start
+        if trace:
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - start_memory)
+            tracemalloc.stop()
+        results.append((result['score'], result['position']))
+        nodes += player.nodes
+    return results, nodes, elapsed, peak
+
+
+def deep_line(engine):
+    """
+    Busca uma linha 1 x DEEP_LINE (vence quem completar a linha) até o primeiro ramo chegar ao fim,
+    sem tabela, ordenação nem detecção de empate, para que a busca desça uma casa por nível.
+
+    Returns:
+        str: A profundidade alcançada ou o erro.
+    """
+    game = Game('0', 1, DEEP_LINE, DEEP_LINE)
+    player = ComputerPlayer('X', perfect_play=False, tt_size=0, symmetry=False, move_ordering=False,
+                            draw_detection=False, engine=engine)
+    player.new_search(game)
+    # O primeiro ramo tem DEEP_LINE + 1 nós; o orçamento interrompe a busca logo depois dele
+    player.set_limits(node_limit=DEEP_LINE + 10)
+    try:
+        player.search_window(game)
+    except RecursionError:
+        return f"RecursionError após {player.nodes} nós"
+    except SearchBudgetExceeded:
+        return f"{player.nodes} nós, primeiro ramo completo ({DEEP_LINE} níveis)"
+    return "busca concluída"
+
+
+if __name__ == "__main__":
+    print(f"{'configuração':<17} {'algoritmo':<9} {'nós':>9} {'s':>7} {'nós/s':>9} {'pico (KiB)':>11}")
+    for label, size, pieces, depth in CONFIGS:
+        positions = [game for game, _ in random_positions(size, pieces, POSITIONS)]
+        reference = None
+        for engine in ('minimax', 'stack'):
+            results, nodes, elapsed, _ = run(positions, depth, engine, False)
+            _, _, _, peak = run(positions, depth, engine, True)
+            if reference is None:
+                reference = (results, nodes)
+            assert (results, nodes) == reference, "a pilha explícita deu um resultado ou número de nós diferente"
+            print(f"{label:<17} {engine:<9} {nodes:>9} {elapsed:>7.2f} {nodes / elapsed:>9.0f} {peak / 1024:>11.1f}")
+    print()
+    for engine in ('minimax', 'stack'):
+        print(f"Linha 1x{DEEP_LINE}, {engine}: {deep_line(engine)}")
@@ -0,0 +1,68 @@
+"""
+Benchmark da pré-análise tática do ComputerPlayer: em partidas contra um adversário aleatório, quantas
+jogadas foram resolvidas sem busca (vitória, bloqueio, garfo) e o tempo médio das jogadas resolvidas e
+das que precisaram de busca; e o tempo total das mesmas partidas com a pré-análise desativada.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.tactics_benchmark
+"""
+import random
+import time
+
+from packs.ComputerPlayer import *
+from packs.Game import *
+
+# Configurações: (rótulo, (linhas, colunas, k), dificuldade, orçamento de nós por jogada)
+CONFIGS = [
+    ('4x4 medium', (4, 4, 4), 'medium', None),
+    ('4x4 hard', (4, 4, 4), 'hard', 20000),
+    ('5x5 k=4 medium', (5, 5, 4), 'medium', None),
+    ('5x5 k=4 hard', (5, 5, 4), 'hard', 20000),
+]
+GAMES = 20
+
+
+def play(size, difficulty, node_budget, tactics):
+    """
+    Joga GAMES partidas em que X é o computador e O joga ao acaso (as mesmas jogadas para cada semente).
+
+    Returns:
+        tuple: (contagem por tipo de resolução, segundos das jogadas resolvidas, segundos das jogadas
+            com busca, segundos no total).
+    """
+    rows, cols, k = size
+    resolved_time = searched_time = 0.0
+    counts = {'win': 0, 'block': 0, 'fork': 0, 'search': 0}
+    for seed in range(GAMES):
+        rng = random.Random(seed)
+        game = Game('0', rows, cols, k)
+        computer = ComputerPlayer('X', difficulty=difficulty, node_budget=node_budget, tactics=tactics)
+        game.make_move(rng.choice(game.available_moves()), 'X')
+        letter = 'O'
+        while not game.current_winner and game.empty_squares():
+            if letter == 'O':
+                game.make_move(rng.choice(game.available_moves()), 'O')
+            else:
+                start = time.perf_counter()
+                game.make_move(computer.get_move(game), 'X')
+                elapsed = time.perf_counter() - start
+                if computer.last_tactic is None:
+                    searched_time += elapsed
+                else:
+                    resolved_time += elapsed
+            letter = 'O' if letter == 'X' else 'X'
+        for kind, count in computer.tactic_counts.items():
+            counts[kind] += count
+    return counts, resolved_time, searched_time, resolved_time + searched_time
+
+
+if __name__ == "__main__":
+    print(f"{'configuração':<16} {'vitória':>7} {'bloqueio':>8} {'garfo':>6} {'busca':>6} "
+          f"{'ms resolv.':>10} {'ms busca':>9} {'total (s)':>9} {'sem pré':>8}")
+    for label, size, difficulty, node_budget in CONFIGS:
+        counts, resolved, searched, total = play(size, difficulty, node_budget, True)
+        _, _, baseline, _ = play(size, difficulty, node_budget, False)
+        solved = counts['win'] + counts['block'] + counts['fork']
+        print(f"{label:<16} {counts['win']:>7} {counts['block']:>8} {counts['fork']:>6} {counts['search']:>6} "
+              f"{1000 * resolved / max(solved, 1):>10.2f} {1000 * searched / max(counts['search'], 1):>9.2f} "
+              f"{total:>9.2f} {baseline:>8.2f}")
@@ -0,0 +1,154 @@
+from functools import lru_cache
+
+from packs.Game import *
+
+try:
+    import numpy as np
+except ImportError:  # O NumPy é opcional: sem ele, só a avaliação em lote fica indisponível
+    np = None
+
+# Valor de cada peça nos tabuleiros codificados (casa vazia = 0).
+PIECE_VALUES = {'X': 1, 'O': -1}
+
+
+class BatchEvaluator:
+    """
+    Avalia de uma vez um lote de tabuleiros com NumPy, com a mesma pontuação de
+    ComputerPlayer.heuristic_state: ±(casas vazias + 1) para vitória ou derrota e, sem vencedor,
+    5 pontos por ameaça do jogador menos 5 por ameaça do adversário.
+
+    Os tabuleiros são um array (N, casas) de int8, com 1 para X, -1 para O e 0 para casa vazia. As
+    linhas vencedoras ficam num array (linhas, k) de índices, de modo que a soma das peças de todas as
+    linhas de todos os tabuleiros sai de uma única indexação: soma k é vitória de X, k - 1 é ameaça
+    de X (k - 1 peças de X e a casa restante vazia), e -k e -(k - 1) o mesmo para O.
+
+    Atributos:
+        rows (int): Número de linhas do tabuleiro.
+        cols (int): Número de colunas do tabuleiro.
+        k (int): Número de peças alinhadas para vencer.
+        lines (numpy.ndarray): Índices das casas de cada linha vencedora, com forma (linhas, k).
+        incidence (numpy.ndarray): Matriz (casas, linhas) de int8 com 1 onde a linha passa pela casa.
+        threat_values (numpy.ndarray): Saldo de ameaças de X de cada soma de linha, indexado por soma + k.
+    """
+
+    def __init__(self, rows=3, cols=3, k=3):
+        """
+        Pré-calcula o array de índices das linhas vencedoras.
+
+        Args:
+            rows (int, opcional): Número de linhas do tabuleiro. Default é 3.
+            cols (int, opcional): Número de colunas do tabuleiro. Default é 3.
+            k (int, opcional): Número de peças alinhadas para vencer. Default é 3.
+
+        Raises:
+            ImportError: Se o NumPy não estiver instalado.
+        """
+        if np is None:
+            raise ImportError("A avaliação em lote requer o NumPy (pip install numpy)")
+        self.rows, self.cols, self.k = rows, cols, k
+        lines, _ = line_tables(rows, cols, k)
+        self.lines = np.array(lines, dtype=np.intp)
+        self.incidence = np.zeros((rows * cols, len(lines)), dtype=np.int8)
+        for l, line in enumerate(lines):
+            self.incidence[line, l] = 1
+        self.threat_values = np.zeros(2 * k + 1, dtype=np.int8)
+        if k > 1:
+            self.threat_values[k + k - 1], self.threat_values[k - k + 1] = 1, -1
+
+    def encode(self, game):
+        """
+        Codifica o tabuleiro de um jogo.
+
+        Args:
+            game (Game): O jogo.
+
+        Returns:
+            numpy.ndarray: O tabuleiro como array de int8 com uma posição por casa.
+        """
+        return np.array([PIECE_VALUES.get(cell, 0) for cell in game.board], dtype=np.int8)
+
+    def children(self, board, moves, letter):
+        """
+        Monta o lote de tabuleiros que resultam de cada jogada a partir de um tabuleiro.
+
+        Args:
+            board (numpy.ndarray): O tabuleiro codificado.
+            moves (list): As jogadas (casas vazias).
+            letter (str): A letra de quem joga ('X' ou 'O').
+
+        Returns:
+            numpy.ndarray: Array (len(moves), casas) com um tabuleiro por jogada.
+        """
+        boards = np.repeat(board[np.newaxis, :], len(moves), axis=0)
+        boards[np.arange(len(moves)), moves] = PIECE_VALUES[letter]
+        return boards
+
+    def evaluate(self, boards, letter):
+        """
+        Avalia um lote de tabuleiros do ponto de vista de um jogador.
+
+        Args:
+            boards (numpy.ndarray): Array (N, casas) de int8.
+            letter (str): A letra do jogador ('X' ou 'O').
+
+        Returns:
+            tuple: (vitórias do jogador, vitórias do adversário, scores), arrays de tamanho N.
+        """
+        sums = boards[:, self.lines].sum(axis=2, dtype=np.int16)  # (N, linhas)
+        return self.score_sums(sums, (boards == 0).sum(axis=1), letter)
+
+    def evaluate_children(self, board, moves, mover, letter):
+        """
+        Avalia as posições que resultam de cada jogada a partir de um tabuleiro, sem montar os tabuleiros:
+        as somas das linhas de cada filho são as do pai mais a peça nova nas linhas que passam pela casa.
+
+        Args:
+            board (numpy.ndarray): O tabuleiro codificado.
+            moves (list): As jogadas (casas vazias).
+            mover (str): A letra de quem faz as jogadas ('X' ou 'O').
+            letter (str): A letra do jogador do ponto de vista da avaliação.
+
+        Returns:
+            tuple: (vitórias do jogador, vitórias do adversário, scores), arrays de tamanho len(moves).
+        """
+        base = board[self.lines].sum(axis=1, dtype=np.int16)  # (linhas,)
+        sums = base + self.incidence[moves] * PIECE_VALUES[mover]
+        return self.score_sums(sums, np.count_nonzero(board == 0) - 1, letter)
+
+    def score_sums(self, sums, empties, letter):
+        """
+        Converte as somas das linhas de cada tabuleiro em vitórias, derrotas e scores.
+
+        Args:
+            sums (numpy.ndarray): Array (N, linhas) com a soma das peças de cada linha.
+            empties (numpy.ndarray ou int): Casas vazias de cada tabuleiro, ou o número comum a todos.
+            letter (str): A letra do jogador do ponto de vista da avaliação.
+
+        Returns:
+            tuple: (vitórias do jogador, vitórias do adversário, scores), arrays de tamanho N.
+        """
+        sign = PIECE_VALUES[letter]
+        k = self.k
+        # Poucas operações sobre o array (N, linhas): o custo fixo de cada uma pesa nos lotes pequenos
+        x_wins, o_wins = sums.max(axis=1) == k, sums.min(axis=1) == -k
+        wins, losses = (x_wins, o_wins) if sign == 1 else (o_wins, x_wins)
+        threats = sign * self.threat_values[sums + k].sum(axis=1)
+        remaining = empties + 1
+        scores = np.where(wins, remaining, np.where(losses, -remaining, 5 * threats))
+        return wins, losses, scores
+
+
+@lru_cache(maxsize=None)
+def batch_evaluator(rows=3, cols=3, k=3):
+    """
+    Retorna o avaliador em lote de um tamanho de tabuleiro, criado uma única vez por processo.
+
+    Args:
+        rows (int, opcional): Número de linhas do tabuleiro. Default é 3.
+        cols (int, opcional): Número de colunas do tabuleiro. Default é 3.
+        k (int, opcional): Número de peças alinhadas para vencer. Default é 3.
+
+    Returns:
+        BatchEvaluator: O avaliador do tamanho pedido.
+    """
+    return BatchEvaluator(rows, cols, k)
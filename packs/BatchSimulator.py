@@ -0,0 +1,111 @@
+from packs.BatchEvaluator import *
+
+
+class BatchSimulator:
+    """
+    Simula com NumPy um lote de partidas aleatórias em passo sincronizado: a cada rodada, todas as partidas
+    ativas recebem ao mesmo tempo uma jogada aleatória do jogador da vez. As partidas que terminam (vitória
+    ou tabuleiro cheio) saem do lote, que fica menor a cada rodada.
+
+    Cada partida guarda, além do tabuleiro, a soma das peças de cada linha vencedora (1 para X, -1 para O),
+    atualizada pela matriz de incidência casa → linhas do BatchEvaluator; a vitória é uma linha com soma
+    ±k, sem precisar varrer o tabuleiro.
+
+    Atributos:
+        rows (int): Número de linhas do tabuleiro.
+        cols (int): Número de colunas do tabuleiro.
+        k (int): Número de peças alinhadas para vencer.
+        rng (numpy.random.Generator): O gerador dos sorteios.
+    """
+
+    def __init__(self, rows=3, cols=3, k=3, seed=None):
+        """
+        Prepara o simulador de um tamanho de tabuleiro.
+
+        Args:
+            rows (int, opcional): Número de linhas do tabuleiro. Default é 3.
+            cols (int, opcional): Número de colunas do tabuleiro. Default é 3.
+            k (int, opcional): Número de peças alinhadas para vencer. Default é 3.
+            seed (int, opcional): Semente do gerador, para simulações reproduzíveis.
+
+        Raises:
+            ImportError: Se o NumPy não estiver instalado.
+        """
+        self.evaluator = batch_evaluator(rows, cols, k)
+        self.rows, self.cols, self.k = rows, cols, k
+        self.rng = np.random.default_rng(seed)
+
+    def simulate(self, games, game=None, player='X', batch_size=100000):
+        """
+        Simula partidas aleatórias até o fim, em lotes de até `batch_size` partidas.
+
+        Args:
+            games (int): Número de partidas.
+            game (Game, opcional): Posição inicial (sem vencedor) de todas as partidas. Default é o tabuleiro vazio.
+            player (str, opcional): O jogador da vez na posição inicial. Default é 'X'.
+            batch_size (int, opcional): Partidas simuladas ao mesmo tempo. Default é 100000.
+
+        Returns:
+            dict: Vitórias de 'X', de 'O' e empates ('draw'), e o número médio de jogadas ('moves').
+        """
+        results = {'X': 0, 'O': 0, 'draw': 0, 'moves': 0.0}
+        total_moves = 0
+        remaining = games
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            x_wins, o_wins, draws, moves = self.simulate_batch(size, game, player)
+            results['X'] += x_wins
+            results['O'] += o_wins
+            results['draw'] += draws
+            total_moves += moves
+            remaining -= size
+        results['moves'] = total_moves / games if games else 0.0
+        return results
+
+    def simulate_batch(self, games, game=None, player='X'):
+        """
+        Simula um único lote de partidas em passo sincronizado.
+
+        Args:
+            games (int): Número de partidas do lote.
+            game (Game, opcional): Posição inicial. Default é o tabuleiro vazio.
+            player (str, opcional): O jogador da vez na posição inicial. Default é 'X'.
+
+        Returns:
+            tuple: (vitórias de X, vitórias de O, empates, total de jogadas feitas).
+        """
+        evaluator = self.evaluator
+        cells = self.rows * self.cols
+        if game is None:
+            start = np.zeros(cells, dtype=np.int8)
+        else:
+            start = evaluator.encode(game)
+        boards = np.repeat(start[np.newaxis, :], games, axis=0)
+        sums = np.repeat(start[evaluator.lines].sum(axis=1, dtype=np.int8)[np.newaxis, :], games, axis=0)
+        sign = PIECE_VALUES[player]
+        x_wins = o_wins = draws = total_moves = 0
+
+        for _ in range(int((start == 0).sum())):
+            count = len(boards)
+            if count == 0:
+                break
+            # Jogada aleatória por partida: o maior de números sorteados só nas casas vazias
+            keys = self.rng.random((count, cells))
+            keys[boards != 0] = -1.0
+            moves = keys.argmax(axis=1)
+            boards[np.arange(count), moves] = sign
+            sums += sign * evaluator.incidence[moves]
+            total_moves += count
+
+            won = (sums == sign * self.k).any(axis=1)
+            wins = int(won.sum())
+            if sign == 1:
+                x_wins += wins
+            else:
+                o_wins += wins
+            # Retira do lote as partidas encerradas
+            if wins:
+                boards, sums = boards[~won], sums[~won]
+            sign = -sign
+        draws = games - x_wins - o_wins
+        return x_wins, o_wins, draws, total_moves
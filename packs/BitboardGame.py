@@ -0,0 +1,296 @@
+from packs.Game import *
+
+
+@lru_cache(maxsize=None)
+def win_masks(rows=3, cols=3, k=3):
+    """
+    Pré-calcula as máscaras de vitória do tabuleiro: um bit por casa de cada linha vencedora.
+
+    Args:
+        rows (int): Número de linhas do tabuleiro.
+        cols (int): Número de colunas do tabuleiro.
+        k (int): Número de peças alinhadas necessárias para vencer.
+
+    Returns:
+        tuple: (todas as máscaras; para cada casa, apenas as máscaras que passam por ela).
+    """
+    lines, cell_lines = line_tables(rows, cols, k)
+    masks = tuple(sum(1 << i for i in line) for line in lines)
+    cell_masks = tuple(tuple(masks[l] for l in indices) for indices in cell_lines)
+    return masks, cell_masks
+
+
+class BoardView:
+    """
+    Visão de compatibilidade que se comporta como a lista `board` da classe Game,
+    mas lê e escreve diretamente nos bitboards de um BitboardGame.
+    """
+
+    def __init__(self, game):
+        """
+        Inicializa a visão sobre o jogo com bitboards.
+
+        Args:
+            game (BitboardGame): O jogo cujos bitboards serão expostos como lista.
+        """
+        self.game = game
+
+    def __len__(self):
+        return self.game.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.game.size))]
+        bit = 1 << index
+        if self.game.x_bits & bit:
+            return 'X'
+        if self.game.o_bits & bit:
+            return 'O'
+        return ' '
+
+    def __setitem__(self, index, letter):
+        bit = 1 << index
+        # Limpa a casa nos dois bitboards antes de marcar a nova letra.
+        self.game.x_bits &= ~bit
+        self.game.o_bits &= ~bit
+        if letter == 'X':
+            self.game.x_bits |= bit
+        elif letter == 'O':
+            self.game.o_bits |= bit
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __contains__(self, letter):
+        return letter in self[:]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def count(self, letter):
+        """
+        Conta quantas casas contêm a letra informada.
+
+        Args:
+            letter (str): A letra procurada ('X', 'O' ou ' ').
+
+        Returns:
+            int: O número de casas com a letra.
+        """
+        if letter == 'X':
+            return self.game.x_bits.bit_count()
+        if letter == 'O':
+            return self.game.o_bits.bit_count()
+        return self.game.size - (self.game.x_bits | self.game.o_bits).bit_count()
+
+
+class BitboardGame(Game):
+    """
+    Modo do jogo da velha representado por dois inteiros com um bit por casa, um para X e outro para O.
+
+    Mantém a mesma API da classe Game (`board`, `make_move`, `available_moves`, ...),
+    sendo `board` uma visão de compatibilidade sobre os bitboards.
+    """
+
+    def __init__(self, state, rows=3, cols=3, k=3, zobrist_seed=None):
+        """
+        Inicializa os bitboards vazios de um tabuleiro rows x cols com k em linha e define o estado de depuração.
+
+        Args:
+            state (str): Define se o modo de depuração está ativado ('1' para True, qualquer outra coisa para False).
+            rows (int, opcional): Número de linhas do tabuleiro. Default é 3.
+            cols (int, opcional): Número de colunas do tabuleiro. Default é 3.
+            k (int, opcional): Número de peças alinhadas para vencer. Default é 3.
+            zobrist_seed (int, opcional): Semente das chaves de Zobrist, para hashes estáveis entre processos.
+
+        Raises:
+            ValueError: Se k não couber no tabuleiro.
+        """
+        if not 2 <= k <= max(rows, cols):
+            raise ValueError(f"k={k} não cabe em um tabuleiro {rows}x{cols}")
+        self.rows, self.cols, self.k = rows, cols, k
+        self.size = rows * cols
+        self.full_mask = (1 << self.size) - 1  # Todas as casas ocupadas
+        self.win_masks, self.cell_win_masks = win_masks(rows, cols, k)
+        self.x_bits = 0  # Casas ocupadas por X
+        self.o_bits = 0  # Casas ocupadas por O
+        self.board = BoardView(self)
+        self.current_winner = None  # Monitorar o vencedor
+        self.debug_mode = True if state == '1' else False
+        self.move_stack = []  # Pilha de jogadas: (casa, letra, vencedor anterior)
+        self.zobrist = zobrist_keys(zobrist_seed, self.size)
+        self._hash = 0
+        self.symmetric_keys = symmetric_zobrist_keys(zobrist_seed, rows, cols)
+        self.symmetric_hash = 0
+
+    def available_moves(self):
+        """
+        Retorna uma lista de índices dos espaços disponíveis, percorrendo os bits livres.
+
+        Returns:
+            list: Lista de índices dos espaços vazios.
+        """
+        moves = []
+        empty = ~(self.x_bits | self.o_bits) & self.full_mask
+        while empty:
+            low = empty & -empty
+            moves.append(low.bit_length() - 1)
+            empty ^= low
+        return moves
+
+    def empty_squares(self):
+        """
+        Verifica se há espaços vazios no tabuleiro.
+
+        Returns:
+            bool: True se houver espaços vazios, False caso contrário.
+        """
+        return (self.x_bits | self.o_bits) != self.full_mask
+
+    def num_empty_squares(self):
+        """
+        Conta o número de espaços vazios no tabuleiro.
+
+        Returns:
+            int: O número de espaços vazios.
+        """
+        return self.size - (self.x_bits | self.o_bits).bit_count()
+
+    def position_key(self):
+        """
+        Retorna uma chave imutável que identifica a posição atual, usada pelas tabelas de transposição.
+
+        Returns:
+            tuple: Os bitboards de X e O.
+        """
+        return self.x_bits, self.o_bits
+
+    def make_move(self, square, letter):
+        """
+        Faz uma jogada no tabuleiro se o espaço especificado estiver vazio. Atualiza o vencedor atual se a jogada resultar em vitória.
+
+        Args:
+            square (int): O índice do espaço onde a jogada será feita.
+            letter (str): A letra do jogador ('X' ou 'O') que fará a jogada.
+
+        Returns:
+            bool: True se a jogada foi bem-sucedida, False se o espaço já estiver ocupado.
+        """
+        bit = 1 << square
+        if (self.x_bits | self.o_bits) & bit:
+            return False
+        self.move_stack.append((square, letter, self.current_winner))
+        if letter == 'X':
+            self.x_bits |= bit
+        else:
+            self.o_bits |= bit
+        self._hash ^= self.zobrist[letter][square] ^ self.zobrist['side']
+        self.symmetric_hash ^= self.symmetric_keys[letter][square]
+        if self.winner(square, letter):
+            self.current_winner = letter
+        return True
+
+    def undo_move(self):
+        """
+        Desfaz a última jogada da pilha em O(1), limpando o bit e restaurando o vencedor.
+
+        Returns:
+            int: O índice do espaço esvaziado.
+
+        Raises:
+            IndexError: Se não houver jogada para desfazer.
+        """
+        square, letter, previous_winner = self.move_stack.pop()
+        if letter == 'X':
+            self.x_bits &= ~(1 << square)
+        else:
+            self.o_bits &= ~(1 << square)
+        self._hash ^= self.zobrist[letter][square] ^ self.zobrist['side']
+        self.symmetric_hash ^= self.symmetric_keys[letter][square]
+        self.current_winner = previous_winner
+        return square
+
+    def threat_count(self, letter):
+        """
+        Retorna quantas linhas têm k - 1 peças do jogador e a casa restante vazia.
+
+        Args:
+            letter (str): A letra do jogador ('X' ou 'O').
+
+        Returns:
+            int: O número de ameaças de vitória do jogador.
+        """
+        mine, theirs = (self.x_bits, self.o_bits) if letter == 'X' else (self.o_bits, self.x_bits)
+        count = 0
+        for mask in self.win_masks:
+            if not theirs & mask and (mine & mask).bit_count() == self.k - 1:
+                count += 1
+        return count
+
+    def is_dead_draw(self):
+        """
+        Verifica se nenhuma máscara ainda pode ser completada: todas têm bits de X e de O.
+
+        Returns:
+            bool: True se a posição é empate certo.
+        """
+        for mask in self.win_masks:
+            if not self.x_bits & mask or not self.o_bits & mask:
+                return False
+        return True
+
+    def is_winning_move(self, square, letter):
+        """
+        Verifica, sem jogar, se ocupar a casa vazia daria a vitória ao jogador: basta que uma das máscaras
+        que passam por ela já tenha k - 1 peças dele.
+
+        Args:
+            square (int): O índice de um espaço vazio.
+            letter (str): A letra do jogador ('X' ou 'O').
+
+        Returns:
+            bool: True se a jogada venceria a partida.
+        """
+        bits = self.x_bits if letter == 'X' else self.o_bits
+        for mask in self.cell_win_masks[square]:
+            if (bits & mask).bit_count() == self.k - 1:
+                return True
+        return False
+
+    def winning_squares(self, letter):
+        """
+        Lista as casas vazias que dariam a vitória imediata ao jogador, a partir das máscaras: em cada
+        máscara com k - 1 peças dele e nenhuma do adversário, o bit que falta.
+
+        Args:
+            letter (str): A letra do jogador ('X' ou 'O').
+
+        Returns:
+            list: As casas vencedoras, em ordem crescente e sem repetição.
+        """
+        mine, theirs = (self.x_bits, self.o_bits) if letter == 'X' else (self.o_bits, self.x_bits)
+        squares = 0
+        for mask in self.win_masks:
+            if not theirs & mask and (mine & mask).bit_count() == self.k - 1:
+                squares |= mask & ~mine
+        return [square for square in range(self.size) if squares >> square & 1]
+
+    def winner(self, square, letter):
+        """
+        Verifica se a jogada feita resultou em uma vitória, testando apenas as máscaras que passam pela casa.
+
+        Args:
+            square (int): O índice do espaço onde a jogada foi feita.
+            letter (str): A letra do jogador ('X' ou 'O') que fez a jogada.
+
+        Returns:
+            bool: True se a jogada resultou em vitória, False caso contrário.
+        """
+        bits = self.x_bits if letter == 'X' else self.o_bits
+        for mask in self.cell_win_masks[square]:
+            if bits & mask == mask:
+                return True
+        return False
@@ -1,137 +1,1163 @@
-import math
-import random
-import secrets  # Para gerar números aleatórios usados em criptografia.
-
-from packs.Player import *
-
-
-class ComputerPlayer(Player):
-    def __init__(self, letter, difficulty='hard'):
-        """
-        Inicializa o jogador computador com uma letra (X ou O) e um nível de dificuldade.
-
-        Args:
-            letter (str): A letra do jogador ('X' ou 'O').
-            difficulty (str): Nível de dificuldade ('easy', 'medium', 'hard').
-        """
-        super().__init__(letter)
-        self.difficulty = difficulty
-
-    def get_move(self, game):
-        """
-        Obtém o movimento do jogador computador baseado no nível de dificuldade.
-
-        Args:
-            game (Game): A instância do jogo em que o movimento será feito.
-
-        Returns:
-            int: O índice do espaço onde o computador deseja fazer a jogada.
-        """
-        if len(game.available_moves()) == 9:
-            square = secrets.randbelow(9)
-        elif self.difficulty == 'easy':
-            square = random.choice(game.available_moves()) if game.available_moves() else None    
-        elif self.difficulty == 'medium':
-            square = self.minimax(game, self.letter, depth=2)['position']
-        elif self.difficulty == 'hard':  # Hard
-            square = self.minimax(game, self.letter)['position']
-        
-        if game.debug_mode:
-            print('\n-----------------------------------------')
-        return square
-    
-    def heuristic_state(self, state):
-        """
-        Avalia o estado do tabuleiro com base na heurística para determinar a qualidade de uma jogada.
-
-        Args:
-            state (Game): O estado atual do jogo.
-
-        Returns:
-            int: Pontuação heurística do estado.
-        """
-        
-        if state.current_winner == self.letter:  # Vitória da IA
-            if state.debug_mode:
-                state.print_board()
-                print(f"Vencedor: {state.current_winner}, Score: {1 * (state.num_empty_squares() + 1)}")
-            return 1 * (state.num_empty_squares() + 1)
-        elif state.current_winner == ('O' if self.letter == 'X' else 'X'):  # Vitória do adversário
-            if state.debug_mode:
-                state.print_board()
-                print(f"Vencedor: {state.current_winner}, Score: {-1 * (state.num_empty_squares() + 1)}")
-            return -1 * (state.num_empty_squares() + 1)
-        else:
-            score = 0
-            for (i, j, k) in [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)]:
-                line = [state.board[i], state.board[j], state.board[k]]
-                if line.count(self.letter) == 2 and line.count(' ') == 1:
-                    score += 5  # Jogada próxima de vitória
-                elif line.count(('O' if self.letter == 'X' else 'X')) == 2 and line.count(' ') == 1:
-                    score -= 5  # Jogada que precisa ser bloqueada
-            
-            if state.debug_mode:
-                state.print_board()
-                print(f"Possível futura boa jogada: {score}")
-            
-            return score
-    
-    def minimax(self, state, player, depth=math.inf, alpha=-math.inf, beta=math.inf):
-        """
-        Implementa o algoritmo Minimax com poda alfa-beta para determinar o melhor movimento para o computador.
-
-        Args:
-            state (Game): O estado atual do jogo.
-            player (str): O jogador atual ('X' ou 'O').
-            depth (int, opcional): Profundidade máxima da árvore de decisão. Default é infinito.
-            alpha (float, opcional): Valor alpha para poda alfa-beta. Default é -infinito.
-            beta (float, opcional): Valor beta para poda alfa-beta. Default é infinito.
-
-        Returns:
-            dict: Um dicionário contendo a 'position' do melhor movimento e a 'score' correspondente.
-        """
-        max_player = self.letter
-        other_player = 'O' if player == 'X' else 'X'
-
-        # Caso base: verifica se houve um vencedor ou se o jogo está terminado
-        if state.current_winner or not state.empty_squares() or depth == 0:
-            return {'position': None, 'score': self.heuristic_state(state)}
-
-        # Inicializa o melhor movimento
-        if player == max_player:
-            best = {'position': None, 'score': -math.inf}
-        else:
-            best = {'position': None, 'score': math.inf}
-
-        moves = state.available_moves()
-        
-        for possible_move in moves:
-            # Faz o movimento
-            state.make_move(possible_move, player)
-            
-            # Simula o jogo para o jogador adversário
-            sim_score = self.minimax(state, other_player, depth - 1, alpha, beta)
-
-            # Desfaz o movimento
-            state.board[possible_move] = ' '
-            state.current_winner = None
-            sim_score['position'] = possible_move
-
-            if player == max_player:
-                if sim_score['score'] > best['score']:
-                    best = sim_score
-                alpha = max(alpha, best['score'])
-            else:
-                if sim_score['score'] < best['score']:
-                    best = sim_score
-                beta = min(beta, best['score'])
-                
-
-            # Poda alfa-beta
-            if beta <= alpha:
-                if state.debug_mode:
-                    print(f"Poda: alpha={alpha}, beta={beta}, cortando ramos")  
-                break
-        #Retorna o melhor valor, para o estado ou para a jogada.
-        return best
-
+import math
+import random
+import secrets  # Para gerar números aleatórios usados em criptografia.
+import time
+
+from packs.BatchEvaluator import *
+from packs.LazySMP import *
+from packs.MoveOrdering import *
+from packs.ParallelSearch import *
+from packs.PerfectPlayTable import *
+from packs.Player import *
+from packs.SearchKernel import *
+from packs.Symmetry import *
+from packs.TranspositionTable import *
+
+# Algoritmos de busca disponíveis para 'medium' e 'hard'.
+ENGINES = ('minimax', 'pvs', 'mtdf', 'kernel', 'stack')
+
+# Nós visitados entre duas verificações do relógio e da interrupção da busca (o limite de nós é exato).
+BUDGET_CHECK_INTERVAL = 256
+
+# Número mínimo de jogadas de um nó do último nível para que o batch_eval avalie as folhas em lote.
+# Abaixo dele, medido no batch_eval_benchmark, o custo fixo das chamadas ao NumPy supera o de ordenar
+# as jogadas e avaliar as folhas uma a uma até o corte.
+BATCH_MIN_MOVES = 40
+
+
+class ComputerPlayer(Player):
+    def __init__(self, letter, difficulty='hard', tt_size=100000, symmetry=True, perfect_play=True,
+                 time_budget=None, node_budget=None, move_ordering=True, engine='minimax', aspiration=None,
+                 workers=1, threads=1, batch_eval=False, tactics=True, draw_detection=True):
+        """
+        Inicializa o jogador computador com uma letra (X ou O) e um nível de dificuldade.
+
+        Args:
+            letter (str): A letra do jogador ('X' ou 'O').
+            difficulty (str): Nível de dificuldade ('easy', 'medium', 'hard').
+            tt_size (int): Número máximo de entradas da tabela de transposição (0 desativa a tabela).
+            symmetry (bool): Se True, posições simétricas compartilham a mesma entrada da tabela
+                e jogadas simétricas repetidas são ignoradas na raiz da busca.
+            perfect_play (bool): Se True, a dificuldade 'hard' consulta a tabela de jogo perfeito
+                pré-calculada antes de recorrer ao minimax.
+            time_budget (float, opcional): Tempo máximo por jogada, em segundos. Com um orçamento definido,
+                'medium' e 'hard' usam aprofundamento iterativo em vez de uma profundidade fixa.
+            node_budget (int, opcional): Número máximo de nós visitados por jogada. Os dois orçamentos são
+                rígidos: ao acabar, a jogada é a melhor já buscada por completo e `partial` fica True.
+            move_ordering (bool): Se True, as jogadas de cada nó são ordenadas (jogada da tabela, vitórias,
+                bloqueios, killers, histórico e prioridade da casa); se False, seguem a ordem dos índices.
+            engine (str): Algoritmo de busca ('minimax', 'pvs' para a Principal Variation Search,
+                'mtdf' para o MTD(f) ou 'kernel' para o minimax sem alocações por nó do SearchKernel,
+                que não usa a tabela de transposição, a ordenação nem a simetria, ou 'stack' para o minimax
+                com pilha explícita, sem recursão).
+            aspiration (tuple, opcional): Meias-larguras sucessivas das janelas de aspiração em torno do score
+                da busca anterior, por exemplo (5, 20); após a última, a janela é aberta por completo.
+                None (padrão) busca sempre com a janela completa.
+            workers (int): Número de processos da busca paralela na raiz (ver RootParallelSearch).
+                1 (padrão) busca no próprio processo.
+            threads (int): Número de threads do aprofundamento iterativo em modo Lazy SMP (ver LazySMPSearch).
+                1 (padrão) busca só na thread atual.
+            batch_eval (bool): Se True, o minimax resolve os nós do último nível com pelo menos BATCH_MIN_MOVES
+                jogadas avaliando todas as folhas de uma vez, com o NumPy (ver BatchEvaluator), em vez de
+                ordenar as jogadas e fazer e desfazer cada uma.
+            tactics (bool): Se True, 'medium' e 'hard' fazem uma pré-análise tática (vitória imediata,
+                bloqueio obrigatório e garfo) e dispensam a busca quando a jogada é forçada.
+            draw_detection (bool): Se True, a busca pontua como empate, sem buscá-lo, todo nó em que
+                nenhuma linha ainda pode ser completada por algum dos jogadores (ver Game.is_dead_draw).
+
+        Raises:
+            ValueError: Se o algoritmo de busca não existir.
+            ImportError: Se `batch_eval` for True e o NumPy não estiver instalado.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Algoritmo de busca desconhecido: {engine}")
+        if batch_eval and np is None:
+            raise ImportError("batch_eval requer o NumPy (pip install numpy)")
+        super().__init__(letter)
+        self.engine = engine
+        self.difficulty = difficulty
+        self.nodes = 0  # Nós visitados pelo minimax na última busca
+        self.cutoffs = 0  # Cortes alfa-beta na última busca
+        self.first_move_cutoffs = 0  # Cortes causados pela primeira jogada tentada no nó
+        self.re_searches = 0  # Buscas repetidas com janela cheia após falha alta da janela nula (PVS)
+        self.mtdf_passes = 0  # Buscas de janela zero feitas pelo MTD(f)
+        self.fail_highs = 0  # Buscas repetidas porque o score superou a janela de aspiração
+        self.fail_lows = 0  # Buscas repetidas porque o score ficou abaixo da janela de aspiração
+        self.dead_draws = 0  # Nós pontuados como empate certo sem busca, por não haver linha viva
+        self.draw_detection = draw_detection
+        self.aspiration = aspiration
+        # Score da última busca concluída: estimativa inicial do MTD(f) e centro das janelas de aspiração
+        self.last_score = None
+        # Tabela de transposição mantida entre as jogadas; os contadores valem para a última busca.
+        self.tt = TranspositionTable(tt_size)
+        self.symmetry = symmetry
+        self.book = PerfectPlayTable.shared() if perfect_play and difficulty == 'hard' else None
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.completed_depth = 0  # Profundidade da última iteração concluída no aprofundamento iterativo
+        # Limites da busca em andamento (None quando a busca não tem orçamento) e o número de nós
+        # em que eles serão verificados de novo
+        self.deadline = None
+        self.node_limit = None
+        self.next_check = 0
+        # Orçamento de nós compartilhado com outros processos ou threads (NodePool), de onde o limite de
+        # nós é renovado aos poucos; None quando o orçamento é só deste jogador
+        self.node_pool = None
+        self.partial = False  # Se a última jogada veio de uma busca interrompida pelo orçamento
+        # Melhor jogada da raiz com score exato e jogadas da raiz já buscadas na iteração em andamento
+        self.root_best = None
+        self.root_searched = set()
+        self.stop = None  # threading.Event que interrompe a busca quando acionado (Lazy SMP)
+        # Ordenação de jogadas; o histórico de cortes é mantido entre as jogadas
+        self.ordering = MoveOrdering() if move_ordering else None
+        # Busca paralela na raiz para 'minimax' e 'pvs'; o pool de processos é criado na primeira busca
+        self.parallel = RootParallelSearch(self, workers) if workers > 1 else None
+        # Threads do Lazy SMP, que compartilham a tabela de transposição deste jogador
+        self.smp = LazySMPSearch(self, threads) if threads > 1 else None
+        self.kernel = None  # SearchKernel do tamanho de tabuleiro buscado, criado na primeira busca
+        self.batch_eval = batch_eval
+        self.batch_leaves = 0  # Folhas avaliadas em lote na última busca
+        self.tactics = tactics
+        # Jogadas resolvidas pela pré-análise tática, por tipo, e as que precisaram de busca ('search'),
+        # acumuladas entre as jogadas; last_tactic é o tipo da última jogada (None se houve busca)
+        self.tactic_counts = {'win': 0, 'block': 0, 'fork': 0, 'search': 0}
+        self.last_tactic = None
+
+    def get_move(self, game):
+        """
+        Obtém o movimento do jogador computador baseado no nível de dificuldade.
+
+        Args:
+            game (Game): A instância do jogo em que o movimento será feito.
+
+        Returns:
+            int: O índice do espaço onde o computador deseja fazer a jogada.
+        """
+        self.new_search(game)
+        if game.num_empty_squares() == game.size:
+            square = secrets.randbelow(game.size)
+        elif self.difficulty == 'easy':
+            square = random.choice(game.available_moves()) if game.available_moves() else None    
+        elif self.difficulty == 'medium':
+            square = self.tactical_move(game)
+            if square is None and (self.has_budget() or self.smp is not None):
+                square = self.iterative_deepening(game, max_depth=2)['position']
+            elif square is None:
+                square = self.search(game, depth=2)['position']
+        elif self.difficulty == 'hard':  # Hard
+            # Consulta O(1) na tabela de jogo perfeito; no modo debug a busca é feita para exibir os passos
+            square = None
+            if self.book is not None and not game.debug_mode:
+                square = self.book.best_move(game, self.letter)
+            if square is None:
+                square = self.tactical_move(game)
+            if square is None and (self.has_budget() or self.smp is not None):
+                square = self.iterative_deepening(game)['position']
+            elif square is None:
+                square = self.search(game)['position']
+        
+        if game.debug_mode:
+            print('\n-----------------------------------------')
+        return square
+    
+    def tactical_move(self, game):
+        """
+        Pré-análise tática, feita direto dos contadores de linha (ou das máscaras do BitboardGame), antes
+        da busca. Resolve as jogadas forçadas, em que a busca completa escolheria uma jogada de mesmo valor:
+
+        - vitória imediata;
+        - bloqueio de uma vitória imediata do adversário (com mais de uma, a partida está perdida e
+          qualquer bloqueio vale o mesmo);
+        - garfo: uma jogada que cria duas casas vencedoras diferentes, sem que o adversário tenha vitória
+          imediata; ele só pode bloquear uma, então a vitória vem no lance seguinte.
+
+        No modo debug, ou com `tactics` desativado, a pré-análise não é feita.
+
+        Args:
+            game (Game): O estado atual do jogo.
+
+        Returns:
+            int: A jogada forçada, ou None se a posição precisa de busca.
+        """
+        if not self.tactics or game.debug_mode:
+            return None
+        other_player = 'O' if self.letter == 'X' else 'X'
+        square, kind = None, None
+        wins = game.winning_squares(self.letter)
+        blocks = game.winning_squares(other_player) if not wins else []
+        if wins:
+            square, kind = wins[0], 'win'
+        elif blocks:
+            square, kind = blocks[0], 'block'
+        else:
+            for move in game.available_moves():
+                with game.push(move, self.letter):
+                    # Duas linhas ameaçadas podem ter a mesma casa vazia: o garfo exige duas casas diferentes
+                    if game.threat_count(self.letter) >= 2 and len(game.winning_squares(self.letter)) >= 2:
+                        square, kind = move, 'fork'
+                        break
+        self.last_tactic = kind
+        self.tactic_counts[kind or 'search'] += 1
+        return square
+
+    def new_search(self, game):
+        """
+        Prepara uma nova busca: zera os contadores de nós, de cortes e da tabela de transposição
+        e atualiza as tabelas da ordenação de jogadas.
+
+        Args:
+            game (Game): O jogo que será buscado.
+        """
+        self.nodes = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.re_searches = 0
+        self.mtdf_passes = 0
+        self.fail_highs = 0
+        self.fail_lows = 0
+        self.dead_draws = 0
+        self.batch_leaves = 0
+        self.partial = False
+        self.tt.reset_stats()
+        if self.ordering is not None:
+            self.ordering.new_search(game)
+
+    @property
+    def first_move_cutoff_rate(self):
+        """
+        Fração dos cortes alfa-beta da última busca que aconteceram já na primeira jogada tentada.
+
+        Returns:
+            float: A taxa entre 0 e 1 (0 se não houve cortes).
+        """
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def search(self, game, depth=math.inf):
+        """
+        Busca a melhor jogada do computador com o algoritmo escolhido em `engine`. Com `aspiration`
+        definido, a busca começa por uma janela estreita em torno do score da busca anterior.
+
+        Args:
+            game (Game): O estado atual do jogo.
+            depth (float, opcional): Profundidade máxima. Default é infinito.
+
+        Returns:
+            dict: A 'position' da melhor jogada e a 'score' do ponto de vista do computador.
+        """
+        if self.aspiration and self.last_score is not None and self.engine != 'mtdf':
+            result = self.aspiration_search(game, depth, self.last_score)
+        else:
+            result = self.search_window(game, depth)
+        self.last_score = result['score']
+        return result
+
+    def search_window(self, game, depth=math.inf, alpha=-math.inf, beta=math.inf):
+        """
+        Executa o algoritmo escolhido em `engine` na raiz, com a janela (alpha, beta), em paralelo se
+        `workers` > 1. O MTD(f) define as próprias janelas, ignora a janela recebida e não é paralelizado.
+
+        Args:
+            game (Game): O estado atual do jogo.
+            depth (float, opcional): Profundidade máxima. Default é infinito.
+            alpha (float, opcional): Limite inferior da janela. Default é -infinito.
+            beta (float, opcional): Limite superior da janela. Default é infinito.
+
+        Returns:
+            dict: A 'position' da melhor jogada e a 'score' do ponto de vista do computador.
+        """
+        if self.engine == 'mtdf':
+            return self.mtdf(game, depth, guess=self.last_score or 0)
+        # O núcleo sem alocações não imprime os passos: no modo debug a busca é a do minimax
+        if self.engine == 'kernel' and not game.debug_mode:
+            score, move = self.search_kernel(game).search(game, self.letter, depth, alpha, beta)
+            return {'position': move, 'score': score}
+        # No modo debug a busca fica no processo principal, para exibir os passos
+        if self.parallel is not None and not game.debug_mode:
+            return self.parallel.search(game, depth, alpha, beta)
+        if self.engine == 'pvs':
+            return self.pvs(game, self.letter, depth, alpha, beta)
+        if self.engine == 'stack':
+            return self.minimax_stack(game, self.letter, depth, alpha, beta)
+        return self.minimax(game, self.letter, depth, alpha, beta)
+
+    def search_kernel(self, game):
+        """
+        Retorna o núcleo de busca do tamanho de tabuleiro do jogo, criando-o se preciso.
+
+        Args:
+            game (Game): O jogo que será buscado.
+
+        Returns:
+            SearchKernel: O núcleo, com os buffers pré-alocados.
+        """
+        if self.kernel is None or (self.kernel.rows, self.kernel.cols, self.kernel.k) != (game.rows, game.cols, game.k):
+            self.kernel = SearchKernel(self, game.rows, game.cols, game.k)
+        return self.kernel
+
+    def search_move(self, game, move, depth=math.inf, alpha=-math.inf, beta=math.inf):
+        """
+        Busca a posição resultante de uma jogada do computador na raiz, com a janela (alpha, beta).
+
+        Args:
+            game (Game): O estado atual do jogo.
+            move (int): A jogada do computador.
+            depth (float, opcional): Profundidade máxima, contando a própria jogada. Default é infinito.
+            alpha (float, opcional): Limite inferior da janela. Default é -infinito.
+            beta (float, opcional): Limite superior da janela. Default é infinito.
+
+        Returns:
+            int: O score da jogada do ponto de vista do computador.
+        """
+        other_player = 'O' if self.letter == 'X' else 'X'
+        with game.push(move, self.letter):
+            if self.engine == 'pvs':
+                return -self.pvs(game, other_player, depth - 1, -beta, -alpha, ply=1)['score']
+            if self.engine == 'stack':
+                return self.minimax_stack(game, other_player, depth - 1, alpha, beta, ply=1)['score']
+            return self.minimax(game, other_player, depth - 1, alpha, beta, ply=1)['score']
+
+    def analyze(self, game, player=None, depth=math.inf, lines=None):
+        """
+        Análise multi-PV: devolve as jogadas legais com o score exato (e não só limites, como os das
+        jogadas cortadas pelo alfa-beta), da melhor para a pior. A primeira jogada (a da tabela de
+        transposição ou da ordenação) é buscada com a janela completa; as seguintes, com uma janela mínima
+        em torno do score da `lines`-ésima melhor jogada até ali (da melhor, sem `lines`), que corta quase
+        tudo quando a jogada empata com ele. Só quando o score cai fora da janela a jogada é buscada de
+        novo, com o lado que falhou aberto. Com `lines`, as jogadas que falham baixo ficam de fora da
+        análise e não são buscadas de novo. A tabela de transposição é a mesma para todas as buscas,
+        e as variações principais saem das entradas exatas que elas deixam nela.
+
+        Args:
+            game (Game): O estado atual do jogo, sem vencedor.
+            player (str, opcional): O jogador da vez ('X' ou 'O'). Default é a letra do computador.
+            depth (float, opcional): Profundidade máxima, contando a própria jogada. Default é infinito.
+            lines (int, opcional): Número de jogadas a devolver, as melhores. Default é None (todas).
+
+        Returns:
+            list: Um dicionário por jogada, com a 'position', a 'score' do ponto de vista do jogador da
+                vez e a variação principal 'pv' (lista de jogadas a partir dela), ordenados do maior
+                para o menor score; num empate, fica antes a casa de menor índice.
+        """
+        player = player or self.letter
+        sign = 1 if player == self.letter else -1
+        self.new_search(game)
+        moves = game.available_moves()
+        if self.ordering is not None:
+            symmetry = self.symmetry_of(game)
+            key, transform = self.tt_key(game, player)
+            entry = self.tt.lookup(key)
+            tt_move = None
+            if entry is not None:
+                tt_move = entry.move if transform is None else symmetry.from_canonical(entry.move, transform)
+            moves = self.ordering.order(game, moves, player, tt_move)
+
+        scores = {}
+        for move in moves:
+            if not scores:
+                scores[move] = self.analyze_move(game, player, move, depth)
+                continue
+            ranked = sorted(scores.values(), reverse=True)
+            if lines is None:
+                center = ranked[0]
+            elif len(ranked) < lines:
+                scores[move] = self.analyze_move(game, player, move, depth)
+                continue
+            else:
+                center = ranked[lines - 1]
+            score = self.analyze_move(game, player, move, depth, center - 1, center + 1)
+            if score >= center + 1:
+                self.fail_highs += 1
+                score = self.analyze_move(game, player, move, depth, center, math.inf)
+            elif score <= center - 1:
+                self.fail_lows += 1
+                if lines is not None:
+                    continue
+                score = self.analyze_move(game, player, move, depth, -math.inf, center)
+            scores[move] = score
+
+        index = {move: i for i, move in enumerate(game.available_moves())}
+        best_first = sorted(scores, key=lambda move: (-scores[move], index[move]))[:lines]
+        analysis = [{'position': move, 'score': scores[move], 'pv': self.principal_variation(game, player, move, depth)}
+                    for move in best_first]
+
+        # A raiz fica na tabela com o score exato, como depois de uma busca, para as buscas seguintes
+        if analysis:
+            symmetry = self.symmetry_of(game)
+            key, transform = self.tt_key(game, player)
+            best = analysis[0]['position']
+            move = best if transform is None else symmetry.to_canonical(best, transform)
+            self.tt.store(key, sign * analysis[0]['score'], move, depth, EXACT)
+        return analysis
+
+    def analyze_move(self, game, player, move, depth=math.inf, alpha=-math.inf, beta=math.inf):
+        """
+        Busca a posição resultante de uma jogada de qualquer um dos jogadores, com a janela (alpha, beta)
+        do ponto de vista de quem joga.
+
+        Args:
+            game (Game): O estado atual do jogo.
+            player (str): O jogador que faz a jogada ('X' ou 'O').
+            move (int): A jogada.
+            depth (float, opcional): Profundidade máxima, contando a própria jogada. Default é infinito.
+            alpha (float, opcional): Limite inferior da janela. Default é -infinito.
+            beta (float, opcional): Limite superior da janela. Default é infinito.
+
+        Returns:
+            int: O score da jogada do ponto de vista de `player`.
+        """
+        other_player = 'O' if player == 'X' else 'X'
+        with game.push(move, player):
+            if self.engine == 'pvs':
+                return -self.pvs(game, other_player, depth - 1, -beta, -alpha, ply=1)['score']
+            if player == self.letter:
+                return self.minimax(game, other_player, depth - 1, alpha, beta, ply=1)['score']
+            return -self.minimax(game, other_player, depth - 1, -beta, -alpha, ply=1)['score']
+
+    def principal_variation(self, game, player, move, depth=math.inf):
+        """
+        Reconstrói a variação principal que começa por uma jogada seguindo as melhores jogadas guardadas
+        nas entradas exatas da tabela de transposição. Uma posição sem entrada exata (cortada por uma
+        janela estreita ou substituída na tabela) é buscada com a janela completa, o que custa pouco
+        com a tabela já preenchida.
+
+        Args:
+            game (Game): O estado atual do jogo.
+            player (str): O jogador que faz a jogada ('X' ou 'O').
+            move (int): A primeira jogada da variação.
+            depth (float, opcional): Tamanho máximo da variação. Default é infinito.
+
+        Returns:
+            list: As jogadas da variação, começando por `move`, até o fim da partida ou da profundidade.
+        """
+        pv = [move]
+        game.push(move, player)
+        try:
+            while len(pv) < depth and not game.current_winner and game.empty_squares():
+                player = 'O' if player == 'X' else 'X'
+                key, transform = self.tt_key(game, player)
+                entry = self.tt.table.get(key)
+                if entry is not None and entry.flag == EXACT and entry.depth >= depth - len(pv):
+                    move = entry.move if transform is None else self.symmetry_of(game).from_canonical(entry.move, transform)
+                elif self.engine == 'pvs':
+                    move = self.pvs(game, player, depth - len(pv), ply=1)['position']
+                else:
+                    move = self.minimax(game, player, depth - len(pv), ply=1)['position']
+                if move is None:
+                    break
+                pv.append(move)
+                game.push(move, player)
+        finally:
+            for _ in pv:
+                game.pop()
+        return pv
+
+    def close(self):
+        """
+        Encerra o pool de processos da busca paralela, se houver.
+        """
+        if self.parallel is not None:
+            self.parallel.close()
+
+    def aspiration_search(self, game, depth, center):
+        """
+        Busca com janelas de aspiração: abre uma janela estreita em torno de `center` e, a cada falha
+        baixa ou alta, alarga o lado que falhou seguindo as larguras de `aspiration`, até o score
+        cair dentro da janela (e ser, portanto, exato).
+
+        Args:
+            game (Game): O estado atual do jogo.
+            depth (float): Profundidade máxima.
+            center (int): O score esperado, normalmente o da busca ou iteração anterior.
+
+        Returns:
+            dict: A 'position' da melhor jogada e a 'score' do ponto de vista do computador.
+        """
+        widths = self.aspiration
+        low_step = high_step = 0
+        alpha, beta = center - widths[0], center + widths[0]
+        while True:
+            result = self.search_window(game, depth, alpha, beta)
+            if result['score'] <= alpha:
+                self.fail_lows += 1
+                low_step += 1
+                alpha = center - widths[low_step] if low_step < len(widths) else -math.inf
+            elif result['score'] >= beta:
+                self.fail_highs += 1
+                high_step += 1
+                beta = center + widths[high_step] if high_step < len(widths) else math.inf
+            else:
+                return result
+
+    def check_budget(self):
+        """
+        Interrompe a busca se o orçamento de nós ou de tempo da jogada tiver acabado. A busca só chama
+        este método quando `nodes` alcança `next_check`: a cada BUDGET_CHECK_INTERVAL nós, ou logo
+        depois do limite de nós. Com `node_pool`, o limite acabado é renovado com mais um bloco de nós do
+        orçamento compartilhado, enquanto houver.
+
+        Raises:
+            SearchBudgetExceeded: Se algum dos limites foi ultrapassado ou se a busca foi interrompida.
+        """
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            granted = 0 if self.node_pool is None else self.node_pool.reserve(BUDGET_CHECK_INTERVAL)
+            if not granted:
+                # O nó que passaria do limite não é buscado, então não conta
+                self.nodes -= 1
+                raise SearchBudgetExceeded()
+            self.node_limit += granted
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise SearchBudgetExceeded()
+        if self.stop is not None and self.stop.is_set():
+            raise SearchBudgetExceeded()
+        self.next_check = self.nodes + BUDGET_CHECK_INTERVAL
+        if self.node_limit is not None:
+            self.next_check = min(self.next_check, self.node_limit + 1)
+
+    def set_limits(self, deadline=None, node_limit=None):
+        """
+        Define os limites da busca em andamento, verificados já no próximo nó.
+
+        Args:
+            deadline (float, opcional): Instante (time.perf_counter) em que o tempo acaba. Default é None (sem prazo).
+            node_limit (int, opcional): Valor de `nodes` a partir do qual a busca é interrompida. Default é None.
+        """
+        self.deadline = deadline
+        self.node_limit = node_limit
+        self.next_check = 0
+
+    def record_root_move(self, move, score, alpha, beta):
+        """
+        Registra uma jogada da raiz que acabou de ser buscada, para que uma iteração interrompida ainda
+        possa dar a sua melhor jogada. Só contam as jogadas com score exato, dentro da janela: um limite
+        de uma janela de aspiração que falhou não prova nada sobre a jogada na janela seguinte.
+
+        Args:
+            move (int): A jogada da raiz.
+            score (int): O score da jogada do ponto de vista do computador.
+            alpha (float): O alpha da raiz antes da jogada.
+            beta (float): O beta da raiz.
+        """
+        if not alpha < score < beta:
+            return
+        self.root_searched.add(move)
+        # A janela seguinte de uma aspiração recomeça o alpha: a melhor jogada só é trocada por uma melhor
+        if self.root_best is None or score > self.root_best['score']:
+            self.root_best = {'position': move, 'score': score}
+
+    def has_budget(self):
+        """
+        Indica se o jogador tem orçamento de tempo ou de nós por jogada.
+
+        Returns:
+            bool: True se houver algum orçamento definido.
+        """
+        return self.time_budget is not None or self.node_budget is not None
+
+    def iterative_deepening(self, game, max_depth=math.inf):
+        """
+        Executa a busca com profundidades crescentes (1, 2, 3, ...) até esgotar o orçamento da jogada
+        ou alcançar a profundidade máxima. As iterações anteriores deixam na tabela de transposição as
+        melhores jogadas de cada posição, que são tentadas primeiro na iteração seguinte.
+        Com `threads` > 1 (e fora do modo debug), as iterações são feitas em paralelo pelo Lazy SMP.
+
+        Args:
+            game (Game): O estado atual do jogo.
+            max_depth (float, opcional): Profundidade máxima. Default é infinito (até o fim da partida).
+
+        Returns:
+            dict: O resultado ('position' e 'score') da iteração mais profunda concluída, com 'partial' True
+                se o orçamento acabou antes da profundidade máxima. Se nenhuma jogada foi buscada por
+                completo, a jogada é a primeira da ordenação e o score é None.
+        """
+        if self.smp is not None and not game.debug_mode:
+            result = self.smp.iterative_deepening(game, max_depth)
+        else:
+            result = self.deepen(game, max_depth)
+        if result is None:
+            moves = game.available_moves()
+            if self.ordering is not None:
+                moves = self.ordering.order(game, moves, self.letter)
+            result = {'position': moves[0], 'score': None, 'partial': True}
+        self.partial = result['partial']
+        return result
+
+    def deepen(self, game, max_depth=math.inf, start_depth=1):
+        """
+        Laço do aprofundamento iterativo na thread atual, dentro do orçamento da jogada. Quando o orçamento
+        acaba no meio de uma iteração, a melhor jogada dela (com score exato) substitui a da iteração
+        anterior se a jogada anterior já tiver recebido nesta iteração um score exato que não a supera.
+
+        Args:
+            game (Game): O estado atual do jogo.
+            max_depth (float, opcional): Profundidade máxima. Default é infinito (até o fim da partida).
+            start_depth (int, opcional): Profundidade da primeira iteração. Default é 1.
+
+        Returns:
+            dict: O resultado ('position', 'score' e 'partial') da iteração mais profunda concluída ou da
+                iteração interrompida, ou None se nenhuma jogada foi buscada por completo.
+        """
+        start = time.perf_counter()
+        max_depth = min(max_depth, game.num_empty_squares())
+        best = None
+        partial = False
+        self.completed_depth = 0
+        depth = start_depth
+        # Com um orçamento compartilhado (Lazy SMP), os nós são reservados dele aos poucos, a partir de nenhum
+        node_limit = self.node_budget if self.node_pool is None else self.nodes
+        self.set_limits(None if self.time_budget is None else start + self.time_budget, node_limit)
+        try:
+            while depth <= max_depth:
+                self.root_best, self.root_searched = None, set()
+                try:
+                    result = self.search(game, depth=depth)
+                except SearchBudgetExceeded:
+                    partial = True
+                    if self.root_best is not None and (best is None or best['position'] in self.root_searched):
+                        best = self.root_best
+                    break
+                best = result
+                self.completed_depth = depth
+                depth += 1
+        finally:
+            self.set_limits()
+        if best is not None:
+            best = dict(best, partial=partial)
+        return best
+
+    def heuristic_state(self, state):
+        """
+        Avalia o estado do tabuleiro com base na heurística para determinar a qualidade de uma jogada.
+
+        Args:
+            state (Game): O estado atual do jogo.
+
+        Returns:
+            int: Pontuação heurística do estado.
+        """
+        
+        if state.current_winner == self.letter:  # Vitória da IA
+            if state.debug_mode:
+                state.print_board()
+                print(f"Vencedor: {state.current_winner}, Score: {1 * (state.num_empty_squares() + 1)}")
+            return 1 * (state.num_empty_squares() + 1)
+        elif state.current_winner == ('O' if self.letter == 'X' else 'X'):  # Vitória do adversário
+            if state.debug_mode:
+                state.print_board()
+                print(f"Vencedor: {state.current_winner}, Score: {-1 * (state.num_empty_squares() + 1)}")
+            return -1 * (state.num_empty_squares() + 1)
+        else:
+            # Cada linha com duas peças e a casa restante vazia vale 5 pontos (a favor ou contra)
+            score = 5 * state.threat_count(self.letter) - 5 * state.threat_count('O' if self.letter == 'X' else 'X')
+
+            if state.debug_mode:
+                state.print_board()
+                print(f"Possível futura boa jogada: {score}")
+            
+            return score
+    
+    def dead_draw(self, state):
+        """
+        Verifica se o nó é empate certo: com todas as linhas bloqueadas pelos dois jogadores, qualquer
+        continuação termina empatada com score 0, o mesmo que a heurística dá a um tabuleiro sem ameaças.
+
+        Args:
+            state (Game): O estado atual do jogo.
+
+        Returns:
+            bool: True se o nó pode ser pontuado como empate sem busca.
+        """
+        if not self.draw_detection or not state.is_dead_draw():
+            return False
+        self.dead_draws += 1
+        if state.debug_mode:
+            state.print_board()
+            print("Empate certo: nenhuma linha pode mais ser completada")
+        return True
+
+    def symmetry_of(self, state):
+        """
+        Retorna as simetrias do tabuleiro do jogo, se a simetria estiver ativada.
+
+        Args:
+            state (Game): O estado atual do jogo.
+
+        Returns:
+            Symmetry: As simetrias do tabuleiro, ou None com a simetria desativada.
+        """
+        return symmetry_for(state.rows, state.cols) if self.symmetry else None
+
+    def tt_key(self, state, player):
+        """
+        Calcula a chave da posição na tabela de transposição: o hash de Zobrist da posição ou, com simetria
+        ativada, o da sua forma canônica (ver Game.canonical_key), e os movimentos guardados ficam nas
+        coordenadas canônicas.
+
+        Args:
+            state (Game): O estado atual do jogo.
+            player (str): O jogador da vez ('X' ou 'O').
+
+        Returns:
+            tuple: (chave da posição, índice da transformação canônica ou None sem simetria).
+        """
+        if not self.symmetry:
+            return (state.position_key(), player), None
+        key, transform = state.canonical_key()
+        return (key, player), transform
+
+    def batch_scores(self, state, moves, player):
+        """
+        Avalia em lote, do ponto de vista do computador, as posições resultantes de cada jogada,
+        com os mesmos scores de heuristic_state.
+
+        Args:
+            state (Game): O estado atual do jogo.
+            moves (list): As jogadas a avaliar.
+            player (str): O jogador que faz as jogadas ('X' ou 'O').
+
+        Returns:
+            list: O score de cada jogada, na ordem de `moves`.
+        """
+        evaluator = batch_evaluator(state.rows, state.cols, state.k)
+        self.batch_leaves += len(moves)
+        return evaluator.evaluate_children(evaluator.encode(state), moves, player, self.letter)[2].tolist()
+
+    def batches(self, state, moves, depth, ply):
+        """
+        Decide se um nó é resolvido pela avaliação em lote: com `batch_eval`, no último nível, fora da raiz
+        e com pelo menos BATCH_MIN_MOVES jogadas.
+
+        Args:
+            state (Game): O estado atual do jogo.
+            moves (list): As jogadas do nó.
+            depth (float): Profundidade restante.
+            ply (int): Distância do nó até a raiz da busca.
+
+        Returns:
+            bool: True se o nó deve ser resolvido por batch_node.
+        """
+        return (self.batch_eval and depth == 1 and ply > 0 and len(moves) >= BATCH_MIN_MOVES
+                and not state.debug_mode)
+
+    def batch_node(self, state, moves, player, key, transform, symmetry):
+        """
+        Resolve um nó do último nível avaliando todas as folhas numa única chamada em lote, sem ordenar
+        as jogadas: com muitas jogadas, isso custa menos que a ordenação e as folhas avaliadas uma a uma
+        até o corte. Como nenhuma folha é cortada, o score do nó é exato seja qual for a janela e vai
+        para a tabela de transposição como EXACT.
+
+        Args:
+            state (Game): O estado atual do jogo.
+            moves (list): As jogadas do nó.
+            player (str): O jogador da vez ('X' ou 'O').
+            key (tuple): A chave do nó na tabela de transposição.
+            transform (int): O índice da transformação canônica, ou None sem simetria.
+            symmetry (Symmetry): As simetrias do tabuleiro, ou None sem simetria.
+
+        Returns:
+            dict: A 'position' da melhor jogada e a 'score' do ponto de vista do computador.
+        """
+        scores = self.batch_scores(state, moves, player)
+        # Cada folha conta como um nó e passa pela verificação do orçamento, como no caminho escalar
+        if self.nodes + len(moves) < self.next_check:
+            self.nodes += len(moves)
+        else:
+            for _ in moves:
+                self.nodes += 1
+                if self.nodes >= self.next_check:
+                    self.check_budget()
+        pick = max if player == self.letter else min
+        index = pick(range(len(moves)), key=scores.__getitem__)
+        best = {'position': moves[index], 'score': scores[index]}
+        move = best['position'] if transform is None else symmetry.to_canonical(best['position'], transform)
+        self.tt.store(key, best['score'], move, 1, EXACT)
+        return best
+
+    def minimax(self, state, player, depth=math.inf, alpha=-math.inf, beta=math.inf, ply=0):
+        """
+        Implementa o algoritmo Minimax com poda alfa-beta para determinar o melhor movimento para o computador.
+
+        Args:
+            state (Game): O estado atual do jogo.
+            player (str): O jogador atual ('X' ou 'O').
+            depth (int, opcional): Profundidade máxima da árvore de decisão. Default é infinito.
+            alpha (float, opcional): Valor alpha para poda alfa-beta. Default é -infinito.
+            beta (float, opcional): Valor beta para poda alfa-beta. Default é infinito.
+            ply (int, opcional): Distância do nó até a raiz da busca. Default é 0 (raiz).
+
+        Returns:
+            dict: Um dicionário contendo a 'position' do melhor movimento e a 'score' correspondente.
+        """
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self.check_budget()
+        max_player = self.letter
+        other_player = 'O' if player == 'X' else 'X'
+
+        # Caso base: verifica se houve um vencedor ou se o jogo está terminado
+        if state.current_winner or not state.empty_squares() or depth == 0:
+            return {'position': None, 'score': self.heuristic_state(state)}
+        if ply > 0 and self.dead_draw(state):
+            return {'position': None, 'score': 0}
+
+        # Consulta a tabela de transposição: a entrada só vale se foi buscada com profundidade suficiente
+        # e se o seu limite já basta para decidir o nó dentro da janela (alpha, beta).
+        # A raiz é sempre buscada, para que a jogada escolhida siga a ordem dos movimentos.
+        symmetry = self.symmetry_of(state)
+        key, transform = self.tt_key(state, player)
+        entry = self.tt.lookup(key)
+        if entry is not None and entry.depth >= depth and ply > 0:
+            if (entry.flag == EXACT
+                    or (entry.flag == LOWER and entry.score >= beta)
+                    or (entry.flag == UPPER and entry.score <= alpha)):
+                self.tt.cutoffs += 1
+                move = entry.move if transform is None else symmetry.from_canonical(entry.move, transform)
+                return {'position': move, 'score': entry.score}
+        alpha_orig, beta_orig = alpha, beta
+
+        # Inicializa o melhor movimento
+        if player == max_player:
+            best = {'position': None, 'score': -math.inf}
+        else:
+            best = {'position': None, 'score': math.inf}
+
+        moves = state.available_moves()
+        # No último nível, com jogadas suficientes, o nó é resolvido por uma única avaliação em lote das folhas
+        if self.batches(state, moves, depth, ply):
+            return self.batch_node(state, moves, player, key, transform, symmetry)
+        # Na raiz, jogadas equivalentes por simetria têm o mesmo valor: basta buscar a primeira de cada classe
+        if ply == 0 and symmetry is not None:
+            moves = symmetry.unique_moves(state.board, moves)
+        # Ordena as jogadas para antecipar os cortes alfa-beta; a melhor jogada guardada na tabela
+        # (por exemplo, da iteração anterior do aprofundamento iterativo) é tentada primeiro
+        if self.ordering is not None:
+            tt_move = None
+            if entry is not None:
+                tt_move = entry.move if transform is None else symmetry.from_canonical(entry.move, transform)
+            moves = self.ordering.order(state, moves, player, tt_move, ply)
+
+        for index, possible_move in enumerate(moves):
+            # Faz o movimento, simula o jogo para o jogador adversário e desfaz o movimento ao sair do bloco
+            with state.push(possible_move, player):
+                sim_score = self.minimax(state, other_player, depth - 1, alpha, beta, ply + 1)
+
+            sim_score['position'] = possible_move
+            if ply == 0:
+                self.record_root_move(possible_move, sim_score['score'], alpha, beta)
+
+            if player == max_player:
+                if sim_score['score'] > best['score']:
+                    best = sim_score
+                alpha = max(alpha, best['score'])
+            else:
+                if sim_score['score'] < best['score']:
+                    best = sim_score
+                beta = min(beta, best['score'])
+                
+
+            # Poda alfa-beta
+            if beta <= alpha:
+                if state.debug_mode:
+                    print(f"Poda: alpha={alpha}, beta={beta}, cortando ramos")  
+                self.cutoffs += 1
+                if index == 0:
+                    self.first_move_cutoffs += 1
+                if self.ordering is not None:
+                    self.ordering.record_cutoff(state, player, possible_move, ply, depth)
+                break
+
+        # Guarda o resultado com o tipo de limite em relação à janela original
+        if best['score'] <= alpha_orig:
+            flag = UPPER
+        elif best['score'] >= beta_orig:
+            flag = LOWER
+        else:
+            flag = EXACT
+        move = best['position'] if transform is None else symmetry.to_canonical(best['position'], transform)
+        self.tt.store(key, best['score'], move, depth, flag)
+
+        #Retorna o melhor valor, para o estado ou para a jogada.
+        return best
+
+    def minimax_stack(self, state, player, depth=math.inf, alpha=-math.inf, beta=math.inf, ply=0):
+        """
+        O mesmo minimax com poda alfa-beta, sem recursão: cada nó em aberto é um quadro numa pilha
+        explícita, com a janela, as jogadas e o índice da próxima jogada. A ordem das jogadas, as consultas
+        e gravações na tabela de transposição, os cortes e os contadores são os do minimax recursivo,
+        então o resultado e o número de nós são idênticos; a profundidade da busca deixa de depender
+        do limite de recursão do Python.
+
+        Args:
+            state (Game): O estado atual do jogo.
+            player (str): O jogador atual ('X' ou 'O').
+            depth (int, opcional): Profundidade máxima da árvore de decisão. Default é infinito.
+            alpha (float, opcional): Valor alpha para poda alfa-beta. Default é -infinito.
+            beta (float, opcional): Valor beta para poda alfa-beta. Default é infinito.
+            ply (int, opcional): Distância do nó até a raiz da busca. Default é 0 (raiz).
+
+        Returns:
+            dict: Um dicionário contendo a 'position' do melhor movimento e a 'score' correspondente.
+        """
+        max_player = self.letter
+        base = len(state.move_stack)
+        stack = []
+        result = self.push_frame(state, stack, player, depth, alpha, beta, ply)
+        try:
+            while stack:
+                frame = stack[-1]
+                if result is not None:
+                    # O filho terminou: desfaz a jogada e atualiza o nó, como no corpo do laço do minimax
+                    index = frame['index']
+                    possible_move = frame['moves'][index]
+                    state.pop()
+                    result['position'] = possible_move
+                    if frame['ply'] == 0:
+                        self.record_root_move(possible_move, result['score'], frame['alpha'], frame['beta'])
+
+                    if frame['player'] == max_player:
+                        if result['score'] > frame['best']['score']:
+                            frame['best'] = result
+                        frame['alpha'] = max(frame['alpha'], frame['best']['score'])
+                    else:
+                        if result['score'] < frame['best']['score']:
+                            frame['best'] = result
+                        frame['beta'] = min(frame['beta'], frame['best']['score'])
+
+                    # Poda alfa-beta
+                    done = frame['beta'] <= frame['alpha']
+                    if done:
+                        if state.debug_mode:
+                            print(f"Poda: alpha={frame['alpha']}, beta={frame['beta']}, cortando ramos")
+                        self.cutoffs += 1
+                        if index == 0:
+                            self.first_move_cutoffs += 1
+                        if self.ordering is not None:
+                            self.ordering.record_cutoff(state, frame['player'], possible_move, frame['ply'],
+                                                        frame['depth'])
+                    else:
+                        frame['index'] = index + 1
+                        done = frame['index'] == len(frame['moves'])
+                    if done:
+                        stack.pop()
+                        result = self.finish_frame(frame)
+                        continue
+
+                # Desce para a próxima jogada do nó do topo da pilha
+                player = frame['player']
+                state.push(frame['moves'][frame['index']], player)
+                result = self.push_frame(state, stack, 'O' if player == 'X' else 'X', frame['depth'] - 1,
+                                         frame['alpha'], frame['beta'], frame['ply'] + 1)
+        finally:
+            # Interrompida pelo orçamento, a busca deixa o tabuleiro como o recebeu
+            while len(state.move_stack) > base:
+                state.pop()
+        return result
+
+    def push_frame(self, state, stack, player, depth, alpha, beta, ply):
+        """
+        Entra num nó do minimax_stack: resolve os casos base e os cortes da tabela de transposição,
+        como o início do minimax, ou empilha o quadro do nó com as jogadas já ordenadas.
+
+        Args:
+            state (Game): O estado do jogo no nó.
+            stack (list): A pilha de quadros da busca.
+            player (str): O jogador da vez ('X' ou 'O').
+            depth (float): Profundidade restante.
+            alpha (float): Limite inferior da janela.
+            beta (float): Limite superior da janela.
+            ply (int): Distância do nó até a raiz da busca.
+
+        Returns:
+            dict: O resultado ('position' e 'score') do nó resolvido sem busca, ou None se o quadro foi empilhado.
+        """
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self.check_budget()
+
+        if state.current_winner or not state.empty_squares() or depth == 0:
+            return {'position': None, 'score': self.heuristic_state(state)}
+        if ply > 0 and self.dead_draw(state):
+            return {'position': None, 'score': 0}
+
+        symmetry = self.symmetry_of(state)
+        key, transform = self.tt_key(state, player)
+        entry = self.tt.lookup(key)
+        if entry is not None and entry.depth >= depth and ply > 0:
+            if (entry.flag == EXACT
+                    or (entry.flag == LOWER and entry.score >= beta)
+                    or (entry.flag == UPPER and entry.score <= alpha)):
+                self.tt.cutoffs += 1
+                move = entry.move if transform is None else symmetry.from_canonical(entry.move, transform)
+                return {'position': move, 'score': entry.score}
+
+        moves = state.available_moves()
+        if self.batches(state, moves, depth, ply):
+            return self.batch_node(state, moves, player, key, transform, symmetry)
+        if ply == 0 and symmetry is not None:
+            moves = symmetry.unique_moves(state.board, moves)
+        if self.ordering is not None:
+            tt_move = None
+            if entry is not None:
+                tt_move = entry.move if transform is None else symmetry.from_canonical(entry.move, transform)
+            moves = self.ordering.order(state, moves, player, tt_move, ply)
+
+        stack.append({
+            'player': player, 'depth': depth, 'alpha': alpha, 'beta': beta, 'ply': ply,
+            'alpha_orig': alpha, 'beta_orig': beta,
+            'best': {'position': None, 'score': -math.inf if player == self.letter else math.inf},
+            'moves': moves, 'index': 0,
+            'key': key, 'transform': transform, 'symmetry': symmetry,
+        })
+        return None
+
+    def finish_frame(self, frame):
+        """
+        Fecha um nó do minimax_stack: guarda o resultado na tabela de transposição, como o fim do minimax.
+
+        Args:
+            frame (dict): O quadro do nó.
+
+        Returns:
+            dict: O melhor resultado do nó ('position' e 'score').
+        """
+        best = frame['best']
+        if best['score'] <= frame['alpha_orig']:
+            flag = UPPER
+        elif best['score'] >= frame['beta_orig']:
+            flag = LOWER
+        else:
+            flag = EXACT
+        transform = frame['transform']
+        move = best['position'] if transform is None else frame['symmetry'].to_canonical(best['position'], transform)
+        self.tt.store(frame['key'], best['score'], move, frame['depth'], flag)
+        return best
+
+    def pvs(self, state, player, depth=math.inf, alpha=-math.inf, beta=math.inf, ply=0):
+        """
+        Principal Variation Search (NegaScout) em forma negamax: a primeira jogada de cada nó é buscada com
+        a janela (alpha, beta) completa e as demais com janela nula, só para provar que não superam alpha.
+        Quando uma delas falha alto, é buscada de novo com a janela completa.
+
+        Os scores são do ponto de vista do jogador da vez; na tabela de transposição são guardados do
+        ponto de vista do computador, como no minimax, para que os dois algoritmos compartilhem a tabela.
+
+        Args:
+            state (Game): O estado atual do jogo.
+            player (str): O jogador atual ('X' ou 'O').
+            depth (int, opcional): Profundidade máxima da árvore de decisão. Default é infinito.
+            alpha (float, opcional): Limite inferior da janela. Default é -infinito.
+            beta (float, opcional): Limite superior da janela. Default é infinito.
+            ply (int, opcional): Distância do nó até a raiz da busca. Default é 0 (raiz).
+
+        Returns:
+            dict: Um dicionário contendo a 'position' do melhor movimento e a 'score' para o jogador da vez.
+        """
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self.check_budget()
+        other_player = 'O' if player == 'X' else 'X'
+        sign = 1 if player == self.letter else -1
+
+        # Caso base: verifica se houve um vencedor ou se o jogo está terminado
+        if state.current_winner or not state.empty_squares() or depth == 0:
+            return {'position': None, 'score': sign * self.heuristic_state(state)}
+        if ply > 0 and self.dead_draw(state):
+            return {'position': None, 'score': 0}
+
+        # Consulta a tabela de transposição, convertendo o score e o limite para o jogador da vez
+        symmetry = self.symmetry_of(state)
+        key, transform = self.tt_key(state, player)
+        entry = self.tt.lookup(key)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry.move if transform is None else symmetry.from_canonical(entry.move, transform)
+            if entry.depth >= depth and ply > 0:
+                score = sign * entry.score
+                flag = entry.flag if sign == 1 else FLIPPED[entry.flag]
+                if (flag == EXACT
+                        or (flag == LOWER and score >= beta)
+                        or (flag == UPPER and score <= alpha)):
+                    self.tt.cutoffs += 1
+                    return {'position': tt_move, 'score': score}
+        alpha_orig = alpha
+
+        moves = state.available_moves()
+        if ply == 0 and symmetry is not None:
+            moves = symmetry.unique_moves(state.board, moves)
+        if self.ordering is not None:
+            moves = self.ordering.order(state, moves, player, tt_move, ply)
+
+        best = {'position': None, 'score': -math.inf}
+        for index, possible_move in enumerate(moves):
+            with state.push(possible_move, player):
+                if index == 0:
+                    score = -self.pvs(state, other_player, depth - 1, -beta, -alpha, ply + 1)['score']
+                else:
+                    # Janela nula: os scores são inteiros, então (alpha, alpha + 1) só responde se a jogada supera alpha
+                    score = -self.pvs(state, other_player, depth - 1, -alpha - 1, -alpha, ply + 1)['score']
+                    if alpha < score < beta:
+                        self.re_searches += 1
+                        score = -self.pvs(state, other_player, depth - 1, -beta, -score, ply + 1)['score']
+
+            if ply == 0:
+                self.record_root_move(possible_move, score, alpha, beta)
+            if score > best['score']:
+                best = {'position': possible_move, 'score': score}
+            alpha = max(alpha, score)
+
+            # Poda alfa-beta
+            if alpha >= beta:
+                if state.debug_mode:
+                    print(f"Poda: alpha={alpha}, beta={beta}, cortando ramos")
+                self.cutoffs += 1
+                if index == 0:
+                    self.first_move_cutoffs += 1
+                if self.ordering is not None:
+                    self.ordering.record_cutoff(state, player, possible_move, ply, depth)
+                break
+
+        # Guarda o resultado do ponto de vista do computador
+        if best['score'] <= alpha_orig:
+            flag = UPPER
+        elif best['score'] >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        if sign == -1:
+            flag = FLIPPED[flag]
+        move = best['position'] if transform is None else symmetry.to_canonical(best['position'], transform)
+        self.tt.store(key, sign * best['score'], move, depth, flag)
+
+        return best
+
+    def mtdf(self, game, depth=math.inf, guess=0):
+        """
+        MTD(f): converge para o valor da posição com uma série de buscas de janela zero do minimax,
+        que guarda os limites de cada busca na tabela de transposição e os reaproveita nas seguintes.
+
+        Cada busca com janela (beta - 1, beta) só responde se o valor é menor que beta (falha baixa,
+        novo limite superior) ou pelo menos beta (falha alta, novo limite inferior); a busca termina
+        quando os limites se encontram.
+
+        Args:
+            game (Game): O estado atual do jogo.
+            depth (float, opcional): Profundidade máxima. Default é infinito.
+            guess (int, opcional): Estimativa inicial do valor, por exemplo o da iteração anterior. Default é 0.
+
+        Returns:
+            dict: A 'position' da melhor jogada e a 'score' do ponto de vista do computador.
+        """
+        score = guess
+        lower, upper = -math.inf, math.inf
+        best = None
+        while lower < upper:
+            beta = max(score, lower + 1)
+            result = self.minimax(game, self.letter, depth, beta - 1, beta)
+            self.mtdf_passes += 1
+            score = result['score']
+            if score < beta:
+                upper = score
+            else:
+                # Só uma falha alta prova que a jogada alcança o valor; a melhor jogada vem dessas buscas
+                lower = score
+                best = result
+        return {'position': best['position'], 'score': score}
@@ -1,98 +1,402 @@
-class Game:
-    def __init__(self, state):
-        """
-        Inicializa o tabuleiro com 9 espaços vazios e define o estado de depuração.
-
-        Args:
-            state (str): Define se o modo de depuração está ativado ('1' para True, qualquer outra coisa para False).
-        """
-        self.board = [' ' for _ in range(9)]  # Tabuleiro 3x3
-        self.current_winner = None  # Monitorar o vencedor
-        self.debug_mode = True if state == '1' else False
-
-    def print_board(self):
-        """
-        Imprime o estado atual do tabuleiro no console. O tabuleiro é impresso em formato 3x3.
-        """
-        for row in [self.board[i * 3:(i + 1) * 3] for i in range(3)]:
-            print('| ' + ' | '.join(row) + ' |')
-
-    def available_moves(self):
-        """
-        Retorna uma lista de índices dos espaços disponíveis no tabuleiro.
-
-        Returns:
-            list: Lista de índices dos espaços vazios.
-        """
-        return [i for i, spot in enumerate(self.board) if spot == ' ']
-
-    def empty_squares(self):
-        """
-        Verifica se há espaços vazios no tabuleiro.
-
-        Returns:
-            bool: True se houver espaços vazios, False caso contrário.
-        """
-        return ' ' in self.board
-
-    def num_empty_squares(self):
-        """
-        Conta o número de espaços vazios no tabuleiro.
-
-        Returns:
-            int: O número de espaços vazios.
-        """
-        return self.board.count(' ')
-
-    def make_move(self, square, letter):
-        """
-        Faz uma jogada no tabuleiro se o espaço especificado estiver vazio. Atualiza o vencedor atual se a jogada resultar em vitória.
-
-        Args:
-            square (int): O índice do espaço onde a jogada será feita.
-            letter (str): A letra do jogador ('X' ou 'O') que fará a jogada.
-
-        Returns:
-            bool: True se a jogada foi bem-sucedida, False se o espaço já estiver ocupado.
-        """
-        if self.board[square] == ' ':
-            self.board[square] = letter
-            if self.winner(square, letter):
-                self.current_winner = letter
-            return True
-        return False
-
-    def winner(self, square, letter):
-        """
-        Verifica se a jogada feita resultou em uma vitória para o jogador com a letra fornecida.
-
-        Args:
-            square (int): O índice do espaço onde a jogada foi feita.
-            letter (str): A letra do jogador ('X' ou 'O') que fez a jogada.
-
-        Returns:
-            bool: True se a jogada resultou em vitória, False caso contrário.
-        """
-        # Verifica a linha onde o espaço está localizado
-        row_ind = square // 3
-        row = self.board[row_ind * 3:(row_ind + 1) * 3]
-        if all([spot == letter for spot in row]):
-            return True
-
-        # Verifica a coluna onde o espaço está localizado
-        col_ind = square % 3
-        column = [self.board[col_ind + i * 3] for i in range(3)]
-        if all([spot == letter for spot in column]):
-            return True
-
-        # Verifica as diagonais, se o espaço estiver em uma posição de diagonal
-        if square % 2 == 0:
-            diagonal1 = [self.board[i] for i in [0, 4, 8]]
-            if all([spot == letter for spot in diagonal1]):
-                return True
-
-            diagonal2 = [self.board[i] for i in [2, 4, 6]]
-            if all([spot == letter for spot in diagonal2]):
-                return True
-
-        return False
+import random
+import struct
+from functools import lru_cache
+
+from packs.Symmetry import *
+
+
+@lru_cache(maxsize=None)
+def line_tables(rows=3, cols=3, k=3):
+    """
+    Pré-calcula as linhas vencedoras de um tabuleiro rows x cols com k em linha: todos os segmentos
+    de k casas na horizontal, na vertical e nas duas diagonais.
+
+    Args:
+        rows (int): Número de linhas do tabuleiro.
+        cols (int): Número de colunas do tabuleiro.
+        k (int): Número de peças alinhadas necessárias para vencer.
+
+    Returns:
+        tuple: (linhas, cada uma como tupla de casas; para cada casa, os índices das linhas que passam por ela).
+    """
+    lines = []
+    for r in range(rows):
+        for c in range(cols):
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                if 0 <= end_r < rows and 0 <= end_c < cols:
+                    lines.append(tuple((r + dr * i) * cols + c + dc * i for i in range(k)))
+
+    cell_lines = [[] for _ in range(rows * cols)]
+    for l, line in enumerate(lines):
+        for square in line:
+            cell_lines[square].append(l)
+    return tuple(lines), tuple(tuple(indices) for indices in cell_lines)
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(seed=None, cells=9):
+    """
+    Gera as chaves de Zobrist: um número aleatório de 64 bits por (casa, peça) e um para o jogador da vez.
+
+    As chaves ficam em cache, então todos os jogos do processo com a mesma semente compartilham a mesma
+    tabela. Sem semente, as chaves são aleatórias a cada processo; com semente, são sempre as mesmas,
+    o que permite persistir caches indexados pelo hash.
+
+    Args:
+        seed (int, opcional): Semente do gerador. Default é None (chaves aleatórias).
+        cells (int, opcional): Número de casas do tabuleiro. Default é 9.
+
+    Returns:
+        dict: Chaves por letra ('X' e 'O', uma por casa) e a chave 'side' do jogador da vez.
+    """
+    rng = random.Random(seed) if seed is not None else random.SystemRandom()
+    return {
+        'X': tuple(rng.getrandbits(64) for _ in range(cells)),
+        'O': tuple(rng.getrandbits(64) for _ in range(cells)),
+        'side': rng.getrandbits(64),
+    }
+
+
+@lru_cache(maxsize=None)
+def symmetric_zobrist_keys(seed=None, rows=3, cols=3):
+    """
+    Gera as chaves de Zobrist de cada simetria do tabuleiro: para cada (peça, casa), a chave da casa
+    para onde cada transformação leva a peça. As chaves das transformações ficam empacotadas num único
+    inteiro, 64 bits por transformação, então um só XOR por jogada mantém o hash de todos os tabuleiros
+    transformados, sem montá-los.
+
+    Args:
+        seed (int, opcional): Semente das chaves de Zobrist. Default é None (as chaves do processo).
+        rows (int, opcional): Número de linhas do tabuleiro. Default é 3.
+        cols (int, opcional): Número de colunas do tabuleiro. Default é 3.
+
+    Returns:
+        dict: Por letra ('X' e 'O'), a chave empacotada de cada casa, com a transformação t nos bits
+            64t a 64t + 63 (na ordem de Symmetry.transforms), e o struct.Struct 'layout' que desempacota
+            os hashes.
+    """
+    keys = zobrist_keys(seed, rows * cols)
+    inverses = symmetry_for(rows, cols).inverses
+    symmetric = {letter: tuple(sum(keys[letter][inverse[square]] << (64 * t) for t, inverse in enumerate(inverses))
+                               for square in range(rows * cols))
+                 for letter in ('X', 'O')}
+    symmetric['layout'] = struct.Struct(f'<{len(inverses)}Q')
+    return symmetric
+
+
+class Game:
+    def __init__(self, state, rows=3, cols=3, k=3, zobrist_seed=None):
+        """
+        Inicializa um tabuleiro rows x cols vazio, em que vence quem alinhar k peças, e define o estado de depuração.
+
+        Args:
+            state (str): Define se o modo de depuração está ativado ('1' para True, qualquer outra coisa para False).
+            rows (int, opcional): Número de linhas do tabuleiro. Default é 3.
+            cols (int, opcional): Número de colunas do tabuleiro. Default é 3.
+            k (int, opcional): Número de peças alinhadas para vencer. Default é 3.
+            zobrist_seed (int, opcional): Semente das chaves de Zobrist, para hashes estáveis entre processos.
+
+        Raises:
+            ValueError: Se k não couber no tabuleiro.
+        """
+        if not 2 <= k <= max(rows, cols):
+            raise ValueError(f"k={k} não cabe em um tabuleiro {rows}x{cols}")
+        self.rows, self.cols, self.k = rows, cols, k
+        self.size = rows * cols
+        self.board = [' ' for _ in range(self.size)]  # Tabuleiro rows x cols
+        self.current_winner = None  # Monitorar o vencedor
+        self.debug_mode = True if state == '1' else False
+
+        # Linhas vencedoras e, para cada casa, as linhas que passam por ela.
+        self.lines, self.cell_lines = line_tables(rows, cols, k)
+
+        # Contadores incrementais: peças de cada jogador em cada linha e quantas linhas
+        # têm k - 1 peças do jogador e a casa restante vazia (ameaças de vitória).
+        self.line_counts = {'X': [0] * len(self.lines), 'O': [0] * len(self.lines)}
+        self.threats = {'X': 0, 'O': 0}
+        # Linhas que cada jogador ainda pode completar (sem nenhuma peça do adversário); quando as duas
+        # contagens chegam a zero, a partida é empate certo, mesmo com casas vazias.
+        self.open_lines = {'X': len(self.lines), 'O': len(self.lines)}
+
+        # Pilha de jogadas feitas: (casa, letra, vencedor anterior), usada por undo_move.
+        self.move_stack = []
+
+        # Hash de Zobrist da posição, atualizado por XOR a cada jogada e desfeita.
+        self.zobrist = zobrist_keys(zobrist_seed, self.size)
+        self._hash = 0
+        # Hashes de Zobrist das transformações simétricas do tabuleiro, sem o jogador da vez, empacotados
+        # num único inteiro (ver canonical_key).
+        self.symmetric_keys = symmetric_zobrist_keys(zobrist_seed, rows, cols)
+        self.symmetric_hash = 0
+
+    @property
+    def hash(self):
+        """
+        Hash de Zobrist da posição atual (peças e jogador da vez).
+
+        Returns:
+            int: O hash de 64 bits.
+        """
+        return self._hash
+
+    def print_board(self):
+        """
+        Imprime o estado atual do tabuleiro no console, uma linha do tabuleiro por linha impressa.
+        """
+        for row in [self.board[i * self.cols:(i + 1) * self.cols] for i in range(self.rows)]:
+            print('| ' + ' | '.join(row) + ' |')
+
+    def available_moves(self):
+        """
+        Retorna uma lista de índices dos espaços disponíveis no tabuleiro.
+
+        Returns:
+            list: Lista de índices dos espaços vazios.
+        """
+        return [i for i, spot in enumerate(self.board) if spot == ' ']
+
+    def empty_squares(self):
+        """
+        Verifica se há espaços vazios no tabuleiro.
+
+        Returns:
+            bool: True se houver espaços vazios, False caso contrário.
+        """
+        return ' ' in self.board
+
+    def num_empty_squares(self):
+        """
+        Conta o número de espaços vazios no tabuleiro.
+
+        Returns:
+            int: O número de espaços vazios.
+        """
+        return self.board.count(' ')
+
+    def position_key(self):
+        """
+        Retorna uma chave imutável que identifica a posição atual, usada pelas tabelas de transposição.
+
+        Returns:
+            int: O hash de Zobrist da posição.
+        """
+        return self._hash
+
+    def canonical_key(self):
+        """
+        Retorna o hash de Zobrist da forma canônica da posição: o menor entre os hashes das suas
+        transformações simétricas, mantidos a cada jogada, sem montar nenhum tabuleiro transformado.
+        Posições simétricas têm os mesmos hashes transformados e, portanto, a mesma chave.
+
+        Returns:
+            tuple: (hash canônico, índice da transformação que o gera, como em Symmetry.canonical).
+        """
+        layout = self.symmetric_keys['layout']
+        hashes = layout.unpack(self.symmetric_hash.to_bytes(layout.size, 'little'))
+        key = min(hashes)
+        return key, hashes.index(key)
+
+    def make_move(self, square, letter):
+        """
+        Faz uma jogada no tabuleiro se o espaço especificado estiver vazio. Atualiza o vencedor atual se a jogada resultar em vitória.
+
+        Args:
+            square (int): O índice do espaço onde a jogada será feita.
+            letter (str): A letra do jogador ('X' ou 'O') que fará a jogada.
+
+        Returns:
+            bool: True se a jogada foi bem-sucedida, False se o espaço já estiver ocupado.
+        """
+        if self.board[square] == ' ':
+            self.move_stack.append((square, letter, self.current_winner))
+            self.board[square] = letter
+            self.update_lines(square, letter, 1)
+            self._hash ^= self.zobrist[letter][square] ^ self.zobrist['side']
+            self.symmetric_hash ^= self.symmetric_keys[letter][square]
+            if self.winner(square, letter):
+                self.current_winner = letter
+            return True
+        return False
+
+    def undo_move(self):
+        """
+        Desfaz a última jogada da pilha em O(1), restaurando o tabuleiro, os contadores de linha e o vencedor.
+
+        Returns:
+            int: O índice do espaço esvaziado.
+
+        Raises:
+            IndexError: Se não houver jogada para desfazer.
+        """
+        square, letter, previous_winner = self.move_stack.pop()
+        self.board[square] = ' '
+        self.update_lines(square, letter, -1)
+        self._hash ^= self.zobrist[letter][square] ^ self.zobrist['side']
+        self.symmetric_hash ^= self.symmetric_keys[letter][square]
+        self.current_winner = previous_winner
+        return square
+
+    def push(self, square, letter):
+        """
+        Faz a jogada e retorna o próprio jogo para uso em um bloco `with`, que a desfaz ao sair:
+
+            with game.push(square, letter):
+                ...
+
+        Fora de um bloco `with`, a jogada é desfeita com `pop`.
+
+        Args:
+            square (int): O índice do espaço onde a jogada será feita.
+            letter (str): A letra do jogador ('X' ou 'O') que fará a jogada.
+
+        Returns:
+            Game: O próprio jogo.
+
+        Raises:
+            ValueError: Se o espaço já estiver ocupado.
+        """
+        if not self.make_move(square, letter):
+            raise ValueError(f"Casa {square} já está ocupada")
+        return self
+
+    def pop(self):
+        """
+        Desfaz a última jogada feita com `push` (ou `make_move`).
+
+        Returns:
+            int: O índice do espaço esvaziado.
+        """
+        return self.undo_move()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.undo_move()
+        return False
+
+    def copy(self):
+        """
+        Cria um jogo independente na mesma posição, refazendo as jogadas da pilha na mesma ordem.
+
+        Returns:
+            Game: A cópia, do mesmo tipo do jogo original e com as mesmas chaves de Zobrist.
+        """
+        game = type(self)('1' if self.debug_mode else '0', self.rows, self.cols, self.k)
+        game.zobrist = self.zobrist
+        game.symmetric_keys = self.symmetric_keys
+        for square, letter, _ in self.move_stack:
+            game.make_move(square, letter)
+        return game
+
+    def update_lines(self, square, letter, delta):
+        """
+        Atualiza os contadores das linhas que passam pela casa, o número de ameaças de cada jogador
+        e o número de linhas que o adversário ainda pode completar.
+
+        Args:
+            square (int): O índice do espaço alterado.
+            letter (str): A letra colocada ou retirada ('X' ou 'O').
+            delta (int): 1 ao colocar a peça, -1 ao retirar.
+        """
+        other = 'O' if letter == 'X' else 'X'
+        mine, theirs = self.line_counts[letter], self.line_counts[other]
+        almost = self.k - 1
+        for l in self.cell_lines[square]:
+            # A primeira peça do jogador na linha a fecha para o adversário; retirar a última a reabre
+            if mine[l] == (0 if delta > 0 else 1):
+                self.open_lines[other] -= delta
+            if theirs[l] == 0:
+                # Sem peças do adversário, a linha é ameaça do jogador quando tem exatamente k - 1 peças dele
+                if mine[l] == almost:
+                    self.threats[letter] -= 1
+                mine[l] += delta
+                if mine[l] == almost:
+                    self.threats[letter] += 1
+            else:
+                # A linha com k - 1 peças do adversário deixa de ser (ou volta a ser) ameaça dele
+                if theirs[l] == almost and mine[l] == (0 if delta > 0 else 1):
+                    self.threats[other] -= delta
+                mine[l] += delta
+
+    def threat_count(self, letter):
+        """
+        Retorna quantas linhas têm k - 1 peças do jogador e a casa restante vazia.
+
+        Args:
+            letter (str): A letra do jogador ('X' ou 'O').
+
+        Returns:
+            int: O número de ameaças de vitória do jogador.
+        """
+        return self.threats[letter]
+
+    def is_dead_draw(self):
+        """
+        Verifica se nenhuma linha ainda pode ser completada: todas têm peças dos dois jogadores.
+        A partida termina empatada, qualquer que seja a sequência das jogadas restantes.
+
+        Returns:
+            bool: True se a posição é empate certo.
+        """
+        return not self.open_lines['X'] and not self.open_lines['O']
+
+    def is_winning_move(self, square, letter):
+        """
+        Verifica, sem jogar, se ocupar a casa vazia daria a vitória ao jogador: basta que uma das linhas
+        que passam por ela já tenha k - 1 peças dele.
+
+        Args:
+            square (int): O índice de um espaço vazio.
+            letter (str): A letra do jogador ('X' ou 'O').
+
+        Returns:
+            bool: True se a jogada venceria a partida.
+        """
+        counts = self.line_counts[letter]
+        almost = self.k - 1
+        for l in self.cell_lines[square]:
+            if counts[l] == almost:
+                return True
+        return False
+
+    def winning_squares(self, letter):
+        """
+        Lista as casas vazias que dariam a vitória imediata ao jogador, a partir dos contadores de linha:
+        em cada linha com k - 1 peças dele e nenhuma do adversário, a casa que falta.
+
+        Args:
+            letter (str): A letra do jogador ('X' ou 'O').
+
+        Returns:
+            list: As casas vencedoras, em ordem crescente e sem repetição.
+        """
+        if not self.threats[letter]:
+            return []
+        other = 'O' if letter == 'X' else 'X'
+        mine, theirs = self.line_counts[letter], self.line_counts[other]
+        almost = self.k - 1
+        squares = set()
+        for l, line in enumerate(self.lines):
+            if mine[l] == almost and theirs[l] == 0:
+                squares.update(square for square in line if self.board[square] == ' ')
+        return sorted(squares)
+
+    def winner(self, square, letter):
+        """
+        Verifica se a jogada feita resultou em uma vitória para o jogador com a letra fornecida.
+
+        Args:
+            square (int): O índice do espaço onde a jogada foi feita.
+            letter (str): A letra do jogador ('X' ou 'O') que fez a jogada.
+
+        Returns:
+            bool: True se a jogada resultou em vitória, False caso contrário.
+        """
+        # Basta verificar as linhas que passam pela casa jogada
+        counts = self.line_counts[letter]
+        for l in self.cell_lines[square]:
+            if counts[l] == self.k:
+                return True
+        return False
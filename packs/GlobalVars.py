@@ -1,16 +1,34 @@
-# Definindo variáveis globais para as cores
-
-#Menu
-MENU_BUTTON_FONT = ('Arial', 14) # Fonte dos botões do menu
-MENU_BUTTON_COLOR = "#15B1A3" # Cor de fundo dos botões do menu
-MENU_BUTTON_HOVER_COLOR = "#08423D" # Cor de fundo dos botões do menu ao passar o mouse
-BACKGROUND_COLOR = "#0AB16F"  # Cor de fundo
-
-#Tabuleiro
-BACKGROUND_COLOR_BOARD = "#000000" #Cor de bundo do tabuleiro
-BUTTON_COLOR_X = "#FF0000"    # Cor para X
-BUTTON_COLOR_O = "#0000FF"    # Cor para O
-BUTTON_COLOR_DEFAULT = "#DDDDDD"  # Cor padrão dos botões
-STATUS_COLOR = "#000000"      # Cor do texto de status
-BUTTON_FONT = ('Arial', 20)   # Fonte dos botões
-STATUS_FONT = ('Arial', 14)   # Fonte do status
+# Definindo variáveis globais para as cores
+
+#Menu
+MENU_BUTTON_FONT = ('Arial', 14) # Fonte dos botões do menu
+MENU_BUTTON_COLOR = "#15B1A3" # Cor de fundo dos botões do menu
+MENU_BUTTON_HOVER_COLOR = "#08423D" # Cor de fundo dos botões do menu ao passar o mouse
+BACKGROUND_COLOR = "#0AB16F"  # Cor de fundo
+
+#Tabuleiro
+BACKGROUND_COLOR_BOARD = "#000000" #Cor de bundo do tabuleiro
+BUTTON_COLOR_X = "#FF0000"    # Cor para X
+BUTTON_COLOR_O = "#0000FF"    # Cor para O
+BUTTON_COLOR_DEFAULT = "#DDDDDD"  # Cor padrão dos botões
+STATUS_COLOR = "#000000"      # Cor do texto de status
+BUTTON_FONT = ('Arial', 20)   # Fonte dos botões
+STATUS_FONT = ('Arial', 14)   # Fonte do status
+
+#Tamanhos de tabuleiro disponíveis no menu: (linhas, colunas, peças em linha para vencer)
+BOARD_SIZES = {
+    "3x3": (3, 3, 3),
+    "4x4": (4, 4, 4),
+    "5x5 (4 em linha)": (5, 5, 4),
+}
+
+#IA
+AI_TIME_BUDGET = 2.0  # Tempo máximo de pensamento do computador por jogada, em segundos
+# Orçamentos rígidos por dificuldade (argumentos do ComputerPlayer): ao acabar, o computador joga
+# a melhor jogada já buscada por completo
+AI_BUDGETS = {
+    'easy': {},
+    'medium': {'time_budget': 0.5, 'node_budget': 20000},
+    'hard': {'time_budget': AI_TIME_BUDGET, 'node_budget': 1000000},
+}
+AI_ASPIRATION_WINDOWS = (5, 20)  # Meias-larguras das janelas de aspiração, alargadas a cada falha
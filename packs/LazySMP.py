@@ -0,0 +1,131 @@
+import math
+import multiprocessing
+import random
+import threading
+
+from packs.MoveOrdering import *
+from packs.ParallelSearch import *
+
+
+class LazySMPSearch:
+    """
+    Lazy SMP: várias threads fazem o aprofundamento iterativo na mesma raiz e compartilham as entradas da
+    tabela de transposição do jogador, sem nenhuma outra comunicação. O que uma thread guarda na tabela (limites e
+    melhores jogadas) poupa trabalho às outras.
+
+    A thread principal é o próprio jogador. As auxiliares divergem dela de duas formas: metade começa
+    o aprofundamento uma profundidade à frente, e cada uma desempata ao acaso as jogadas de mesma
+    prioridade na ordenação. Todas param juntas, por um threading.Event, quando a thread principal
+    termina ou o orçamento de tempo acaba. O orçamento de nós é um só para todas as threads (ver NodePool):
+    cada uma reserva nós dele aos poucos, e a soma dos nós visitados nunca passa do orçamento. O resultado é o da iteração mais profunda concluída por
+    qualquer thread; num empate de profundidade, vale o da thread principal.
+
+    Atributos:
+        player (ComputerPlayer): O jogador cuja busca é dividida entre as threads.
+        threads (int): Número total de threads, contando a principal.
+        seed (int): Semente dos sorteios de desempate das threads auxiliares.
+        thread_nodes (list): Nós visitados por thread na última busca (a principal primeiro).
+        thread_depths (list): Profundidade concluída por thread na última busca.
+    """
+
+    def __init__(self, player, threads, seed=0):
+        """
+        Prepara a busca; os jogadores auxiliares são criados na primeira busca.
+
+        Args:
+            player (ComputerPlayer): O jogador cuja busca é dividida entre as threads.
+            threads (int): Número total de threads, contando a principal.
+            seed (int, opcional): Semente dos sorteios de desempate. Default é 0.
+        """
+        self.player = player
+        self.threads = threads
+        self.seed = seed
+        self.helpers = []
+        self.node_pool = NodePool(multiprocessing.Value('q', 0))
+        self.thread_nodes = []
+        self.thread_depths = []
+
+    def make_helpers(self):
+        """
+        Cria os jogadores das threads auxiliares, com a mesma configuração do jogador e uma vista da
+        tabela de transposição dele (mesmas entradas, contadores próprios), se ainda não existirem.
+        """
+        if self.helpers:
+            return
+        player = self.player
+        for index in range(1, self.threads):
+            helper = type(player)(player.letter, difficulty=player.difficulty, tt_size=0, symmetry=player.symmetry,
+                                  perfect_play=False, move_ordering=player.ordering is not None,
+                                  engine=player.engine, aspiration=player.aspiration,
+                                  draw_detection=player.draw_detection)
+            helper.tt = player.tt.view()
+            if helper.ordering is not None:
+                helper.ordering.rng = random.Random(self.seed + index)
+            self.helpers.append(helper)
+
+    def iterative_deepening(self, game, max_depth=math.inf):
+        """
+        Executa o aprofundamento iterativo em todas as threads até a thread principal terminar.
+
+        Args:
+            game (Game): O estado atual do jogo.
+            max_depth (float, opcional): Profundidade máxima. Default é infinito (até o fim da partida).
+
+        Returns:
+            dict: O resultado ('position', 'score' e 'partial') da iteração mais profunda concluída,
+                ou None se nenhuma jogada foi buscada por completo.
+        """
+        self.make_helpers()
+        player = self.player
+        stop = threading.Event()
+        results = [None] * len(self.helpers)
+        node_pool = None
+        if player.node_budget is not None:
+            node_pool = self.node_pool
+            node_pool.reset(max(player.node_budget - player.nodes, 0))
+
+        def run(index, helper, game):
+            helper.new_search(game)
+            helper.last_score = player.last_score
+            helper.time_budget = player.time_budget
+            helper.node_pool = node_pool
+            helper.stop = stop
+            try:
+                # Metade das auxiliares começa uma profundidade à frente da thread principal
+                result = helper.deepen(game, max_depth, start_depth=1 + (index + 1) % 2)
+            finally:
+                helper.stop = None
+                helper.node_pool = None
+            if result is not None:
+                results[index] = (helper.completed_depth, result)
+
+        # Cada thread busca na sua própria cópia do jogo, já que as jogadas são feitas e desfeitas no tabuleiro
+        workers = [threading.Thread(target=run, args=(index, helper, game.copy()), daemon=True)
+                   for index, helper in enumerate(self.helpers)]
+        for worker in workers:
+            worker.start()
+        player.node_pool = node_pool
+        try:
+            best = player.deepen(game, max_depth)
+        finally:
+            player.node_pool = None
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+        depth = player.completed_depth
+        for entry in results:
+            if entry is not None and entry[0] > depth:
+                depth, best = entry
+        self.thread_nodes = [player.nodes] + [helper.nodes for helper in self.helpers]
+        self.thread_depths = [player.completed_depth] + [helper.completed_depth for helper in self.helpers]
+        player.nodes = sum(self.thread_nodes)
+        player.dead_draws += sum(helper.dead_draws for helper in self.helpers)
+        # Os contadores da tabela do jogador passam a valer para a busca de todas as threads
+        player.tt.hits += sum(helper.tt.hits for helper in self.helpers)
+        player.tt.misses += sum(helper.tt.misses for helper in self.helpers)
+        player.tt.cutoffs += sum(helper.tt.cutoffs for helper in self.helpers)
+        player.completed_depth = depth
+        if best is not None:
+            player.last_score = best['score']
+        return best
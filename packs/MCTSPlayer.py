@@ -0,0 +1,519 @@
+import math
+import multiprocessing
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from packs.Player import *
+
+# Políticas de simulação disponíveis: jogadas aleatórias ou vitória/bloqueio imediato antes do sorteio.
+PLAYOUTS = ('random', 'heuristic')
+
+# Modos de paralelismo com mais de um processo: árvores independentes ou uma árvore com simulações em lote.
+PARALLEL_MODES = ('root', 'tree')
+
+
+def playout(game, player, rng, policy='heuristic'):
+    """
+    Joga uma partida até o fim a partir da posição atual e desfaz as jogadas.
+
+    Args:
+        game (Game): O estado do jogo no início da simulação.
+        player (str): O jogador da vez ('X' ou 'O').
+        rng (random.Random): O gerador dos sorteios.
+        policy (str, opcional): 'random' sorteia todas as jogadas; 'heuristic' (padrão) completa uma
+            vitória ou bloqueia a do adversário antes de sortear.
+
+    Returns:
+        str: A letra do vencedor, ou None em caso de empate.
+    """
+    played = 0
+    while not game.current_winner and game.empty_squares():
+        moves = game.available_moves()
+        move = None
+        if policy == 'heuristic':
+            other = 'O' if player == 'X' else 'X'
+            # Completa a própria vitória ou bloqueia a do adversário, se houver ameaça
+            for letter in (player, other):
+                if game.threat_count(letter):
+                    move = next((square for square in moves if game.is_winning_move(square, letter)), None)
+                    if move is not None:
+                        break
+        if move is None:
+            move = rng.choice(moves)
+        game.make_move(move, player)
+        played += 1
+        player = 'O' if player == 'X' else 'X'
+    winner = game.current_winner
+    for _ in range(played):
+        game.undo_move()
+    return winner
+
+
+def rebuild_game(game_class, rows, cols, k, board):
+    """
+    Recria em outro processo uma posição sem vencedor a partir do tabuleiro. Como a posição não tem
+    linha completa, a ordem em que as peças são recolocadas não importa.
+
+    Returns:
+        Game: O jogo na posição do tabuleiro.
+    """
+    game = game_class('0', rows, cols, k)
+    for square, letter in enumerate(board):
+        if letter != ' ':
+            game.make_move(square, letter)
+    return game
+
+
+def _run_playouts(tasks):
+    """
+    Executa em um processo do pool um lote de simulações do modo 'tree'.
+
+    Args:
+        tasks (list): Tuplas (classe do jogo, linhas, colunas, k, tabuleiro, jogador da vez, política, semente).
+
+    Returns:
+        list: O vencedor de cada simulação (None para empate), na ordem das tarefas.
+    """
+    return [playout(rebuild_game(game_class, rows, cols, k, board), player, random.Random(seed), policy)
+            for game_class, rows, cols, k, board, player, policy, seed in tasks]
+
+
+def _search_tree(task):
+    """
+    Constrói em um processo do pool uma árvore independente do modo 'root'.
+
+    Args:
+        task (tuple): (classe do jogo, linhas, colunas, k, tabuleiro, letra, iterações, tempo, constante
+            de exploração, política, semente).
+
+    Returns:
+        tuple: (lista de (jogada, visitas, valor) dos filhos da raiz, iterações feitas).
+    """
+    game_class, rows, cols, k, board, letter, iterations, time_budget, exploration, policy, seed = task
+    player = MCTSPlayer(letter, iterations=iterations, time_budget=time_budget, exploration=exploration,
+                        playout=policy, seed=seed)
+    player.get_move(rebuild_game(game_class, rows, cols, k, board))
+    first = player.first_child[0]
+    children = range(first, first + player.child_count[0])
+    return [(player.move[child], player.visits[child], player.value[child]) for child in children], player.iterations_done
+
+
+class MCTSPlayer(Player):
+    """
+    Jogador por Monte Carlo Tree Search (MCTS) com seleção UCT: a cada iteração, desce pela árvore
+    escolhendo o filho de maior UCB1, expande a folha, simula uma partida até o fim e propaga o resultado.
+    Ao contrário do minimax, não precisa buscar a árvore inteira, então escala para tabuleiros maiores.
+
+    A árvore fica em forma de estrutura de arrays: cada nó é um índice em arrays paralelos (array.array)
+    de jogada, primeiro filho, número de filhos, visitas e valor, em vez de um objeto Python por nó.
+    Os filhos de um nó são criados juntos e ficam em posições consecutivas.
+
+    Entre as jogadas, a árvore é mantida: se o adversário responder com uma jogada já expandida, a
+    subárvore correspondente vira a nova raiz, com as visitas acumuladas.
+
+    Com `workers` > 1, a busca usa um pool de processos em um de dois modos:
+
+    - 'root': cada processo constrói uma árvore independente, com a sua parte das iterações e a sua
+      semente; as visitas dos filhos da raiz são somadas e vence a jogada mais visitada.
+    - 'tree' (padrão): uma única árvore no processo principal. Um lote de folhas é selecionado com
+      perda virtual (cada nó do caminho ganha uma visita sem recompensa até o resultado chegar), o que
+      espalha o lote por ramos diferentes; as simulações do lote são divididas entre os processos.
+
+    As simulações e árvores dos processos usam sementes derivadas de `seed` e do número de ordem de
+    cada uma, e não do processo que as executa, então o resultado com orçamento de iterações é
+    reproduzível e não depende do número de processos no modo 'tree'.
+
+    Atributos:
+        iterations (int): Número máximo de iterações por jogada (None para usar só o tempo).
+        time_budget (float): Tempo máximo por jogada, em segundos (None para usar só as iterações).
+        exploration (float): Constante de exploração do UCB1.
+        playout (str): Política de simulação ('random' ou 'heuristic').
+        iterations_done (int): Iterações feitas na última jogada.
+        reused_visits (int): Visitas da subárvore reaproveitada no início da última jogada.
+        workers (int): Número de processos da busca paralela.
+        parallel (str): Modo da busca paralela ('root' ou 'tree').
+        batch_size (int): Folhas selecionadas por lote no modo 'tree'.
+        seed (int): Semente mestra das simulações.
+    """
+
+    def __init__(self, letter, iterations=None, time_budget=None, exploration=math.sqrt(2), playout='heuristic',
+                 seed=None, workers=1, parallel='tree', batch_size=64):
+        """
+        Inicializa o jogador MCTS com uma árvore vazia.
+
+        Args:
+            letter (str): A letra do jogador ('X' ou 'O').
+            iterations (int, opcional): Número máximo de iterações por jogada. Sem nenhum orçamento,
+                o padrão é 1000 iterações.
+            time_budget (float, opcional): Tempo máximo por jogada, em segundos.
+            exploration (float, opcional): Constante de exploração do UCB1. Default é raiz de 2.
+            playout (str, opcional): 'random' simula com jogadas aleatórias; 'heuristic' (padrão)
+                completa uma vitória ou bloqueia a do adversário antes de sortear.
+            seed (int, opcional): Semente do gerador aleatório, para partidas reproduzíveis.
+            workers (int, opcional): Número de processos da busca. Default é 1 (sem paralelismo).
+            parallel (str, opcional): Modo da busca paralela, 'root' ou 'tree' (padrão).
+            batch_size (int, opcional): Folhas selecionadas por lote no modo 'tree'. Default é 64.
+
+        Raises:
+            ValueError: Se a política de simulação ou o modo de paralelismo não existir.
+        """
+        if playout not in PLAYOUTS:
+            raise ValueError(f"Política de simulação desconhecida: {playout}")
+        if parallel not in PARALLEL_MODES:
+            raise ValueError(f"Modo de paralelismo desconhecido: {parallel}")
+        super().__init__(letter)
+        self.other = 'O' if letter == 'X' else 'X'
+        self.iterations = 1000 if iterations is None and time_budget is None else iterations
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.playout = playout
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+        self.rng = random.Random(self.seed)
+        self.iterations_done = 0
+        self.reused_visits = 0
+        self.workers = workers
+        self.parallel = parallel
+        self.batch_size = batch_size
+        self.executor = None  # Pool de processos, criado na primeira busca paralela
+        self.playouts = 0  # Simulações enviadas ao pool, usadas na semente de cada uma
+        self.searches = 0  # Buscas do modo 'root', usadas nas sementes das árvores
+        self.clear_tree()
+
+    def start(self):
+        """
+        Cria o pool de processos da busca paralela, se `workers` > 1 e ele ainda não existir.
+        """
+        if self.workers > 1 and self.executor is None:
+            self.executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context())
+
+    def close(self):
+        """
+        Encerra o pool de processos da busca paralela, se houver.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def clear_tree(self):
+        """
+        Descarta a árvore, deixando só a raiz.
+        """
+        self.move = array('i')  # Jogada que leva ao nó (-1 na raiz)
+        self.first_child = array('i')  # Índice do primeiro filho (-1 se o nó não foi expandido)
+        self.child_count = array('i')  # Número de filhos
+        self.visits = array('i')  # Visitas ao nó
+        self.value = array('d')  # Soma das recompensas, do ponto de vista de quem fez a jogada do nó
+        self.root_board = None  # Tabuleiro da raiz (posição em que é a vez deste jogador)
+        self.root_shape = None  # (linhas, colunas, k) do jogo da árvore
+        self.add_node(-1)
+
+    def add_node(self, move):
+        """
+        Acrescenta um nó sem filhos e sem visitas ao fim dos arrays.
+
+        Args:
+            move (int): A jogada que leva ao nó.
+
+        Returns:
+            int: O índice do novo nó.
+        """
+        self.move.append(move)
+        self.first_child.append(-1)
+        self.child_count.append(0)
+        self.visits.append(0)
+        self.value.append(0.0)
+        return len(self.move) - 1
+
+    @property
+    def tree_size(self):
+        """
+        Número de nós da árvore atual.
+
+        Returns:
+            int: A quantidade de nós.
+        """
+        return len(self.move)
+
+    def find_child(self, node, move):
+        """
+        Procura o filho de um nó que corresponde a uma jogada.
+
+        Args:
+            node (int): O índice do nó.
+            move (int): A jogada procurada.
+
+        Returns:
+            int: O índice do filho, ou -1 se o nó não foi expandido.
+        """
+        first = self.first_child[node]
+        if first == -1:
+            return -1
+        for child in range(first, first + self.child_count[node]):
+            if self.move[child] == move:
+                return child
+        return -1
+
+    def reroot(self, node):
+        """
+        Torna um nó a nova raiz, copiando a subárvore dele para arrays novos (em largura, para que os
+        filhos de cada nó continuem consecutivos) e descartando o restante.
+
+        Args:
+            node (int): O índice do nó que vira raiz.
+        """
+        move, first_child, child_count = self.move, self.first_child, self.child_count
+        visits, value = self.visits, self.value
+        root_board, root_shape = self.root_board, self.root_shape
+        self.clear_tree()
+        self.root_board, self.root_shape = root_board, root_shape
+        self.visits[0], self.value[0] = visits[node], value[node]
+        queue = [(node, 0)]
+        for old, new in queue:
+            first = first_child[old]
+            if first == -1:
+                continue
+            self.first_child[new] = len(self.move)
+            self.child_count[new] = child_count[old]
+            for child in range(first, first + child_count[old]):
+                index = self.add_node(move[child])
+                self.visits[index], self.value[index] = visits[child], value[child]
+                queue.append((child, index))
+
+    def reuse_tree(self, game):
+        """
+        Prepara a raiz para a posição atual. Se desde a última jogada o tabuleiro só ganhou a jogada deste
+        jogador e a resposta do adversário, e as duas estão na árvore, a subárvore é reaproveitada;
+        caso contrário, a árvore é descartada.
+
+        Args:
+            game (Game): O estado atual do jogo.
+        """
+        board = list(game.board)
+        shape = (game.rows, game.cols, game.k)
+        node = -1
+        if self.root_board is not None and self.root_shape == shape:
+            changed = [(square, letter) for square, (old, letter) in enumerate(zip(self.root_board, board))
+                       if old != letter]
+            mine = [square for square, letter in changed if letter == self.letter]
+            theirs = [square for square, letter in changed if letter == self.other]
+            if not changed:
+                node = 0
+            elif len(mine) == 1 and len(theirs) == 1 and len(changed) == 2:
+                child = self.find_child(0, mine[0])
+                node = self.find_child(child, theirs[0]) if child != -1 else -1
+        if node == -1:
+            self.clear_tree()
+        elif node != 0:
+            self.reroot(node)
+        self.root_board, self.root_shape = board, shape
+        self.reused_visits = self.visits[0]
+
+    def get_move(self, game):
+        """
+        Obtém o movimento do jogador MCTS: faz iterações até esgotar o orçamento e escolhe o filho
+        da raiz mais visitado.
+
+        Args:
+            game (Game): A instância do jogo em que o movimento será feito.
+
+        Returns:
+            int: O índice do espaço onde o jogador deseja fazer a jogada.
+        """
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        self.start()
+        if self.workers > 1 and self.parallel == 'root':
+            stats = self.root_parallel_search(game)
+        else:
+            self.reuse_tree(game)
+            if self.workers > 1:
+                self.tree_parallel_search(game, deadline)
+            else:
+                done = 0
+                while True:
+                    self.iterate(game)
+                    done += 1
+                    if self.iterations is not None and done >= self.iterations:
+                        break
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        break
+                self.iterations_done = done
+            first = self.first_child[0]
+            stats = [(self.move[child], self.visits[child], self.value[child])
+                     for child in range(first, first + self.child_count[0])]
+
+        # A jogada mais visitada; num empate, a de menor índice, para não depender da ordem dos filhos
+        move, _, _ = max(stats, key=lambda item: (item[1], -item[0]))
+        if game.debug_mode:
+            for square, visits, value in stats:
+                print(f"Jogada {square}: {visits} visitas, valor médio {value / max(visits, 1):.3f}")
+            print(f"Iterações: {self.iterations_done}, nós na árvore: {self.tree_size}")
+            print('\n-----------------------------------------')
+        return move
+
+    def root_parallel_search(self, game):
+        """
+        Modo 'root': constrói uma árvore independente por processo e soma as visitas e os valores dos
+        filhos da raiz de todas elas.
+
+        Args:
+            game (Game): O estado atual do jogo.
+
+        Returns:
+            list: (jogada, visitas, valor) de cada jogada da raiz, ordenadas pela jogada.
+        """
+        self.searches += 1
+        iterations = None if self.iterations is None else -(-self.iterations // self.workers)
+        board = list(game.board)
+        tasks = [(type(game), game.rows, game.cols, game.k, board, self.letter, iterations, self.time_budget,
+                  self.exploration, self.playout, f"{self.seed}:{self.searches}:{index}")
+                 for index in range(self.workers)]
+        totals = {}
+        self.iterations_done = 0
+        for children, done in self.executor.map(_search_tree, tasks):
+            self.iterations_done += done
+            for move, visits, value in children:
+                total_visits, total_value = totals.get(move, (0, 0.0))
+                totals[move] = (total_visits + visits, total_value + value)
+        return [(move, visits, value) for move, (visits, value) in sorted(totals.items())]
+
+    def tree_parallel_search(self, game, deadline):
+        """
+        Modo 'tree': seleciona lotes de folhas com perda virtual e divide as simulações de cada lote
+        entre os processos, até esgotar o orçamento.
+
+        Args:
+            game (Game): O estado atual do jogo, na posição da raiz.
+            deadline (float): O instante (time.perf_counter) em que o tempo acaba, ou None.
+        """
+        done = 0
+        while True:
+            size = self.batch_size if self.iterations is None else min(self.batch_size, self.iterations - done)
+            batch = []  # (caminho, vencedor já conhecido, índice da simulação no lote)
+            tasks = []
+            for _ in range(size):
+                path, player = self.descend(game)
+                # Perda virtual: a visita conta desde já, sem recompensa, para desviar as próximas seleções
+                for node in path:
+                    self.visits[node] += 1
+                if game.current_winner or not game.empty_squares():
+                    batch.append((path, game.current_winner, None))
+                else:
+                    tasks.append((type(game), game.rows, game.cols, game.k, list(game.board), player, self.playout,
+                                  f"{self.seed}:{self.playouts}"))
+                    self.playouts += 1
+                    batch.append((path, None, len(tasks) - 1))
+                for _ in range(len(path) - 1):
+                    game.undo_move()
+
+            chunk = -(-len(tasks) // self.workers) if tasks else 1
+            winners = []
+            for result in self.executor.map(_run_playouts, [tasks[i:i + chunk] for i in range(0, len(tasks), chunk)]):
+                winners.extend(result)
+            for path, winner, index in batch:
+                if index is not None:
+                    winner = winners[index]
+                self.backpropagate(path, winner, visited=True)
+
+            done += size
+            if self.iterations is not None and done >= self.iterations:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        self.iterations_done = done
+
+    def iterate(self, game):
+        """
+        Faz uma iteração do MCTS (seleção, expansão, simulação e propagação) e devolve o jogo à posição da raiz.
+
+        Args:
+            game (Game): O estado atual do jogo, na posição da raiz.
+        """
+        path, player = self.descend(game)
+        winner = playout(game, player, self.rng, self.playout)
+        for _ in range(len(path) - 1):
+            game.undo_move()
+        self.backpropagate(path, winner)
+
+    def descend(self, game):
+        """
+        Seleção e expansão: desce da raiz até uma folha, fazendo as jogadas no jogo, e expande a folha.
+
+        Args:
+            game (Game): O estado atual do jogo, na posição da raiz. As jogadas do caminho ficam feitas;
+                quem chama desfaz len(caminho) - 1 jogadas.
+
+        Returns:
+            tuple: (caminho de índices da raiz até o nó final, jogador da vez no nó final).
+        """
+        node = 0
+        path = [0]
+        player = self.letter
+
+        # Seleção: desce pelos nós já expandidos escolhendo o filho de maior UCB1
+        while self.first_child[node] != -1:
+            node = self.select_child(node)
+            game.make_move(self.move[node], player)
+            path.append(node)
+            player = 'O' if player == 'X' else 'X'
+
+        # Expansão: cria todos os filhos da folha (em ordem aleatória) e desce para o primeiro
+        if not game.current_winner and game.empty_squares():
+            moves = game.available_moves()
+            self.rng.shuffle(moves)
+            self.first_child[node] = len(self.move)
+            self.child_count[node] = len(moves)
+            for move in moves:
+                self.add_node(move)
+            node = self.first_child[node]
+            game.make_move(self.move[node], player)
+            path.append(node)
+            player = 'O' if player == 'X' else 'X'
+        return path, player
+
+    def backpropagate(self, path, winner, visited=False):
+        """
+        Propagação: cada nó do caminho recebe uma visita e a recompensa de quem fez a jogada que leva
+        a ele (1 pela vitória, 0,5 pelo empate, 0 pela derrota).
+
+        Args:
+            path (list): Os índices dos nós, da raiz até a folha simulada.
+            winner (str): A letra do vencedor da simulação, ou None em caso de empate.
+            visited (bool, opcional): Se True, as visitas já foram contadas como perda virtual e só a
+                recompensa é somada. Default é False.
+        """
+        mover = self.other  # Quem "jogou" para chegar à raiz
+        for node in path:
+            if not visited:
+                self.visits[node] += 1
+            if winner is None:
+                self.value[node] += 0.5
+            elif winner == mover:
+                self.value[node] += 1.0
+            mover = 'O' if mover == 'X' else 'X'
+
+    def select_child(self, node):
+        """
+        Escolhe o filho de maior UCB1: valor médio + exploration * sqrt(ln(visitas do pai) / visitas do filho).
+        Filhos ainda não visitados são escolhidos primeiro.
+
+        Args:
+            node (int): O índice do nó expandido.
+
+        Returns:
+            int: O índice do filho escolhido.
+        """
+        visits, value = self.visits, self.value
+        first = self.first_child[node]
+        log_parent = math.log(visits[node])
+        exploration = self.exploration
+        best, best_score = first, -math.inf
+        for child in range(first, first + self.child_count[node]):
+            n = visits[child]
+            if n == 0:
+                return child
+            score = value[child] / n + exploration * math.sqrt(log_parent / n)
+            if score > best_score:
+                best, best_score = child, score
+        return best
@@ -0,0 +1,108 @@
+from packs.Game import *
+
+# Categorias de ordenação, da mais prioritária para a menos prioritária.
+TT_MOVE = 0   # Melhor jogada guardada na tabela de transposição (variação principal)
+WIN = 1       # Jogada que vence imediatamente
+BLOCK = 2     # Jogada que bloqueia uma vitória imediata do adversário
+KILLER = 3    # Jogada que causou corte em outro nó da mesma profundidade
+QUIET = 4     # Demais jogadas, ordenadas pela tabela de histórico e pela prioridade estática
+
+
+class MoveOrdering:
+    """
+    Ordena as jogadas de cada nó do minimax para antecipar os cortes alfa-beta: primeiro a jogada da
+    tabela de transposição, depois vitórias e bloqueios imediatos, as jogadas killer da profundidade,
+    o histórico de cortes acumulado entre as jogadas e, por fim, a prioridade estática da casa
+    (centro, cantos, bordas: o número de linhas vencedoras que passam por ela).
+
+    Atributos:
+        killers (dict): Até duas jogadas killer por profundidade (ply) da busca atual.
+        history (dict): Pontuação de cortes por (letra, casa), mantida entre as jogadas.
+        rng (random.Random): Se definido, desempata ao acaso as jogadas de mesma prioridade.
+    """
+
+    def __init__(self, rng=None):
+        """
+        Inicializa as tabelas vazias.
+
+        Args:
+            rng (random.Random, opcional): Gerador usado para desempatar ao acaso as jogadas de mesma
+                prioridade, por exemplo nas threads auxiliares do Lazy SMP. Default é None (sem sorteio).
+        """
+        self.killers = {}
+        self.history = {}
+        self.board_size = None
+        self.rng = rng
+
+    def new_search(self, game):
+        """
+        Prepara uma nova busca: limpa as killers e envelhece o histórico (divide por 2).
+        O histórico é descartado se o tamanho do tabuleiro mudar.
+
+        Args:
+            game (Game): O jogo que será buscado.
+        """
+        self.killers.clear()
+        if self.board_size != (game.rows, game.cols, game.k):
+            self.board_size = (game.rows, game.cols, game.k)
+            self.history.clear()
+        else:
+            for key in self.history:
+                self.history[key] //= 2
+
+    def order(self, state, moves, player, tt_move=None, ply=0):
+        """
+        Ordena as jogadas de um nó.
+
+        Args:
+            state (Game): O estado atual do jogo.
+            moves (list): As jogadas disponíveis.
+            player (str): O jogador da vez ('X' ou 'O').
+            tt_move (int, opcional): A melhor jogada guardada na tabela de transposição.
+            ply (int, opcional): A distância do nó até a raiz.
+
+        Returns:
+            list: As jogadas na ordem em que devem ser tentadas.
+        """
+        other_player = 'O' if player == 'X' else 'X'
+        killers = self.killers.get(ply, ())
+        history = self.history
+        rng = self.rng
+        _, cell_lines = line_tables(state.rows, state.cols, state.k)
+
+        def key(move):
+            if move == tt_move:
+                category = TT_MOVE
+            elif state.is_winning_move(move, player):
+                category = WIN
+            elif state.is_winning_move(move, other_player):
+                category = BLOCK
+            elif move in killers:
+                category = KILLER
+            else:
+                category = QUIET
+            tie = rng.random() if rng is not None else 0
+            return category, -history.get((player, move), 0), -len(cell_lines[move]), tie
+
+        return sorted(moves, key=key)
+
+    def record_cutoff(self, state, player, move, ply, depth):
+        """
+        Registra uma jogada que causou corte: atualiza as killers da profundidade e o histórico.
+
+        Args:
+            state (Game): O estado atual do jogo (antes da jogada).
+            player (str): O jogador que fez a jogada.
+            move (int): A jogada que causou o corte.
+            ply (int): A distância do nó até a raiz.
+            depth (float): A profundidade restante da busca no nó.
+        """
+        # Vitórias e bloqueios já são priorizados pela própria ordenação
+        if state.is_winning_move(move, player) or state.is_winning_move(move, 'O' if player == 'X' else 'X'):
+            return
+        killers = self.killers.setdefault(ply, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        remaining = min(depth, state.num_empty_squares())
+        self.history[(player, move)] = self.history.get((player, move), 0) + remaining * remaining
@@ -0,0 +1,307 @@
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from packs.TranspositionTable import *
+
+
+class SearchBudgetExceeded(Exception):
+    """
+    Interrompe o minimax quando o orçamento de tempo ou de nós da jogada acaba.
+    """
+
+
+class NodePool:
+    """
+    Orçamento de nós de uma jogada dividido entre vários processos ou threads. Cada busca reserva nós do
+    orçamento em blocos, à medida que o seu limite local acaba, e devolve no fim os que não usou; assim a
+    soma dos nós visitados por todas nunca passa do orçamento.
+
+    Atributos:
+        remaining (multiprocessing.Value): Nós ainda não reservados, protegidos pela trava do próprio Value.
+    """
+
+    def __init__(self, remaining):
+        """
+        Inicializa o orçamento compartilhado.
+
+        Args:
+            remaining (multiprocessing.Value): Um Value inteiro ('q') com os nós disponíveis.
+        """
+        self.remaining = remaining
+
+    def reset(self, nodes):
+        """
+        Começa um novo orçamento, descartando o que sobrou do anterior.
+
+        Args:
+            nodes (int): Nós disponíveis.
+        """
+        with self.remaining.get_lock():
+            self.remaining.value = nodes
+
+    def reserve(self, nodes):
+        """
+        Reserva até `nodes` nós do orçamento.
+
+        Args:
+            nodes (int): Nós pedidos.
+
+        Returns:
+            int: Nós concedidos (0 se o orçamento acabou).
+        """
+        with self.remaining.get_lock():
+            granted = min(nodes, self.remaining.value)
+            self.remaining.value -= granted
+        return granted
+
+    def release(self, nodes):
+        """
+        Devolve ao orçamento nós reservados e não usados.
+
+        Args:
+            nodes (int): Nós devolvidos.
+        """
+        if nodes > 0:
+            with self.remaining.get_lock():
+                self.remaining.value += nodes
+
+
+# Estado de cada processo do pool, criado uma vez por processo em _init_worker
+_worker_player = None  # Jogador que busca as jogadas da raiz neste processo
+_shared_alpha = None  # [melhor score exato da raiz até agora, índice da jogada que o alcançou]
+_node_pool = None  # Orçamento de nós da jogada, compartilhado entre os processos
+_search_id = None  # Busca atendida pelo processo; ao mudar, os contadores e a ordenação são preparados de novo
+
+
+def _init_worker(player_class, letter, options, shared_alpha, node_pool):
+    """
+    Inicializa um processo do pool com o seu próprio jogador (e tabela de transposição), o alpha e o
+    orçamento de nós compartilhados.
+
+    Args:
+        player_class (type): A classe do jogador (ComputerPlayer).
+        letter (str): A letra do computador ('X' ou 'O').
+        options (dict): Os argumentos do construtor do jogador.
+        shared_alpha (multiprocessing.Array): O alpha compartilhado entre os processos.
+        node_pool (NodePool): O orçamento de nós compartilhado entre os processos.
+    """
+    global _worker_player, _shared_alpha, _node_pool
+    _worker_player = player_class(letter, **options)
+    _shared_alpha = shared_alpha
+    _node_pool = node_pool
+
+
+def _search_root_move(task):
+    """
+    Busca uma jogada da raiz em um processo do pool, a partir do melhor score exato já encontrado
+    (o alpha compartilhado). Como os empates são decididos a favor da jogada que vem antes na ordem,
+    a jogada só precisa superar o alpha se ele veio de uma jogada anterior; se veio de uma posterior,
+    a janela começa logo abaixo dele, para que um empate também tenha score exato.
+
+    Args:
+        task (tuple): (classe do jogo, linhas, colunas, k, tabuleiro, índice da jogada na ordem da raiz,
+            jogada, profundidade, beta, prazo, se há limite de nós, identificador da busca, histórico de
+            cortes do jogador principal). Com limite de nós, o processo reserva os nós do orçamento
+            compartilhado à medida que busca.
+
+    Returns:
+        tuple: (score do ponto de vista do computador ou None se o orçamento acabou, alpha da janela
+            buscada, nós, cortes, cortes na primeira jogada, empates certos, incrementos do histórico de cortes).
+    """
+    global _search_id
+    game_class, rows, cols, k, board, index, move, depth, beta, deadline, limited, search_id, history = task
+    player = _worker_player
+    game = game_class('0', rows, cols, k)
+    for square, letter in enumerate(board):
+        if letter != ' ':
+            game.make_move(square, letter)
+    if search_id != _search_id:
+        _search_id = search_id
+        player.new_search(game)
+        # A ordenação parte do histórico do jogador principal, como a busca serial
+        if player.ordering is not None:
+            player.ordering.history = dict(history)
+
+    before = {} if player.ordering is None else dict(player.ordering.history)
+    nodes, cutoffs, first_move_cutoffs, dead_draws = (player.nodes, player.cutoffs, player.first_move_cutoffs,
+                                                      player.dead_draws)
+    # Sem nós reservados de início: o primeiro nó já reserva um bloco do orçamento compartilhado
+    player.set_limits(deadline, player.nodes if limited else None)
+    player.node_pool = _node_pool if limited else None
+    with _shared_alpha.get_lock():
+        window_alpha, alpha_index = _shared_alpha[:]
+    if alpha_index > index:
+        window_alpha -= 1
+    try:
+        score = player.search_move(game, move, depth, window_alpha, beta)
+    except SearchBudgetExceeded:
+        score = None
+    finally:
+        if limited:
+            _node_pool.release(player.node_limit - player.nodes)
+        player.node_pool = None
+        player.set_limits()
+    if score is not None:
+        with _shared_alpha.get_lock():
+            alpha, alpha_index = _shared_alpha[:]
+            if score > alpha or (score == alpha and index < alpha_index):
+                _shared_alpha[:] = [score, index]
+    updates = {}
+    if player.ordering is not None:
+        updates = {key: value - before.get(key, 0) for key, value in player.ordering.history.items()
+                   if value != before.get(key, 0)}
+    return (score, window_alpha, player.nodes - nodes, player.cutoffs - cutoffs, player.first_move_cutoffs - first_move_cutoffs,
+            player.dead_draws - dead_draws, updates)
+
+
+class RootParallelSearch:
+    """
+    Busca paralela na raiz: as jogadas da raiz são distribuídas entre os processos de um
+    ProcessPoolExecutor, cada um com o seu jogador e a sua tabela de transposição, mantidos entre as buscas.
+
+    A primeira jogada da raiz é buscada antes das demais, e os processos compartilham o melhor score exato
+    da raiz (o alpha) por meio de um multiprocessing.Array, de modo que as jogadas buscadas depois de uma
+    boa jogada já começam com a janela estreitada. Os processos partem do histórico de cortes do jogador,
+    e os cortes que encontram são somados de volta a ele, para que a ordem da raiz nas jogadas seguintes
+    reflita toda a busca, como na serial. O limite de nós da jogada também é compartilhado (ver
+    NodePool), então a soma dos nós de todos os processos o respeita. Os
+    resultados são combinados na ordem das jogadas, e não na ordem em que terminam: entre jogadas de
+    mesmo score vence a primeira, então a jogada escolhida não depende do escalonamento dos processos.
+    O score é sempre o da busca serial, mas a jogada pode ser outra de mesmo score: os cortes de cada
+    processo acontecem em outra ordem, e o histórico acumulado (que ordena a raiz) fica diferente.
+
+    Atributos:
+        player (ComputerPlayer): O jogador cuja busca é paralelizada.
+        workers (int): Número de processos do pool.
+    """
+
+    def __init__(self, player, workers):
+        """
+        Prepara a busca paralela; o pool só é criado na primeira busca.
+
+        Args:
+            player (ComputerPlayer): O jogador cuja busca é paralelizada.
+            workers (int): Número de processos do pool.
+        """
+        self.player = player
+        self.workers = workers
+        self.executor = None
+        self.shared_alpha = None
+        self.node_pool = None
+        self.search_id = 0
+
+    def start(self):
+        """
+        Cria o pool de processos, o alpha e o orçamento de nós compartilhados, se ainda não existirem.
+        """
+        if self.executor is not None:
+            return
+        player = self.player
+        options = {
+            'difficulty': player.difficulty,
+            'tt_size': player.tt.max_size,
+            'symmetry': player.symmetry,
+            'perfect_play': False,
+            'move_ordering': player.ordering is not None,
+            'engine': player.engine,
+            'draw_detection': player.draw_detection,
+        }
+        context = multiprocessing.get_context()
+        self.shared_alpha = context.Array('d', [-math.inf, -1])
+        self.node_pool = NodePool(context.Value('q', 0))
+        self.executor = ProcessPoolExecutor(self.workers, mp_context=context, initializer=_init_worker,
+                                            initargs=(type(player), player.letter, options, self.shared_alpha,
+                                                      self.node_pool))
+
+    def close(self):
+        """
+        Encerra o pool de processos.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def search(self, game, depth=math.inf, alpha=-math.inf, beta=math.inf):
+        """
+        Busca todas as jogadas da raiz em paralelo, com a janela (alpha, beta).
+
+        Args:
+            game (Game): O estado atual do jogo.
+            depth (float, opcional): Profundidade máxima. Default é infinito.
+            alpha (float, opcional): Limite inferior da janela. Default é -infinito.
+            beta (float, opcional): Limite superior da janela. Default é infinito.
+
+        Returns:
+            dict: A 'position' da melhor jogada e a 'score' do ponto de vista do computador.
+
+        Raises:
+            SearchBudgetExceeded: Se o orçamento de tempo ou de nós acabou antes de todas as jogadas serem buscadas.
+        """
+        self.start()
+        player = self.player
+        player.nodes += 1
+        if player.nodes >= player.next_check:
+            player.check_budget()
+
+        # A raiz é preparada como no minimax: jogadas únicas por simetria, ordenadas pela tabela e pelo histórico
+        moves = game.available_moves()
+        symmetry = player.symmetry_of(game)
+        if symmetry is not None:
+            moves = symmetry.unique_moves(game.board, moves)
+        key, transform = player.tt_key(game, player.letter)
+        if player.ordering is not None:
+            entry = player.tt.lookup(key)
+            tt_move = None
+            if entry is not None:
+                tt_move = entry.move if transform is None else symmetry.from_canonical(entry.move, transform)
+            moves = player.ordering.order(game, moves, player.letter, tt_move)
+
+        # O alpha compartilhado começa no alpha recebido, como se viesse de uma jogada anterior a todas
+        self.search_id += 1
+        self.shared_alpha[:] = [alpha, -1]
+        # Os nós que restam à jogada são divididos entre os processos à medida que eles buscam
+        limited = player.node_limit is not None
+        if limited:
+            self.node_pool.reset(player.node_limit - player.nodes)
+        board = list(game.board)
+        history = {} if player.ordering is None else player.ordering.history
+        tasks = [(type(game), game.rows, game.cols, game.k, board, index, move, depth, beta, player.deadline,
+                  limited, self.search_id, history) for index, move in enumerate(moves)]
+        # A primeira jogada (a da variação principal, pela ordenação) é buscada sozinha; as demais partem
+        # do alpha que ela deixou, como na busca serial, em vez de todas começarem com a janela aberta
+        first = self.executor.submit(_search_root_move, tasks[0])
+        first.result()
+        futures = [first] + [self.executor.submit(_search_root_move, task) for task in tasks[1:]]
+
+        # Combina os resultados na ordem das jogadas: num empate fica a primeira, como na busca serial.
+        # As jogadas com score exato são registradas mesmo que outra estoure o orçamento, para que uma
+        # iteração interrompida ainda possa dar a sua melhor jogada
+        best = {'position': None, 'score': -math.inf}
+        exceeded = False
+        for move, future in zip(moves, futures):
+            score, window_alpha, nodes, cutoffs, first_move_cutoffs, dead_draws, updates = future.result()
+            for key, value in updates.items():
+                player.ordering.history[key] = player.ordering.history.get(key, 0) + value
+            player.nodes += nodes
+            player.cutoffs += cutoffs
+            player.first_move_cutoffs += first_move_cutoffs
+            player.dead_draws += dead_draws
+            if score is None:
+                exceeded = True
+                continue
+            player.record_root_move(move, score, window_alpha, beta)
+            if score > best['score']:
+                best = {'position': move, 'score': score}
+        if exceeded:
+            raise SearchBudgetExceeded()
+
+        if best['score'] <= alpha:
+            flag = UPPER
+        elif best['score'] >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        move = best['position'] if transform is None else symmetry.to_canonical(best['position'], transform)
+        player.tt.store(key, best['score'], move, depth, flag)
+        return best
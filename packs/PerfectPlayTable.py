@@ -0,0 +1,237 @@
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+
+from packs.Game import *
+
+# Arquivo binário com a tabela, distribuído junto com o pacote.
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'perfect_play.bin')
+
+# Cabeçalho: assinatura, versão, checksum das regras (sha256) e crc32 dos dados.
+MAGIC = b'TTTP'
+VERSION = 1
+HEADER = struct.Struct('<4sB32sI')
+
+# Uma entrada de 16 bits por tabuleiro, indexada pelo tabuleiro em base 3 (' ' = 0, 'X' = 1, 'O' = 2).
+ENTRY = struct.Struct('<H')
+NUM_POSITIONS = 3 ** 9
+POW3 = [3 ** i for i in range(9)]
+DIGITS = {' ': 0, 'X': 1, 'O': 2}
+
+# Valor teórico da posição para o jogador da vez (0 indica posição inalcançável).
+UNREACHABLE = 0
+WIN = 1
+DRAW = 2
+LOSS = 3
+
+# Layout da entrada: bits 0-8 máscara das melhores jogadas, bits 9-10 valor, bits 11-14 distância ao resultado.
+MOVES_MASK = (1 << 9) - 1
+VALUE_SHIFT = 9
+DISTANCE_SHIFT = 11
+
+
+def board_index(board):
+    """
+    Converte o tabuleiro no seu índice em base 3 dentro da tabela.
+
+    Args:
+        board (list): O tabuleiro (lista de ' ', 'X' e 'O').
+
+    Returns:
+        int: O índice da posição.
+    """
+    return sum(DIGITS[spot] * POW3[i] for i, spot in enumerate(board))
+
+
+def rules_checksum():
+    """
+    Calcula uma impressão digital das regras de vitória de Game.winner: para cada combinação de casas
+    ocupadas por X, jogadas em ordem crescente, registra se a partida terminou com vitória de X.
+
+    Returns:
+        bytes: O sha256 dos resultados.
+    """
+    results = bytearray()
+    for mask in range(1 << 9):
+        game = Game('0')
+        for square in range(9):
+            if mask >> square & 1:
+                game.make_move(square, 'X')
+        results.append(1 if game.current_winner == 'X' else 0)
+    return hashlib.sha256(bytes(results)).digest()
+
+
+def solve():
+    """
+    Enumera todas as posições alcançáveis a partir do tabuleiro vazio (X começa) e calcula,
+    para o jogador da vez, o valor teórico, a distância até o resultado e as melhores jogadas.
+
+    Vitórias preferem a menor distância e derrotas a maior, a mesma preferência do minimax
+    do ComputerPlayer, que pontua ±(casas vazias + 1).
+
+    Returns:
+        bytearray: As entradas da tabela, uma por índice em base 3.
+    """
+    data = bytearray(ENTRY.size * NUM_POSITIONS)
+    solved = {}
+    game = Game('0')
+
+    def search(player, index):
+        if index in solved:
+            return solved[index]
+
+        other_player = 'O' if player == 'X' else 'X'
+        if game.current_winner:
+            result = (LOSS, 0, 0)  # O adversário acabou de vencer
+        elif not game.empty_squares():
+            result = (DRAW, 0, 0)
+        else:
+            children = []
+            for move in game.available_moves():
+                with game.push(move, player):
+                    value, distance, _ = search(other_player, index + DIGITS[player] * POW3[move])
+                # O valor do filho é do ponto de vista do adversário
+                value = {WIN: LOSS, LOSS: WIN, DRAW: DRAW}[value]
+                children.append((move, value, distance + 1))
+
+            # Ordena por resultado: vitória mais rápida, empate, derrota mais demorada
+            def rank(child):
+                _, value, distance = child
+                return {WIN: (0, distance), DRAW: (1, 0), LOSS: (2, -distance)}[value]
+
+            best = min(rank(child) for child in children)
+            best_children = [child for child in children if rank(child) == best]
+            moves = sum(1 << move for move, _, _ in best_children)
+            result = (best_children[0][1], best_children[0][2], moves)
+
+        solved[index] = result
+        value, distance, moves = result
+        ENTRY.pack_into(data, index * ENTRY.size, moves | value << VALUE_SHIFT | distance << DISTANCE_SHIFT)
+        return result
+
+    search('X', 0)
+    return data
+
+
+def rebuild(path=TABLE_PATH):
+    """
+    Resolve o jogo e grava a tabela binária com o checksum das regras atuais.
+
+    Args:
+        path (str): Caminho do arquivo a ser gravado.
+
+    Returns:
+        int: O número de posições alcançáveis gravadas.
+    """
+    data = solve()
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, rules_checksum(), zlib.crc32(data)))
+        f.write(data)
+    return sum(1 for i in range(NUM_POSITIONS) if ENTRY.unpack_from(data, i * ENTRY.size)[0] >> VALUE_SHIFT & 3)
+
+
+class PerfectPlayTable:
+    """
+    Tabela de jogo perfeito do jogo da velha 3x3, mapeada em memória a partir do arquivo binário.
+
+    Cada consulta é O(1): o tabuleiro é convertido no seu índice em base 3 e a entrada de 16 bits
+    correspondente é lida diretamente do arquivo.
+
+    Atributos:
+        load_error (Exception): O erro da carga da tabela compartilhada (ver `shared`), ou None se ela
+            foi carregada ou ainda não foi pedida.
+    """
+
+    _shared = None
+    load_error = None
+
+    def __init__(self, path=TABLE_PATH):
+        """
+        Abre e mapeia a tabela em memória, validando o cabeçalho e o checksum das regras.
+
+        Args:
+            path (str): Caminho do arquivo da tabela.
+
+        Raises:
+            ValueError: Se o arquivo não for uma tabela válida ou tiver sido gerado com outras regras.
+        """
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.data) != HEADER.size + ENTRY.size * NUM_POSITIONS:
+            raise ValueError(f"Tabela de jogo perfeito com tamanho inválido: {path}")
+        magic, version, checksum, crc = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Arquivo não é uma tabela de jogo perfeito válida: {path}")
+        if checksum != rules_checksum():
+            raise ValueError("A tabela de jogo perfeito foi gerada com outras regras; "
+                             "recrie com 'python -m packs.PerfectPlayTable'")
+        if crc != zlib.crc32(self.data[HEADER.size:]):
+            raise ValueError(f"Tabela de jogo perfeito corrompida: {path}")
+
+    @classmethod
+    def shared(cls):
+        """
+        Retorna a tabela compartilhada pelo processo, carregando-a na primeira chamada. Se a carga falhar,
+        o erro fica em `load_error`, para quem chamou decidir se e como informá-lo.
+
+        Returns:
+            PerfectPlayTable: A tabela carregada, ou None se o arquivo não existir ou for inválido.
+        """
+        if cls._shared is None:
+            try:
+                cls._shared = cls()
+            except (OSError, ValueError) as error:
+                cls.load_error = error
+                cls._shared = False
+        return cls._shared or None
+
+    def probe(self, game, letter):
+        """
+        Consulta a posição do jogo para o jogador informado.
+
+        Args:
+            game (Game): O jogo a ser consultado; só tabuleiros 3x3 com 3 em linha estão na tabela.
+            letter (str): O jogador da vez ('X' ou 'O').
+
+        Returns:
+            tuple: (valor, distância ao resultado, lista de melhores jogadas), ou None se a posição
+                não for alcançável com `letter` como jogador da vez.
+        """
+        if (game.rows, game.cols, game.k) != (3, 3, 3):
+            return None
+        board = game.board
+        x_count, o_count = board.count('X'), board.count('O')
+        if letter != ('X' if x_count == o_count else 'O') or x_count - o_count not in (0, 1):
+            return None
+
+        entry = ENTRY.unpack_from(self.data, HEADER.size + board_index(board) * ENTRY.size)[0]
+        value = entry >> VALUE_SHIFT & 3
+        if value == UNREACHABLE:
+            return None
+        moves = [square for square in range(9) if entry >> square & 1]
+        return value, entry >> DISTANCE_SHIFT & 15, moves
+
+    def best_move(self, game, letter):
+        """
+        Retorna a melhor jogada da posição (a de menor índice entre as ótimas, como no minimax).
+
+        Args:
+            game (Game): O jogo 3x3 a ser consultado.
+            letter (str): O jogador da vez ('X' ou 'O').
+
+        Returns:
+            int: A jogada escolhida, ou None se a posição não estiver na tabela ou o jogo tiver acabado.
+        """
+        result = self.probe(game, letter)
+        if result is None or not result[2]:
+            return None
+        return result[2][0]
+
+
+if __name__ == "__main__":
+    # Recria a tabela: python -m packs.PerfectPlayTable
+    count = rebuild()
+    print(f"Tabela gravada em {TABLE_PATH} com {count} posições alcançáveis.")
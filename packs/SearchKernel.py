@@ -0,0 +1,264 @@
+import math
+
+from packs.Game import *
+
+# Índice de cada jogador nos contadores do núcleo.
+SIDES = {'X': 0, 'O': 1}
+LETTERS = ('X', 'O')
+
+
+class SearchKernel:
+    """
+    Núcleo do minimax com poda alfa-beta que não aloca objetos por nó: o tabuleiro, os contadores de
+    linha, as ameaças e as linhas vivas ficam em listas criadas uma única vez, as jogadas de cada nó são
+    escritas num buffer pré-alocado por profundidade (ply) e percorridas por índice, e cada nó devolve
+    uma tupla (score, jogada), que o Python reaproveita da lista de tuplas livres.
+
+    Os scores são os mesmos de ComputerPlayer.heuristic_state, lidos de tabelas pré-calculadas para não
+    criar inteiros negativos a cada folha (só os de -5 a 256 são compartilhados pelo Python). O contador
+    de nós é dividido em duas partes pelo mesmo motivo: `low` conta os nós até `player.next_check` e só
+    então é somado a `player.nodes`, quando também é verificado o orçamento da jogada. Como o jogador
+    limita `next_check` ao nó seguinte ao limite, o limite de nós é tão exato quanto no minimax.
+
+    O núcleo não usa a tabela de transposição, a ordenação de jogadas nem a simetria: as jogadas são
+    tentadas na ordem das casas, e a árvore e o número de nós são os do minimax com essas três
+    otimizações desativadas.
+
+    Atributos:
+        player (ComputerPlayer): O jogador que usa o núcleo (letra, orçamento e contadores).
+        rows (int): Número de linhas do tabuleiro.
+        cols (int): Número de colunas do tabuleiro.
+        k (int): Número de peças alinhadas para vencer.
+        move_buffers (list): Um buffer de jogadas por profundidade, com uma posição por casa.
+    """
+
+    def __init__(self, player, rows=3, cols=3, k=3):
+        """
+        Pré-aloca os buffers e as tabelas de scores de um tamanho de tabuleiro.
+
+        Args:
+            player (ComputerPlayer): O jogador que usa o núcleo.
+            rows (int, opcional): Número de linhas do tabuleiro. Default é 3.
+            cols (int, opcional): Número de colunas do tabuleiro. Default é 3.
+            k (int, opcional): Número de peças alinhadas para vencer. Default é 3.
+        """
+        self.player = player
+        self.rows, self.cols, self.k = rows, cols, k
+        self.size = rows * cols
+        self.lines, self.cell_lines = line_tables(rows, cols, k)
+        line_count = len(self.lines)
+
+        # Estado da posição buscada, carregado do jogo a cada busca
+        self.board = [' '] * self.size
+        self.counts = ([0] * line_count, [0] * line_count)
+        self.threats = [0, 0]
+        self.open_lines = [line_count, line_count]
+        self.empties = 0
+        self.winner = -1  # Índice do vencedor, ou -1
+
+        self.move_buffers = [[0] * self.size for _ in range(self.size + 1)]
+
+        # Scores do ponto de vista do computador: vitória e derrota por casas vazias e heurística
+        # por saldo de ameaças, deslocado de `line_count` para o índice nunca ser negativo
+        self.win_scores = [empties + 1 for empties in range(self.size + 1)]
+        self.loss_scores = [-(empties + 1) for empties in range(self.size + 1)]
+        self.threat_scores = [5 * (balance - line_count) for balance in range(2 * line_count + 1)]
+        self.line_count = line_count
+
+        self.me = 0
+        self.low = 0  # Nós ainda não somados a player.nodes
+        self.flush_at = 1  # Valor de `low` em que player.nodes alcança player.next_check
+
+    def load(self, game):
+        """
+        Carrega a posição do jogo (Game ou BitboardGame) no estado do núcleo, refazendo as suas peças.
+
+        Args:
+            game (Game): O jogo.
+        """
+        for side in (0, 1):
+            counts = self.counts[side]
+            for l in range(self.line_count):
+                counts[l] = 0
+            self.threats[side] = 0
+            self.open_lines[side] = self.line_count
+        for square in range(self.size):
+            self.board[square] = ' '
+        self.empties = self.size
+        for square, letter in enumerate(game.board):
+            if letter != ' ':
+                self.make(square, SIDES[letter])
+        self.winner = SIDES[game.current_winner] if game.current_winner else -1
+
+    def search(self, game, player, depth=math.inf, alpha=-math.inf, beta=math.inf):
+        """
+        Busca a posição do jogo.
+
+        Args:
+            game (Game): O estado atual do jogo.
+            player (str): O jogador da vez ('X' ou 'O').
+            depth (float, opcional): Profundidade máxima. Default é infinito.
+            alpha (float, opcional): Limite inferior da janela. Default é -infinito.
+            beta (float, opcional): Limite superior da janela. Default é infinito.
+
+        Returns:
+            tuple: (score do ponto de vista do computador, melhor jogada ou None).
+
+        Raises:
+            SearchBudgetExceeded: Se o orçamento da jogada acabou.
+        """
+        self.load(game)
+        self.me = SIDES[self.player.letter]
+        self.low = 0
+        self.flush_at = max(self.player.next_check - self.player.nodes, 1)
+        try:
+            return self.minimax(SIDES[player], min(depth, self.empties), alpha, beta, 0)
+        finally:
+            self.player.nodes += self.low
+            self.low = 0
+
+    def minimax(self, side, depth, alpha, beta, ply):
+        """
+        Minimax com poda alfa-beta sobre o estado do núcleo, que é o mesmo ao sair.
+
+        Args:
+            side (int): O índice do jogador da vez (0 para X, 1 para O).
+            depth (int): Profundidade restante.
+            alpha (float): Limite inferior da janela.
+            beta (float): Limite superior da janela.
+            ply (int): Distância do nó até a raiz da busca.
+
+        Returns:
+            tuple: (score do ponto de vista do computador, melhor jogada ou None).
+        """
+        self.low += 1
+        if self.low == self.flush_at:
+            self.player.nodes += self.low
+            self.low = 0
+            self.player.check_budget()
+            self.flush_at = max(self.player.next_check - self.player.nodes, 1)
+
+        # Caso base: vitória, tabuleiro cheio ou fim da profundidade
+        if self.winner >= 0 or not self.empties or not depth:
+            return self.evaluate(), None
+        if ply and self.player.draw_detection and not self.open_lines[0] and not self.open_lines[1]:
+            self.player.dead_draws += 1
+            return 0, None
+
+        # Jogadas no buffer da profundidade, na ordem das casas
+        moves = self.move_buffers[ply]
+        board = self.board
+        count = 0
+        square = 0
+        while square < self.size:
+            if board[square] == ' ':
+                moves[count] = square
+                count += 1
+            square += 1
+
+        maximizing = side == self.me
+        best_score = -math.inf if maximizing else math.inf
+        best_move = None
+        other = 1 - side
+        index = 0
+        while index < count:
+            move = moves[index]
+            self.make(move, side)
+            score = self.minimax(other, depth - 1, alpha, beta, ply + 1)[0]
+            self.unmake(move, side)
+            if not ply:
+                self.player.record_root_move(move, score, alpha, beta)
+
+            if maximizing:
+                if score > best_score:
+                    best_score, best_move = score, move
+                if best_score > alpha:
+                    alpha = best_score
+            else:
+                if score < best_score:
+                    best_score, best_move = score, move
+                if best_score < beta:
+                    beta = best_score
+            if beta <= alpha:
+                break
+            index += 1
+        return best_score, best_move
+
+    def evaluate(self):
+        """
+        Avalia o nó terminal ou da profundidade limite como ComputerPlayer.heuristic_state.
+
+        Returns:
+            int: O score do ponto de vista do computador.
+        """
+        if self.winner == self.me:
+            return self.win_scores[self.empties]
+        if self.winner >= 0:
+            return self.loss_scores[self.empties]
+        # O deslocamento vem antes da subtração, para que nenhum resultado intermediário seja negativo
+        return self.threat_scores[self.threats[self.me] + self.line_count - self.threats[1 - self.me]]
+
+    def make(self, square, side):
+        """
+        Faz uma jogada, atualizando os contadores de linha como Game.update_lines.
+
+        Args:
+            square (int): O índice do espaço vazio.
+            side (int): O índice do jogador.
+        """
+        other = 1 - side
+        mine, theirs = self.counts[side], self.counts[other]
+        almost = self.k - 1
+        lines = self.cell_lines[square]
+        self.board[square] = LETTERS[side]
+        self.empties -= 1
+        index = 0
+        while index < len(lines):
+            l = lines[index]
+            if not mine[l]:
+                self.open_lines[other] -= 1
+            if not theirs[l]:
+                if mine[l] == almost:
+                    self.threats[side] -= 1
+                mine[l] += 1
+                if mine[l] == almost:
+                    self.threats[side] += 1
+                elif mine[l] == self.k:
+                    self.winner = side
+            else:
+                if theirs[l] == almost and not mine[l]:
+                    self.threats[other] -= 1
+                mine[l] += 1
+            index += 1
+
+    def unmake(self, square, side):
+        """
+        Desfaz a jogada feita com `make`.
+
+        Args:
+            square (int): O índice do espaço a esvaziar.
+            side (int): O índice do jogador que fez a jogada.
+        """
+        other = 1 - side
+        mine, theirs = self.counts[side], self.counts[other]
+        almost = self.k - 1
+        lines = self.cell_lines[square]
+        self.board[square] = ' '
+        self.empties += 1
+        self.winner = -1
+        index = 0
+        while index < len(lines):
+            l = lines[index]
+            if mine[l] == 1:
+                self.open_lines[other] += 1
+            if not theirs[l]:
+                if mine[l] == almost:
+                    self.threats[side] -= 1
+                mine[l] -= 1
+                if mine[l] == almost:
+                    self.threats[side] += 1
+            else:
+                if theirs[l] == almost and mine[l] == 1:
+                    self.threats[other] += 1
+                mine[l] -= 1
+            index += 1
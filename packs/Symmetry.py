@@ -0,0 +1,150 @@
+from functools import lru_cache
+from operator import itemgetter
+
+
+class Symmetry:
+    """
+    Simetrias do tabuleiro (rotações e reflexões) usadas para reduzir posições equivalentes
+    a uma única forma canônica.
+
+    Cada transformação é uma permutação `perm` das casas: a casa `i` do tabuleiro transformado
+    recebe o conteúdo da casa `perm[i]` do tabuleiro original. Tabuleiros quadrados têm 8
+    simetrias (grupo diedral); tabuleiros retangulares têm 4.
+
+    Atributos:
+        rows (int): Número de linhas do tabuleiro.
+        cols (int): Número de colunas do tabuleiro.
+        transforms (list): Permutações de cada simetria; a de índice 0 é a identidade.
+        inverses (list): Permutações inversas, na mesma ordem de `transforms`.
+    """
+
+    def __init__(self, rows=3, cols=3):
+        """
+        Pré-calcula as permutações de todas as simetrias do tabuleiro.
+
+        Args:
+            rows (int): Número de linhas do tabuleiro.
+            cols (int): Número de colunas do tabuleiro.
+        """
+        self.rows = rows
+        self.cols = cols
+
+        # Para cada simetria, a casa de origem (linha, coluna) de cada casa de destino.
+        maps = [
+            lambda r, c: (r, c),                          # Identidade
+            lambda r, c: (rows - 1 - r, cols - 1 - c),    # Rotação de 180°
+            lambda r, c: (r, cols - 1 - c),               # Reflexão horizontal
+            lambda r, c: (rows - 1 - r, c),               # Reflexão vertical
+        ]
+        if rows == cols:
+            n = rows
+            maps += [
+                lambda r, c: (n - 1 - c, r),              # Rotação de 90°
+                lambda r, c: (c, n - 1 - r),              # Rotação de 270°
+                lambda r, c: (c, r),                      # Diagonal principal
+                lambda r, c: (n - 1 - c, n - 1 - r),      # Diagonal secundária
+            ]
+
+        self.transforms = []
+        for source in maps:
+            perm = []
+            for i in range(rows * cols):
+                r, c = source(i // cols, i % cols)
+                perm.append(r * cols + c)
+            self.transforms.append(tuple(perm))
+
+        # Funções que aplicam cada permutação a um tabuleiro de uma só vez.
+        self.getters = [itemgetter(*perm) for perm in self.transforms]
+
+        self.inverses = []
+        for perm in self.transforms:
+            inverse = [0] * len(perm)
+            for i, square in enumerate(perm):
+                inverse[square] = i
+            self.inverses.append(tuple(inverse))
+
+    def canonical(self, board):
+        """
+        Calcula a forma canônica do tabuleiro: a menor entre todas as suas transformações.
+
+        Args:
+            board (list): O tabuleiro (lista de ' ', 'X' e 'O').
+
+        Returns:
+            tuple: (tabuleiro canônico como tupla, índice da transformação que o gera).
+        """
+        best, best_transform = None, 0
+        for t, getter in enumerate(self.getters):
+            candidate = getter(board)
+            if best is None or candidate < best:
+                best, best_transform = candidate, t
+        return best, best_transform
+
+    def to_canonical(self, square, transform):
+        """
+        Leva uma casa do tabuleiro original para o tabuleiro canônico.
+
+        Args:
+            square (int): A casa no tabuleiro original.
+            transform (int): O índice da transformação retornado por `canonical`.
+
+        Returns:
+            int: A casa correspondente no tabuleiro canônico.
+        """
+        return self.inverses[transform][square]
+
+    def from_canonical(self, square, transform):
+        """
+        Leva uma casa do tabuleiro canônico de volta para o tabuleiro original (transformação inversa).
+
+        Args:
+            square (int): A casa no tabuleiro canônico.
+            transform (int): O índice da transformação retornado por `canonical`.
+
+        Returns:
+            int: A casa correspondente no tabuleiro original.
+        """
+        return self.transforms[transform][square]
+
+    def unique_moves(self, board, moves):
+        """
+        Remove as jogadas equivalentes por simetria, mantendo a primeira de cada classe na ordem dada.
+
+        Só as simetrias que deixam o tabuleiro atual inalterado geram jogadas equivalentes.
+
+        Args:
+            board (list): O tabuleiro atual.
+            moves (list): As jogadas disponíveis.
+
+        Returns:
+            list: As jogadas sem duplicatas simétricas.
+        """
+        board = tuple(board)
+        stabilizers = [perm for perm, getter in zip(self.transforms[1:], self.getters[1:])
+                       if getter(board) == board]
+        if not stabilizers:
+            return moves
+
+        unique, seen = [], set()
+        for move in moves:
+            if move in seen:
+                continue
+            unique.append(move)
+            seen.add(move)
+            seen.update(perm[move] for perm in stabilizers)
+        return unique
+
+
+@lru_cache(maxsize=None)
+def symmetry_for(rows=3, cols=3):
+    """
+    Retorna as simetrias de um tabuleiro rows x cols, calculadas uma única vez por tamanho.
+
+    Args:
+        rows (int): Número de linhas do tabuleiro.
+        cols (int): Número de colunas do tabuleiro.
+
+    Returns:
+        Symmetry: As simetrias do tabuleiro.
+    """
+    return Symmetry(rows, cols)
@@ -0,0 +1,113 @@
+import threading
+from collections import namedtuple
+
+# Tipos de limite guardados em cada entrada da tabela.
+EXACT = 0  # O score é o valor exato da posição
+LOWER = 1  # O score é um limite inferior (houve corte beta)
+UPPER = 2  # O score é um limite superior (nenhum movimento superou alpha)
+
+# Limite equivalente quando o score é negado (visto pelo outro jogador).
+FLIPPED = {EXACT: EXACT, LOWER: UPPER, UPPER: LOWER}
+
+# Entrada da tabela: score, melhor movimento, profundidade buscada e tipo de limite.
+TTEntry = namedtuple('TTEntry', ['score', 'move', 'depth', 'flag'])
+
+
+class TranspositionTable:
+    """
+    Tabela de transposição que guarda os resultados do minimax por posição e jogador da vez,
+    evitando buscar de novo posições alcançadas por ordens de jogadas diferentes.
+
+    A tabela pode ser compartilhada entre threads: cada entrada é uma tupla imutável trocada por inteiro,
+    então uma consulta, feita sem trava, vê a entrada antiga ou a nova, nunca uma mistura das duas. As
+    escritas passam por uma trava, porque o descarte da entrada mais antiga percorre o dicionário, o que
+    falharia se outra thread inserisse uma entrada no meio. Cada thread usa a sua própria vista (ver
+    `view`), com as mesmas entradas, a mesma trava e contadores próprios.
+
+    Atributos:
+        max_size (int): Número máximo de entradas; as mais antigas são descartadas ao atingir o limite.
+        hits (int): Consultas que encontraram uma entrada.
+        misses (int): Consultas que não encontraram entrada.
+        cutoffs (int): Consultas cuja entrada resolveu o nó sem precisar buscar.
+    """
+
+    def __init__(self, max_size=100000):
+        """
+        Inicializa a tabela vazia.
+
+        Args:
+            max_size (int): Número máximo de entradas guardadas.
+        """
+        self.max_size = max_size
+        self.table = {}
+        self.lock = threading.Lock()  # Protege as escritas em `table`
+        self.hits = 0
+        self.misses = 0
+        self.cutoffs = 0
+
+    def __len__(self):
+        return len(self.table)
+
+    def view(self):
+        """
+        Cria uma vista da tabela para outra thread: as entradas são as mesmas, e os contadores são
+        próprios, para que uma thread não zere nem misture os contadores das outras.
+
+        Returns:
+            TranspositionTable: A vista, com os contadores zerados.
+        """
+        view = TranspositionTable(self.max_size)
+        view.table = self.table
+        view.lock = self.lock
+        return view
+
+    def lookup(self, key):
+        """
+        Procura a entrada de uma posição e atualiza os contadores de acerto e erro.
+
+        Args:
+            key (hashable): A chave da posição (tabuleiro e jogador da vez).
+
+        Returns:
+            TTEntry: A entrada encontrada, ou None se a posição não estiver na tabela.
+        """
+        entry = self.table.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def store(self, key, score, move, depth, flag):
+        """
+        Guarda o resultado da busca de uma posição, descartando a entrada mais antiga se a tabela estiver cheia.
+
+        Args:
+            key (hashable): A chave da posição (tabuleiro e jogador da vez).
+            score (float): O score encontrado para a posição.
+            move (int): O melhor movimento encontrado.
+            depth (float): A profundidade restante com que a posição foi buscada.
+            flag (int): EXACT, LOWER ou UPPER.
+        """
+        if self.max_size <= 0:
+            return
+        with self.lock:
+            if key not in self.table and len(self.table) >= self.max_size:
+                del self.table[next(iter(self.table))]
+            self.table[key] = TTEntry(score, move, depth, flag)
+
+    def clear(self):
+        """
+        Remove todas as entradas e zera os contadores.
+        """
+        with self.lock:
+            self.table.clear()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        Zera os contadores de acertos, erros e cortes sem apagar as entradas.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.cutoffs = 0